@@ -1,3 +1,30 @@
 from __future__ import annotations
 
+from typing import Any
+
+import pytest
+
 from tests.conftest import *  # noqa
+
+
+def pytest_addoption(parser: Any) -> None:
+    parser.addoption(
+        "--scaling",
+        action="store_true",
+        help="Run the scaling benchmarks, which take a long time",
+    )
+
+
+def pytest_configure(config: Any) -> None:
+    config.addinivalue_line(
+        "markers", "scaling: benchmarks across a grid of scenes (needs --scaling)"
+    )
+
+
+def pytest_collection_modifyitems(config: Any, items: list[pytest.Item]) -> None:
+    if config.getoption("--scaling"):
+        return
+    skip_scaling = pytest.mark.skip(reason="Scaling benchmarks need --scaling")
+    for item in items:
+        if "scaling" in item.keywords:
+            item.add_marker(skip_scaling)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.mixins import CoarseToFineDetectionMixin
+from zoloto.marker_type import MarkerType
+
+
+class CoarseToFineMarkerCamera(CoarseToFineDetectionMixin, MarkerCamera):
+    pass
+
+
+@pytest.mark.parametrize("detection_scale", [1, 0.5, 0.25])
+def test_coarse_to_fine_detection(benchmark: Any, detection_scale: float) -> None:
+    camera = CoarseToFineMarkerCamera(25, 1000, marker_type=MarkerType.ARUCO_6X6)
+    camera.detection_scale = detection_scale
+    frame = camera.capture_frame()
+    _, expected_corners = MarkerCamera(
+        25, 1000, marker_type=MarkerType.ARUCO_6X6
+    )._get_ids_and_corners(frame)
+
+    _, corners = benchmark(camera._get_ids_and_corners, frame)
+
+    # Record accuracy alongside speed, as the mean corner error in pixels
+    benchmark.extra_info["mean_corner_error"] = float(
+        np.linalg.norm(np.array(corners) - np.array(expected_corners), axis=-1).mean()
+    )
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from zoloto.coords import Orientation, rvecs_to_yaw_pitch_roll
+
+RVECS = np.random.default_rng(0).uniform(-3, 3, (100, 3))
+
+
+def test_orientation_yaw_pitch_roll(benchmark: Callable) -> None:
+    benchmark(lambda: [Orientation(*rvec).yaw_pitch_roll for rvec in RVECS])
+
+
+def test_vectorised_yaw_pitch_roll(benchmark: Callable) -> None:
+    benchmark(rvecs_to_yaw_pitch_roll, RVECS)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import cv2
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.detection import MultiDictionaryDetector
+from zoloto.marker_type import MarkerType
+
+
+@pytest.fixture(scope="module")
+def mixed_marker_frame() -> NDArray:
+    return cv2.cvtColor(
+        np.hstack(
+            [
+                MarkerCamera(
+                    marker_type.max_id // 2, 120, marker_type=marker_type
+                ).capture_frame()
+                for marker_type in MarkerType
+            ]
+        ),
+        cv2.COLOR_GRAY2BGR,
+    )
+
+
+def test_detect_each_dictionary(
+    benchmark: Callable, mixed_marker_frame: NDArray
+) -> None:
+    detector_params = MultiDictionaryDetector().detector_params
+    benchmark(
+        lambda: [
+            cv2.aruco.detectMarkers(
+                mixed_marker_frame, marker_type.dictionary, parameters=detector_params
+            )
+            for marker_type in MarkerType
+        ]
+    )
+
+
+def test_detect_multi_dictionary(
+    benchmark: Callable, mixed_marker_frame: NDArray
+) -> None:
+    detector = MultiDictionaryDetector()
+    benchmark(detector.detect, mixed_marker_frame)
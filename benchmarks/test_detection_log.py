@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from tests.conftest import MultiMarkerCamera
+from zoloto.detection_log import DetectionLog, DetectionLogWriter
+
+# Roughly a day of detections at 1 frame per second
+FRAME_COUNT = 86400
+
+
+def _write_log(path: Path, camera: MultiMarkerCamera) -> None:
+    batch = camera.process_frame_batch()
+    with DetectionLogWriter(path) as writer:
+        for frame_index in range(FRAME_COUNT):
+            writer.write_batch(frame_index, batch, timestamp=frame_index)
+
+
+def test_write_batches(
+    benchmark: Callable, multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        benchmark(writer.write_batch, 0, batch, timestamp=0)
+
+
+def test_load_and_filter(
+    benchmark: Callable, multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    _write_log(tmp_path, multi_marker_camera)
+
+    def load_and_filter() -> np.ndarray:
+        log = DetectionLog(tmp_path)
+        return log.tvecs[log.ids == 7]
+
+    assert len(benchmark(load_and_filter)) == FRAME_COUNT
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MarkerType
+
+
+@pytest.mark.parametrize("profile", list(DetectorProfile))
+def test_get_visible_markers(benchmark: Callable, profile: DetectorProfile) -> None:
+    camera = MarkerCamera(
+        25, 200, marker_type=MarkerType.APRILTAG_36H11, detector_profile=profile
+    )
+    frame = camera.capture_frame()
+    benchmark(camera.get_visible_markers, frame=frame)
@@ -16,6 +16,20 @@ def test_process_frame(benchmark: Callable, marker_camera: MarkerCamera) -> None
     benchmark(lambda: list(marker_camera.process_frame(frame=frame)))
 
 
+def test_process_frame_with_pose(
+    benchmark: Callable, marker_camera: MarkerCamera
+) -> None:
+    frame = marker_camera.capture_frame()
+    benchmark(
+        lambda: [marker.distance for marker in marker_camera.process_frame(frame=frame)]
+    )
+
+
+def test_process_frame_batch(benchmark: Callable, marker_camera: MarkerCamera) -> None:
+    frame = marker_camera.capture_frame()
+    benchmark(lambda: marker_camera.process_frame_batch(frame=frame).distances)
+
+
 def test_capture_frame(benchmark: Callable, marker_camera: MarkerCamera) -> None:
     benchmark(marker_camera.capture_frame)
 
@@ -35,3 +49,16 @@ def test_save_frame_with_annotation(
     benchmark: Callable, marker_camera: MarkerCamera, temp_image_file: Path
 ) -> None:
     benchmark(marker_camera.save_frame, temp_image_file, annotate=True)
+
+
+def test_annotate_and_process_frame(
+    benchmark: Callable, marker_camera: MarkerCamera
+) -> None:
+    frame = marker_camera.capture_frame()
+
+    def annotate_and_process_frame() -> None:
+        detection = marker_camera.detect(frame=frame.copy())
+        marker_camera._annotate_frame(detection.frame, detection=detection)
+        list(marker_camera.process_frame(detection=detection))
+
+    benchmark(annotate_and_process_frame)
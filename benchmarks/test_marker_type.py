@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.marker_type import MarkerType
+
+
+def test_marker_type_metadata(benchmark: Callable) -> None:
+    benchmark(
+        lambda: [
+            (marker_type.max_id, marker_type.min_marker_image_size)
+            for marker_type in MarkerType
+        ]
+    )
+
+
+def test_create_marker_camera(benchmark: Callable) -> None:
+    benchmark(MarkerCamera, 25, 100, marker_type=MarkerType.APRILTAG_36H11)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from zoloto.cameras.mixins import MotionGatedDetectionMixin
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.marker_type import MarkerType
+
+
+class MotionGatedSyntheticCamera(MotionGatedDetectionMixin, SyntheticSceneCamera):
+    pass
+
+
+@pytest.mark.parametrize("gated", [False, True], ids=["ungated", "gated"])
+def test_static_scene(benchmark: Any, gated: bool) -> None:
+    camera_class = MotionGatedSyntheticCamera if gated else SyntheticSceneCamera
+    camera = camera_class(
+        marker_type=MarkerType.ARUCO_6X6, marker_count=20, resolution=(1920, 1080)
+    )
+    frame, _ = camera.render_scene(0)
+    camera.detect(frame=frame)
+    # The same scene, with fresh sensor noise
+    noise = np.random.default_rng(0).normal(scale=3, size=frame.shape)
+    next_frame = np.clip(frame + noise, 0, 255).astype(np.uint8)
+
+    detection = benchmark(camera.detect, frame=next_frame)
+    benchmark.extra_info["reused"] = detection.reused
+
+
+def test_motion_thumbnail(benchmark: Any) -> None:
+    camera = MotionGatedSyntheticCamera(
+        marker_type=MarkerType.ARUCO_6X6, resolution=(1920, 1080)
+    )
+    benchmark(camera._get_motion_thumbnail, camera.capture_frame())
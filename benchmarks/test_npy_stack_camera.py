@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from zoloto.cameras.file import NpyStackCamera, convert_to_frame_stack
+from zoloto.marker_type import MarkerType
+
+
+@pytest.fixture
+def npy_stack_camera(numbered_video_file: Path, tmp_path: Path) -> NpyStackCamera:
+    stack_path = tmp_path / "frames.npy"
+    convert_to_frame_stack(Path(numbered_video_file), stack_path)
+    return NpyStackCamera(stack_path, marker_type=MarkerType.ARUCO_6X6)
+
+
+def test_read_frames(benchmark: Callable, npy_stack_camera: NpyStackCamera) -> None:
+    def read_frames() -> None:
+        npy_stack_camera.seek(0)
+        for _ in npy_stack_camera:
+            pass
+
+    benchmark(read_frames)
+
+
+def test_detect_frames(benchmark: Callable, npy_stack_camera: NpyStackCamera) -> None:
+    benchmark(
+        lambda: [
+            npy_stack_camera.get_visible_markers(frame=frame)
+            for frame in npy_stack_camera.frames
+        ]
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.marker_type import MarkerType
+from zoloto.pipeline import DetectionPipeline
+
+FRAME_COUNT = 64
+
+
+@pytest.fixture
+def frames() -> list:
+    return [
+        MarkerCamera(
+            marker_id, marker_size=400, marker_type=MarkerType.ARUCO_6X6
+        ).capture_frame()
+        for marker_id in range(FRAME_COUNT)
+    ]
+
+
+def record_frames_per_second(benchmark: Any) -> None:
+    if benchmark.stats is None:
+        # Benchmarking is disabled
+        return
+    benchmark.extra_info["frames_per_second"] = FRAME_COUNT / benchmark.stats.stats.mean
+
+
+def test_serial_detection(
+    benchmark: Any, marker_camera: MarkerCamera, frames: list
+) -> None:
+    benchmark(lambda: [list(marker_camera.process_frame(frame=f)) for f in frames])
+    record_frames_per_second(benchmark)
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+@pytest.mark.parametrize("workers", [2, 4])
+def test_pipeline_detection(
+    benchmark: Any,
+    marker_camera: MarkerCamera,
+    frames: list,
+    workers: int,
+    shared_memory: bool,
+) -> None:
+    with DetectionPipeline(
+        marker_camera, workers=workers, shared_memory=shared_memory
+    ) as pipeline:
+        benchmark(lambda: list(pipeline.process_frames(frames)))
+    record_frames_per_second(benchmark)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tests.conftest import MultiMarkerCamera
+from zoloto.calibration import CalibrationParameters
+from zoloto.pose import PoseCache, estimate_poses
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_static_markers(
+    benchmark: Any,
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+    cached: bool,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    sizes = [200] * len(ids)
+    if not cached:
+        benchmark(estimate_poses, corners, sizes, fake_calibration_params)
+        return
+    pose_cache = PoseCache()
+    pose_cache.estimate_poses(ids, corners, sizes, fake_calibration_params)
+    benchmark(pose_cache.estimate_poses, ids, corners, sizes, fake_calibration_params)
+
+
+def test_moving_markers(
+    benchmark: Any,
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    sizes = [200] * len(ids)
+    moved_corners = [marker_corners + 2 for marker_corners in corners]
+    pose_cache = PoseCache()
+
+    def refine_poses() -> None:
+        # Alternate between positions, so every marker is refined every time
+        pose_cache.estimate_poses(ids, corners, sizes, fake_calibration_params)
+        pose_cache.estimate_poses(ids, moved_corners, sizes, fake_calibration_params)
+
+    refine_poses()
+    benchmark(refine_poses)
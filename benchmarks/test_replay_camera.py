@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from tests.conftest import MultiMarkerCamera
+from zoloto.cameras.replay import ReplayCamera
+from zoloto.detection_log import DetectionLogWriter
+from zoloto.marker_type import MarkerType
+
+FRAME_COUNT = 1000
+
+
+@pytest.fixture
+def detection_log(multi_marker_camera: MultiMarkerCamera, tmp_path: Path) -> Path:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        for frame_index in range(FRAME_COUNT):
+            writer.write_batch(frame_index, batch, timestamp=frame_index)
+    return tmp_path
+
+
+def test_replay_eager(benchmark: Callable, detection_log: Path) -> None:
+    def replay() -> None:
+        camera = ReplayCamera(detection_log, marker_type=MarkerType.ARUCO_6X6)
+        for frame in camera:
+            list(camera.process_frame_eager(frame=frame))
+
+    benchmark(replay)
@@ -0,0 +1,121 @@
+"""
+Benchmarks across a grid of resolutions, marker counts and marker types.
+
+These take a long time, so only run with `--scaling` (see
+`scripts/benchmark-scaling.sh`). Each result records its scene in
+`extra_info`, so saved JSON can be compared between runs.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pytest
+from numpy.typing import NDArray
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.marker_type import MarkerType
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080), (3840, 2160)]
+
+MARKER_COUNTS = [1, 10, 50, 200]
+
+# Annotating modifies the frame, so each round needs a fresh copy
+ANNOTATE_ROUNDS = 20
+
+pytestmark = [
+    pytest.mark.scaling,
+    pytest.mark.parametrize("marker_type", MarkerType, ids=lambda t: t.name),
+    pytest.mark.parametrize(
+        "resolution", RESOLUTIONS, ids=lambda r: "{}x{}".format(*r)
+    ),
+    pytest.mark.parametrize("marker_count", MARKER_COUNTS, ids="{}-markers".format),
+]
+
+
+@lru_cache(maxsize=1)
+def get_scene(
+    marker_type: MarkerType, resolution: tuple[int, int], marker_count: int
+) -> tuple[SyntheticSceneCamera, NDArray]:
+    camera = SyntheticSceneCamera(
+        marker_type=marker_type,
+        marker_count=marker_count,
+        resolution=resolution,
+        cache_size=1,
+    )
+    return camera, camera.capture_frame()
+
+
+def setup_benchmark(
+    benchmark: BenchmarkFixture,
+    operation: str,
+    marker_type: MarkerType,
+    resolution: tuple[int, int],
+    marker_count: int,
+) -> tuple[SyntheticSceneCamera, NDArray]:
+    camera, frame = get_scene(marker_type, resolution, marker_count)
+    width, height = resolution
+    benchmark.group = f"{operation} {width}x{height}"
+    benchmark.extra_info.update(
+        {
+            "operation": operation,
+            "marker_type": marker_type.name,
+            "width": width,
+            "height": height,
+            "marker_count": marker_count,
+            "detected_count": len(camera.get_visible_markers(frame=frame)),
+        }
+    )
+    return camera, frame
+
+
+def test_process_frame(
+    benchmark: BenchmarkFixture,
+    marker_type: MarkerType,
+    resolution: tuple[int, int],
+    marker_count: int,
+) -> None:
+    camera, frame = setup_benchmark(
+        benchmark, "process_frame", marker_type, resolution, marker_count
+    )
+    benchmark(lambda: list(camera.process_frame(frame=frame)))
+
+
+def test_process_frame_eager(
+    benchmark: BenchmarkFixture,
+    marker_type: MarkerType,
+    resolution: tuple[int, int],
+    marker_count: int,
+) -> None:
+    camera, frame = setup_benchmark(
+        benchmark, "process_frame_eager", marker_type, resolution, marker_count
+    )
+    benchmark(lambda: list(camera.process_frame_eager(frame=frame)))
+
+
+def test_get_visible_markers(
+    benchmark: BenchmarkFixture,
+    marker_type: MarkerType,
+    resolution: tuple[int, int],
+    marker_count: int,
+) -> None:
+    camera, frame = setup_benchmark(
+        benchmark, "get_visible_markers", marker_type, resolution, marker_count
+    )
+    benchmark(camera.get_visible_markers, frame=frame)
+
+
+def test_annotate_frame(
+    benchmark: BenchmarkFixture,
+    marker_type: MarkerType,
+    resolution: tuple[int, int],
+    marker_count: int,
+) -> None:
+    camera, frame = setup_benchmark(
+        benchmark, "annotate_frame", marker_type, resolution, marker_count
+    )
+    benchmark.pedantic(
+        camera._annotate_frame,
+        setup=lambda: ((frame.copy(),), {}),
+        rounds=ANNOTATE_ROUNDS,
+    )
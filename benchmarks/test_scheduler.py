@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Callable
+
+import pytest
+
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.marker_type import MarkerType
+from zoloto.scheduler import FrameScheduler
+
+FRAME_COUNT = 16
+
+
+@pytest.fixture
+def synthetic_camera() -> SyntheticSceneCamera:
+    return SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_count=10,
+        resolution=(640, 480),
+        cache_size=FRAME_COUNT,
+    )
+
+
+def test_process_frames(
+    benchmark: Callable, synthetic_camera: SyntheticSceneCamera
+) -> None:
+    benchmark(
+        lambda: [
+            list(synthetic_camera.process_frame(frame=frame))
+            for frame in islice(synthetic_camera, FRAME_COUNT)
+        ]
+    )
+
+
+def test_scheduled_process_frames(
+    benchmark: Callable, synthetic_camera: SyntheticSceneCamera
+) -> None:
+    # A generous budget, so every frame is processed and only the overhead of
+    # scheduling is measured
+    benchmark(
+        lambda: list(
+            islice(
+                FrameScheduler(synthetic_camera, latency_budget=60, max_stride=1),
+                FRAME_COUNT,
+            )
+        )
+    )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from tests.conftest import MultiMarkerCamera
+from zoloto.stats import CameraStats, LatencyHistogram
+
+
+@pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+def test_process_frame(
+    benchmark: Callable, multi_marker_camera: MultiMarkerCamera, enabled: bool
+) -> None:
+    if enabled:
+        multi_marker_camera.enable_stats()
+    frame = multi_marker_camera.capture_frame()
+    benchmark(
+        lambda: [
+            marker.distance for marker in multi_marker_camera.process_frame(frame=frame)
+        ]
+    )
+
+
+@pytest.mark.parametrize("enabled", [False, True], ids=["disabled", "enabled"])
+def test_process_frame_eager(
+    benchmark: Callable, multi_marker_camera: MultiMarkerCamera, enabled: bool
+) -> None:
+    if enabled:
+        multi_marker_camera.enable_stats()
+    frame = multi_marker_camera.capture_frame()
+    benchmark(lambda: list(multi_marker_camera.process_frame_eager(frame=frame)))
+
+
+def test_record(benchmark: Callable) -> None:
+    stats = CameraStats()
+    benchmark(stats.record, "detect", 0.001, 4)
+
+
+def test_as_dict(benchmark: Callable) -> None:
+    stats = CameraStats()
+    for _ in range(stats.window):
+        stats.record("detect", 0.001, 4)
+    benchmark(stats.as_dict)
+
+
+def test_record_latency(benchmark: Callable) -> None:
+    histogram = LatencyHistogram()
+    benchmark(histogram.record, 0.015)
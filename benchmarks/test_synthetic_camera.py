@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.marker_type import MarkerType
+
+
+@pytest.fixture
+def synthetic_camera() -> SyntheticSceneCamera:
+    return SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6, marker_count=50, resolution=(1920, 1080)
+    )
+
+
+def test_render_scene(
+    benchmark: Callable, synthetic_camera: SyntheticSceneCamera
+) -> None:
+    benchmark(synthetic_camera.capture_frame)
+
+
+def test_render_cached_scene(benchmark: Callable) -> None:
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_count=50,
+        resolution=(1920, 1080),
+        cache_size=4,
+    )
+    benchmark(camera.capture_frame)
+
+
+def test_process_dense_scene(
+    benchmark: Callable, synthetic_camera: SyntheticSceneCamera
+) -> None:
+    frame = synthetic_camera.capture_frame()
+    benchmark(lambda: list(synthetic_camera.process_frame_eager(frame=frame)))
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from tests.conftest import MultiMarkerCamera
+from zoloto.cameras.mixins import TrackingCameraMixin
+from zoloto.marker_type import MarkerType
+
+
+class TrackingMultiMarkerCamera(
+    TrackingCameraMixin, MultiMarkerCamera  # type: ignore[misc]
+):
+    roi_padding = 0.2
+
+
+def test_full_frame_detection(
+    benchmark: Callable, multi_marker_camera: MultiMarkerCamera
+) -> None:
+    frame = multi_marker_camera.capture_frame()
+    benchmark(multi_marker_camera.get_visible_markers, frame=frame)
+
+
+def test_tracked_detection(benchmark: Callable) -> None:
+    camera = TrackingMultiMarkerCamera(0, 100, marker_type=MarkerType.ARUCO_6X6)
+    frame = camera.capture_frame()
+    benchmark(camera.get_visible_markers, frame=frame)
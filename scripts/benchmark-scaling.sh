@@ -0,0 +1,13 @@
+#!/usr/bin/env bash
+
+# Benchmark detection across resolutions, marker counts and marker types.
+#
+# Results are saved as JSON in .benchmarks/. To check for regressions, compare
+# against a saved run, eg:
+#   ./scripts/benchmark-scaling.sh --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+
+set -e
+
+export PATH=env/bin:${PATH}
+
+pytest --verbose --scaling --benchmark-autosave --benchmark-sort=fullname --benchmark-columns=min,max,mean,stddev,ops --benchmark-group-by=group benchmarks/test_scaling.py $@
@@ -11,13 +11,44 @@ CAP_PROP_FPS: int
 CAP_PROP_FRAME_WIDTH: int
 CAP_PROP_FRAME_HEIGHT: int
 CAP_PROP_FRAME_COUNT: int
+CAP_PROP_POS_FRAMES: int
+CAP_PROP_POS_MSEC: int
 
 FILE_STORAGE_READ: int
 
 BORDER_CONSTANT: int
 
+COLOR_GRAY2BGR: int
+COLOR_BGR2GRAY: int
+
+INTER_AREA: int
+INTER_LINEAR: int
+INTER_NEAREST: int
+
+THRESH_BINARY: int
+THRESH_OTSU: int
+
+TERM_CRITERIA_EPS: int
+TERM_CRITERIA_MAX_ITER: int
+SOLVEPNP_ITERATIVE: int
+
 class aruco_DetectorParameters:
+    adaptiveThreshWinSizeMin: int
+    adaptiveThreshWinSizeMax: int
+    adaptiveThreshWinSizeStep: int
+    minMarkerPerimeterRate: float
+    polygonalApproxAccuracyRate: float
     minMarkerDistanceRate: float
+    markerBorderBits: int
+    minOtsuStdDev: float
+    perspectiveRemovePixelPerCell: int
+    perspectiveRemoveIgnoredMarginPerCell: float
+    maxErroneousBitsInBorderRate: float
+    errorCorrectionRate: float
+    cornerRefinementMethod: int
+    cornerRefinementWinSize: int
+    cornerRefinementMaxIterations: int
+    cornerRefinementMinAccuracy: float
 
 class FileNode:
     def mat(self) -> NDArray: ...
@@ -34,6 +65,7 @@ class VideoCapture:
     def __init__(self, camera_id: Union[int, str]) -> None: ...
     def isOpened(self) -> bool: ...
     def read(self) -> Tuple[bool, NDArray]: ...
+    def grab(self) -> bool: ...
     def release(self) -> None: ...
     def set(self, property: int, value: int) -> None: ...
     def get(self, property: int) -> float: ...
@@ -55,8 +87,56 @@ class VideoWriter:
 class aruco_Dictionary:
     bytesList: NDArray
     markerSize: int
+    maxCorrectionBits: int
 
 def imread(path: str) -> NDArray: ...
+def cvtColor(src: NDArray, code: int) -> NDArray: ...
+def resize(
+    src: NDArray,
+    dsize: Optional[Tuple[int, int]],
+    fx: float = 0,
+    fy: float = 0,
+    interpolation: int = ...,
+) -> NDArray: ...
+def cornerSubPix(
+    image: NDArray,
+    corners: NDArray,
+    winSize: Tuple[int, int],
+    zeroZone: Tuple[int, int],
+    criteria: Tuple[int, int, float],
+) -> NDArray: ...
+def getPerspectiveTransform(src: NDArray, dst: NDArray) -> NDArray: ...
+def warpPerspective(
+    src: NDArray,
+    M: NDArray,
+    dsize: Tuple[int, int],
+    flags: int = ...,
+    borderMode: int = ...,
+    borderValue: float = ...,
+) -> NDArray: ...
+def perspectiveTransform(src: NDArray, m: NDArray) -> NDArray: ...
+def solvePnP(
+    objectPoints: NDArray,
+    imagePoints: NDArray,
+    cameraMatrix: NDArray,
+    distCoeffs: NDArray,
+    rvec: Optional[NDArray] = ...,
+    tvec: Optional[NDArray] = ...,
+    useExtrinsicGuess: bool = ...,
+    flags: int = ...,
+) -> Tuple[bool, NDArray, NDArray]: ...
+def projectPoints(
+    objectPoints: NDArray,
+    rvec: NDArray,
+    tvec: NDArray,
+    cameraMatrix: NDArray,
+    distCoeffs: NDArray,
+) -> Tuple[NDArray, NDArray]: ...
+def GaussianBlur(src: NDArray, ksize: Tuple[int, int], sigmaX: float) -> NDArray: ...
+def meanStdDev(src: NDArray) -> Tuple[NDArray, NDArray]: ...
+def threshold(
+    src: NDArray, thresh: float, maxval: float, type: int
+) -> Tuple[float, NDArray]: ...
 def copyMakeBorder(
     src: NDArray,
     top: int,
@@ -69,8 +149,9 @@ def copyMakeBorder(
 def imshow(winname: str, mat: NDArray) -> None: ...
 def imwrite(filename: str, mat: NDArray) -> None: ...
 def waitKey(delay: int) -> int: ...
-
-# Note that this is not the only signature of Rodrigues, but it is the only one we use.
-def Rodrigues(vector: Tuple[float, float, float]) -> Tuple[NDArray, NDArray]: ...
+def setNumThreads(nthreads: int) -> None: ...
+def Rodrigues(
+    src: Union[Tuple[float, float, float], NDArray]
+) -> Tuple[NDArray, NDArray]: ...
 
 class error(Exception): ...
@@ -2,7 +2,7 @@
 Type stubs for cv2.aruco.
 Note that stubs are only written for the parts that we use.
 """
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Sequence, Tuple, Union
 
 from cv2 import aruco_DetectorParameters, aruco_Dictionary
 from numpy import array
@@ -34,6 +34,10 @@ DICT_APRILTAG_25H9: int
 DICT_APRILTAG_36H10: int
 DICT_APRILTAG_36H11: int
 
+CORNER_REFINE_NONE: int
+CORNER_REFINE_SUBPIX: int
+
+def Dictionary_getByteListFromBits(bits: NDArray) -> NDArray: ...
 def getPredefinedDictionary(dictionary: int) -> aruco_Dictionary: ...
 def CharucoBoard_create(
     squaresX: int,
@@ -68,8 +72,8 @@ def calibrateCameraCharuco(
 ) -> Tuple[int, NDArray, NDArray, NDArray, NDArray]: ...
 def drawDetectedMarkers(
     image: NDArray,
-    corners: NDArray,
-    ids: NDArray = __empty_ndarray,
+    corners: Union[NDArray, Sequence[NDArray]],
+    ids: Optional[NDArray] = __empty_ndarray,
     borderColor: NDArray = __empty_ndarray,
 ) -> NDArray: ...
 def drawMarker(
@@ -10,8 +10,12 @@ class Quaternion:
     @overload
     def __init__(self, *, matrix: NDArray) -> None: ...
     @overload
+    def __init__(self, *, array: NDArray) -> None: ...
+    @overload
     def __init__(self, *, axis: Tuple[float, float, float], scalar: float) -> None: ...
     @property
+    def q(self) -> NDArray: ...
+    @property
     def rotation_matrix(self) -> NDArray: ...
     @property
     def vector(self) -> NDArray: ...
@@ -5,8 +5,11 @@ from pathlib import Path
 from tempfile import mkstemp
 from typing import Any, Callable
 
+import cv2
+import numpy as np
 import pytest
 from hypothesis import settings as hypothesis_settings
+from numpy.typing import NDArray
 
 from zoloto.calibration import CalibrationParameters, get_fake_calibration_parameters
 from zoloto.cameras.marker import MarkerCamera
@@ -18,6 +21,30 @@ hypothesis_settings.load_profile("main")
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
+VIDEO_FRAME_COUNT = 10
+NUMBERED_VIDEO_FRAME_COUNT = 23
+
+MULTI_MARKER_IDS = [2, 7, 10, 15]
+
+
+class MultiMarkerCamera(MarkerCamera):
+    """
+    A camera which shows a row of markers, with alternating sizes
+    """
+
+    def get_marker_size(self, marker_id: int) -> int:
+        return 100 if marker_id % 2 else 200
+
+    def capture_frame(self) -> NDArray:
+        return np.hstack(
+            [
+                MarkerCamera(
+                    marker_id, marker_size=100, marker_type=self.marker_type
+                ).capture_frame()
+                for marker_id in MULTI_MARKER_IDS
+            ]
+        )
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -48,6 +75,47 @@ def temp_image_file(make_temp_file: Callable[[str], Path]) -> Path:
     return make_temp_file(".png")
 
 
+@pytest.fixture
+def temp_video_file(make_temp_file: Callable[[str], Path]) -> Path:
+    """
+    A short video, where each frame contains a single marker.
+    """
+    video_file = make_temp_file(".avi")
+    marker_camera = MarkerCamera(25, marker_size=200, marker_type=MarkerType.ARUCO_6X6)
+    frame = cv2.cvtColor(marker_camera.capture_frame(), cv2.COLOR_GRAY2BGR)
+    height, width = frame.shape[:2]
+    writer = cv2.VideoWriter(
+        str(video_file), cv2.VideoWriter_fourcc(*"MJPG"), 30, [width, height]
+    )
+    for _ in range(VIDEO_FRAME_COUNT):
+        writer.write(frame)
+    writer.release()
+    return video_file
+
+
+@pytest.fixture
+def numbered_video_file(make_temp_file: Callable[[str], Path]) -> Path:
+    """
+    A video where each frame contains a marker with the same id as the frame's index.
+    """
+    video_file = make_temp_file(".avi")
+    writer = None
+    for frame_index in range(NUMBERED_VIDEO_FRAME_COUNT):
+        marker_camera = MarkerCamera(
+            frame_index, marker_size=100, marker_type=MarkerType.ARUCO_6X6
+        )
+        frame = cv2.cvtColor(marker_camera.capture_frame(), cv2.COLOR_GRAY2BGR)
+        if writer is None:
+            height, width = frame.shape[:2]
+            writer = cv2.VideoWriter(
+                str(video_file), cv2.VideoWriter_fourcc(*"MJPG"), 30, [width, height]
+            )
+        writer.write(frame)
+    if writer is not None:
+        writer.release()
+    return video_file
+
+
 @pytest.fixture
 def marker_camera() -> MarkerCamera:
     return MarkerCamera(25, marker_size=200, marker_type=MarkerType.ARUCO_6X6)
@@ -61,3 +129,8 @@ def marker(marker_camera: MarkerCamera) -> BaseMarker:
 @pytest.fixture
 def fake_calibration_params() -> CalibrationParameters:
     return get_fake_calibration_parameters()
+
+
+@pytest.fixture
+def multi_marker_camera() -> MultiMarkerCamera:
+    return MultiMarkerCamera(0, 100, marker_type=MarkerType.ARUCO_6X6)
@@ -4,6 +4,7 @@ import warnings
 from itertools import cycle
 from pathlib import Path
 
+import numpy as np
 import pytest
 from cv2 import CAP_PROP_FRAME_HEIGHT, CAP_PROP_FRAME_WIDTH
 from hypothesis import given
@@ -151,3 +152,18 @@ def test_different_resolution_to_calibration_for_snapshot_camera(
     )
     with pytest.raises(ValueError):
         camera.get_video_capture(camera.camera_id)
+
+
+def test_threaded_capture_returns_newest_frame(mocker: MockerFixture) -> None:
+    VideoCapture = mocker.patch("zoloto.cameras.camera.VideoCapture")
+    frames = iter(range(1, 1000))
+    VideoCapture.return_value.read.side_effect = lambda: (
+        True,
+        np.full((1, 1), next(frames)),
+    )
+    camera = zoloto.cameras.Camera(0, marker_type=MarkerType.ARUCO_6X6, threaded=True)
+    first_frame = camera.capture_frame()
+    second_frame = camera.capture_frame()
+    camera.close()
+    assert second_frame[0][0] > first_frame[0][0]
+    assert camera._capture_thread is None
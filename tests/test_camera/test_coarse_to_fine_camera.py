@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+from hypothesis import given
+
+from tests.strategies import marker_types
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.mixins import CoarseToFineDetectionMixin
+from zoloto.marker_type import MarkerType
+
+
+class CoarseToFineMarkerCamera(CoarseToFineDetectionMixin, MarkerCamera):
+    pass
+
+
+@pytest.mark.parametrize("detection_scale", [1, 0.5, 0.25])
+@given(marker_types())
+def test_matches_full_resolution(
+    detection_scale: float, marker_type: MarkerType
+) -> None:
+    camera = CoarseToFineMarkerCamera(25, 400, marker_type=marker_type)
+    camera.detection_scale = detection_scale
+    frame = camera.capture_frame()
+    ids, corners = camera._get_ids_and_corners(frame)
+    expected_ids, expected_corners = MarkerCamera(
+        25, 400, marker_type=marker_type
+    )._get_ids_and_corners(frame)
+    assert ids == expected_ids
+    np.testing.assert_allclose(corners, expected_corners, atol=1)
+
+
+def test_colour_frames() -> None:
+    camera = CoarseToFineMarkerCamera(25, 400, marker_type=MarkerType.ARUCO_6X6)
+    frame = cv2.cvtColor(camera.capture_frame(), cv2.COLOR_GRAY2BGR)
+    marker = next(camera.process_frame(frame=frame))
+    assert marker.id == 25
+    assert len(marker.pixel_corners) == 4
+
+
+def test_no_markers() -> None:
+    camera = CoarseToFineMarkerCamera(25, 400, marker_type=MarkerType.ARUCO_6X6)
+    frame = np.full((400, 400), 255, dtype=np.uint8)
+    assert camera.get_visible_markers(frame=frame) == []
+
+
+@pytest.mark.parametrize("detection_scale", [0, -1, 1.5])
+def test_invalid_scale(detection_scale: float) -> None:
+    camera = CoarseToFineMarkerCamera(25, 400, marker_type=MarkerType.ARUCO_6X6)
+    camera.detection_scale = detection_scale
+    with pytest.raises(ValueError):
+        camera.get_visible_markers()
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 from hypothesis import given
+from pytest_mock.plugin import MockerFixture
 
 from tests.strategies import marker_ids, marker_types, reasonable_image_size
 from zoloto.cameras.file import ImageFileCamera
@@ -181,5 +182,36 @@ def test_detect_at_minimum_size(marker_type: MarkerType) -> None:
     assert marker.id == 0
 
 
+def test_reuse_detection(
+    marker_camera: MarkerCamera, temp_image_file: Path, mocker: MockerFixture
+) -> None:
+    detection = marker_camera.detect()
+    assert detection.marker_ids is not None
+    assert detection.marker_ids.flatten().tolist() == [marker_camera.marker_id]
+
+    get_raw_ids_and_corners = mocker.spy(marker_camera, "_get_raw_ids_and_corners")
+    assert marker_camera.get_visible_markers(detection=detection) == [
+        marker_camera.marker_id
+    ]
+    marker = next(marker_camera.process_frame(detection=detection))
+    assert marker.id == marker_camera.marker_id
+    assert len(list(marker_camera.process_frame_eager(detection=detection))) == 1
+    assert len(marker_camera.process_frame_batch(detection=detection)) == 1
+    annotated_frame = marker_camera.save_frame(
+        temp_image_file, annotate=True, detection=detection
+    )
+    assert annotated_frame is detection.frame
+    get_raw_ids_and_corners.assert_not_called()
+
+
+def test_detect_frame(marker_camera: MarkerCamera) -> None:
+    frame = marker_camera.capture_frame()
+    detection = marker_camera.detect(frame=frame)
+    assert detection.frame is frame
+    assert marker_camera.get_visible_markers(detection=detection) == [
+        marker_camera.marker_id
+    ]
+
+
 def test_repr(marker_camera: MarkerCamera) -> None:
     assert str(marker_camera.marker_id) in repr(marker_camera)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.mixins import MotionGatedDetectionMixin
+from zoloto.marker_type import MarkerType
+
+
+class MotionGatedMarkerCamera(MotionGatedDetectionMixin, MarkerCamera):
+    pass
+
+
+def get_camera() -> MotionGatedMarkerCamera:
+    return MotionGatedMarkerCamera(25, 200, marker_type=MarkerType.ARUCO_6X6)
+
+
+def test_reuses_detection_for_unchanged_frames(mocker: MockerFixture) -> None:
+    camera = get_camera()
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    frame = camera.capture_frame()
+
+    first = camera.detect(frame=frame)
+    assert not first.reused
+    assert not camera.detection_reused
+    second = camera.detect(frame=frame.copy())
+    assert second.reused
+    assert camera.detection_reused
+    assert detect_markers.call_count == 1
+
+    assert second.marker_ids is not None
+    assert second.marker_ids.tolist() == [[25]]
+    assert [marker.id for marker in camera.process_frame(frame=frame)] == [25]
+    assert detect_markers.call_count == 1
+
+
+def test_ignores_noise(mocker: MockerFixture) -> None:
+    camera = get_camera()
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    frame = camera.capture_frame()
+    camera.detect(frame=frame)
+
+    noise = np.random.default_rng(0).integers(-5, 6, frame.shape)
+    noisy_frame = np.clip(frame + noise, 0, 255).astype(np.uint8)
+    assert camera.detect(frame=noisy_frame).reused
+    assert detect_markers.call_count == 1
+
+
+def test_detects_changed_frames(multi_marker_camera: MultiMarkerCamera) -> None:
+    camera = get_camera()
+    assert camera.get_visible_markers() == [25]
+    frame = multi_marker_camera.capture_frame()
+    detection = camera.detect(frame=frame)
+    assert not detection.reused
+    assert sorted(camera.get_visible_markers(detection=detection)) == MULTI_MARKER_IDS
+
+
+def test_compares_against_last_detected_frame() -> None:
+    camera = get_camera()
+    # Avoid saturating when brightening
+    frame = camera.capture_frame() // 2 + 64
+    camera.detect(frame=frame)
+    # Each frame only changes slightly from the previous one, but they add up
+    brightened_frames = [frame + brightness for brightness in range(1, 6)]
+    reused = [camera.detect(frame=f).reused for f in brightened_frames]
+    assert reused == [True, False, True, False, True]
+
+
+def test_max_reuse(mocker: MockerFixture) -> None:
+    camera = get_camera()
+    camera.max_reuse = 2
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    frame = camera.capture_frame()
+    reused = [camera.detect(frame=frame).reused for _ in range(6)]
+    assert reused == [False, True, True, False, True, True]
+    assert detect_markers.call_count == 2
+
+
+def test_reset_motion_gate() -> None:
+    camera = get_camera()
+    frame = camera.capture_frame()
+    camera.detect(frame=frame)
+    camera.reset_motion_gate()
+    assert not camera.detect(frame=frame).reused
+
+
+def test_different_frame_sizes() -> None:
+    camera = get_camera()
+    camera.detect(frame=camera.capture_frame())
+    small_camera = MotionGatedMarkerCamera(25, 100, marker_type=MarkerType.ARUCO_6X6)
+    assert not camera.detect(frame=small_camera.capture_frame()).reused
+
+
+def test_colour_frames() -> None:
+    camera = get_camera()
+    frame = cv2.cvtColor(camera.capture_frame(), cv2.COLOR_GRAY2BGR)
+    assert not camera.detect(frame=frame).reused
+    detection = camera.detect(frame=frame)
+    assert detection.reused
+    assert camera.get_visible_markers(detection=detection) == [25]
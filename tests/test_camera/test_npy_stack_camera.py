@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT
+from zoloto.cameras.file import (
+    NpyStackCamera,
+    VideoFileCamera,
+    convert_to_frame_stack,
+    write_frame_stack,
+)
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.marker_type import MarkerType
+
+
+@pytest.fixture
+def frame_stack(numbered_video_file: Path, tmp_path: Path) -> Path:
+    stack_path = tmp_path / "frames.npy"
+    convert_to_frame_stack(Path(numbered_video_file), stack_path)
+    return stack_path
+
+
+def test_converts_video(numbered_video_file: Path, frame_stack: Path) -> None:
+    frames = np.load(frame_stack)
+    with VideoFileCamera(
+        numbered_video_file, marker_type=MarkerType.ARUCO_6X6
+    ) as camera:
+        np.testing.assert_array_equal(frames, list(camera))
+
+
+def test_converts_image_directory(tmp_path: Path) -> None:
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    for marker_id in [3, 1, 2]:
+        frame = MarkerCamera(
+            marker_id, marker_size=100, marker_type=MarkerType.ARUCO_6X6
+        ).capture_frame()
+        cv2.imwrite(str(image_dir / f"{marker_id}.png"), frame)
+    (image_dir / "notes.txt").write_text("Not an image")
+
+    assert convert_to_frame_stack(image_dir, tmp_path / "frames.npy") == 3
+
+    camera = NpyStackCamera(tmp_path / "frames.npy", marker_type=MarkerType.ARUCO_6X6)
+    assert [camera.get_visible_markers(frame=frame) for frame in camera] == [
+        [1],
+        [2],
+        [3],
+    ]
+
+
+def test_write_truncates_stack(tmp_path: Path) -> None:
+    frames = [np.full((4, 6, 3), index, dtype=np.uint8) for index in range(3)]
+    stack_path = tmp_path / "frames.npy"
+    assert write_frame_stack(frames, stack_path, frame_count=5) == 3
+    np.testing.assert_array_equal(np.load(stack_path), frames)
+    assert list(tmp_path.iterdir()) == [stack_path]
+
+
+@pytest.mark.parametrize("frame_count", [0, 1, 2, 4])
+def test_write_grows_stack(tmp_path: Path, frame_count: int) -> None:
+    frames = [np.full((4, 6, 3), index, dtype=np.uint8) for index in range(5)]
+    stack_path = tmp_path / "frames.npy"
+    assert write_frame_stack(frames, stack_path, frame_count=frame_count) == 5
+    np.testing.assert_array_equal(np.load(stack_path), frames)
+    assert list(tmp_path.iterdir()) == [stack_path]
+
+
+def test_converts_video_with_low_frame_count(
+    numbered_video_file: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    class LowFrameCountVideoCapture(cv2.VideoCapture):
+        def get(self, prop_id: int) -> float:
+            if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+                return NUMBERED_VIDEO_FRAME_COUNT // 2
+            return super().get(prop_id)
+
+    mocker.patch("zoloto.cameras.file.VideoCapture", LowFrameCountVideoCapture)
+    stack_path = tmp_path / "frames.npy"
+    assert (
+        convert_to_frame_stack(Path(numbered_video_file), stack_path)
+        == NUMBERED_VIDEO_FRAME_COUNT
+    )
+    camera = NpyStackCamera(stack_path, marker_type=MarkerType.ARUCO_6X6)
+    assert [camera.get_visible_markers(frame=frame) for frame in camera] == [
+        [frame_index] for frame_index in range(NUMBERED_VIDEO_FRAME_COUNT)
+    ]
+
+
+def test_write_mismatched_frames(tmp_path: Path) -> None:
+    frames = [np.zeros((4, 6, 3)), np.zeros((4, 5, 3))]
+    with pytest.raises(ValueError):
+        write_frame_stack(frames, tmp_path / "frames.npy", frame_count=2)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_no_frames(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        write_frame_stack([], tmp_path / "frames.npy", frame_count=0)
+
+
+def test_iterates_frames(frame_stack: Path) -> None:
+    camera = NpyStackCamera(frame_stack, marker_type=MarkerType.ARUCO_6X6)
+    assert len(camera) == camera.frame_count == NUMBERED_VIDEO_FRAME_COUNT
+    assert [camera.get_visible_markers(frame=frame) for frame in camera] == [
+        [frame_index] for frame_index in range(NUMBERED_VIDEO_FRAME_COUNT)
+    ]
+    assert camera.position == NUMBERED_VIDEO_FRAME_COUNT
+
+
+def test_frames_are_views(frame_stack: Path) -> None:
+    camera = NpyStackCamera(frame_stack, marker_type=MarkerType.ARUCO_6X6)
+    frame = camera.capture_frame()
+    assert isinstance(frame, np.memmap)
+    assert np.shares_memory(frame, camera.frames)
+
+
+def test_annotating_does_not_change_stack(frame_stack: Path) -> None:
+    camera = NpyStackCamera(frame_stack, marker_type=MarkerType.ARUCO_6X6)
+    frame = camera.capture_frame()
+    original_frame = frame.copy()
+    camera._annotate_frame(frame)
+    assert not np.array_equal(frame, original_frame)
+    np.testing.assert_array_equal(np.load(frame_stack)[0], original_frame)
+
+
+def test_random_access(frame_stack: Path) -> None:
+    camera = NpyStackCamera(frame_stack, marker_type=MarkerType.ARUCO_6X6)
+    assert camera.get_visible_markers(frame=camera[7]) == [7]
+
+    camera.seek(20)
+    assert camera.get_visible_markers() == [20]
+    assert camera.position == 21
+    assert len(list(camera)) == NUMBERED_VIDEO_FRAME_COUNT - 21
+
+    with pytest.raises(ValueError):
+        camera.seek(NUMBERED_VIDEO_FRAME_COUNT + 1)
+
+
+def test_get_resolution(frame_stack: Path) -> None:
+    camera = NpyStackCamera(frame_stack, marker_type=MarkerType.ARUCO_6X6)
+    height, width = camera.frames.shape[1:3]
+    assert camera.get_resolution() == (width, height)
+
+
+def test_invalid_stack(tmp_path: Path) -> None:
+    np.save(tmp_path / "frames.npy", np.zeros(5))
+    with pytest.raises(ValueError):
+        NpyStackCamera(tmp_path / "frames.npy", marker_type=MarkerType.ARUCO_6X6)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import FIXTURES_DIR, MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.replay import ReplayCamera
+from zoloto.detection_log import DetectionLog, DetectionLogWriter, _get_column_path
+from zoloto.exceptions import MissingCalibrationsError
+from zoloto.marker import EagerMarker, Marker, UncalibratedMarker
+from zoloto.marker_type import MarkerType
+
+CALIBRATION_FILE = FIXTURES_DIR / "example-calibreation-params.xml"
+
+
+@pytest.fixture
+def recorded_log(multi_marker_camera: MultiMarkerCamera, tmp_path: Path) -> Path:
+    """
+    A log of 3 frames, with no markers recorded for the middle one
+    """
+    log_path = tmp_path / "log"
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(log_path) as writer:
+        writer.write_batch(0, batch, timestamp=10)
+        writer.write_batch(2, batch, timestamp=10.2)
+    return log_path
+
+
+def test_replays_recorded_markers(
+    recorded_log: Path, multi_marker_camera: MultiMarkerCamera
+) -> None:
+    camera = ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6)
+    assert camera.frame_index is None
+
+    assert sorted(camera.get_visible_markers()) == MULTI_MARKER_IDS
+    assert camera.frame_index == 0
+    assert camera.get_visible_markers() == []
+    markers = list(camera.process_frame())
+    assert camera.frame_index == 2
+
+    expected_markers = list(multi_marker_camera.process_frame())
+    assert [marker.id for marker in markers] == [
+        marker.id for marker in expected_markers
+    ]
+    assert [marker.size for marker in markers] == [
+        marker.size for marker in expected_markers
+    ]
+    assert [marker.pixel_corners for marker in markers] == [
+        marker.pixel_corners for marker in expected_markers
+    ]
+    assert all(isinstance(marker, UncalibratedMarker) for marker in markers)
+
+
+def test_iterates_all_frames(recorded_log: Path) -> None:
+    camera = ReplayCamera(
+        recorded_log, marker_type=MarkerType.ARUCO_6X6, resolution=(64, 48)
+    )
+    frames = list(camera)
+    assert len(frames) == 3
+    assert frames[0].shape == (48, 64, 3)
+    assert camera.get_resolution() == (64, 48)
+
+
+def test_markers_use_recorded_poses(
+    recorded_log: Path, multi_marker_camera: MultiMarkerCamera
+) -> None:
+    camera = ReplayCamera(
+        recorded_log,
+        marker_type=MarkerType.ARUCO_6X6,
+        calibration_file=CALIBRATION_FILE,
+    )
+    markers = list(camera.process_frame())
+    expected_batch = multi_marker_camera.process_frame_batch()
+    assert all(isinstance(marker, Marker) for marker in markers)
+    np.testing.assert_allclose(
+        [marker.cartesian for marker in markers], expected_batch.tvecs, rtol=1e-6
+    )
+
+
+def test_eager_markers_use_recorded_poses(
+    recorded_log: Path, multi_marker_camera: MultiMarkerCamera
+) -> None:
+    camera = ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6)
+    markers = list(camera.process_frame_eager())
+    expected_batch = multi_marker_camera.process_frame_batch()
+    assert all(isinstance(marker, EagerMarker) for marker in markers)
+    assert [marker.id for marker in markers] == expected_batch.ids.tolist()
+    np.testing.assert_allclose(
+        [marker._rvec for marker in markers], expected_batch.rvecs, rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        [marker._tvec for marker in markers], expected_batch.tvecs, rtol=1e-6
+    )
+
+
+def test_eager_markers_need_recorded_poses(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    multi_marker_camera.calibration_params = None
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, multi_marker_camera.process_frame_batch())
+
+    camera = ReplayCamera(tmp_path, marker_type=MarkerType.ARUCO_6X6)
+    with pytest.raises(MissingCalibrationsError):
+        list(camera.process_frame_eager())
+
+
+def test_frame_store(recorded_log: Path, tmp_path: Path) -> None:
+    frames = np.arange(4 * 8 * 6 * 3, dtype=np.uint8).reshape(4, 8, 6, 3)
+    np.save(tmp_path / "frames.npy", frames)
+    camera = ReplayCamera(
+        recorded_log,
+        marker_type=MarkerType.ARUCO_6X6,
+        frame_store=tmp_path / "frames.npy",
+    )
+    assert camera.get_resolution() == (6, 8)
+
+    replayed_frames = list(camera)
+    assert len(replayed_frames) == len(frames)
+    np.testing.assert_array_equal(replayed_frames, frames)
+    assert isinstance(replayed_frames[0], np.memmap)
+
+
+def test_replays_at_recorded_speed(recorded_log: Path, mocker: MockerFixture) -> None:
+    sleep = mocker.patch("time.sleep")
+    mocker.patch("time.monotonic", return_value=100)
+    camera = ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6, speed=2)
+    list(camera)
+    sleep.assert_called_once()
+    assert sleep.call_args[0][0] == pytest.approx(0.1)
+
+
+def test_replays_at_unlimited_speed(recorded_log: Path) -> None:
+    camera = ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6)
+    start = time.monotonic()
+    list(camera)
+    assert time.monotonic() - start < 0.1
+
+
+def test_invalid_speed(recorded_log: Path) -> None:
+    with pytest.raises(ValueError):
+        ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6, speed=0)
+
+
+def test_recorded_timestamps(recorded_log: Path) -> None:
+    camera = ReplayCamera(recorded_log, marker_type=MarkerType.ARUCO_6X6)
+    markers = list(camera.process_frame())
+    assert markers[0].timestamp is not None
+    assert markers[0].timestamp.device == 10
+
+    # Frames without recorded markers have no recorded timestamp
+    detection = camera.detect()
+    assert detection.timestamp is not None
+    assert detection.timestamp.device is None
+
+    eager_markers = list(camera.process_frame_eager())
+    assert eager_markers[0].timestamp == camera.last_capture_timestamp
+    assert eager_markers[0].timestamp is not None
+    assert eager_markers[0].timestamp.device == pytest.approx(10.2)
+
+
+def test_reuses_detection_of_current_frame(recorded_log: Path) -> None:
+    camera = ReplayCamera(
+        recorded_log,
+        marker_type=MarkerType.ARUCO_6X6,
+        calibration_file=CALIBRATION_FILE,
+    )
+    detection = camera.detect()
+    markers = list(camera.process_frame(detection=detection))
+    eager_markers = list(camera.process_frame_eager(detection=detection))
+    assert sorted(marker.id for marker in markers) == MULTI_MARKER_IDS
+    assert [marker.as_dict() for marker in markers] == [
+        marker.as_dict() for marker in eager_markers
+    ]
+    assert len(camera.process_frame_batch(detection=detection)) == len(markers)
+
+
+def test_rejects_detection_of_previous_frame(recorded_log: Path) -> None:
+    camera = ReplayCamera(
+        recorded_log,
+        marker_type=MarkerType.ARUCO_6X6,
+        calibration_file=CALIBRATION_FILE,
+    )
+    detection = camera.detect()
+    camera.capture_frame()
+    with pytest.raises(ValueError):
+        list(camera.process_frame(detection=detection))
+    with pytest.raises(ValueError):
+        list(camera.process_frame_eager(detection=detection))
+    with pytest.raises(ValueError):
+        camera.process_frame_batch(detection=detection)
+
+
+@pytest.mark.parametrize("calibration_file", [None, CALIBRATION_FILE])
+def test_batch_uses_recorded_poses(
+    recorded_log: Path, calibration_file: Path | None
+) -> None:
+    camera = ReplayCamera(
+        recorded_log,
+        marker_type=MarkerType.ARUCO_6X6,
+        calibration_file=calibration_file,
+    )
+    detection = camera.detect()
+    batch = camera.process_frame_batch(detection=detection)
+    log = DetectionLog(recorded_log)
+    rows = log.get_frame_rows(0)
+    assert batch.ids.tolist() == log.ids[rows].tolist()
+    np.testing.assert_array_equal(batch.rvecs, log.rvecs[rows])
+    np.testing.assert_array_equal(batch.tvecs, log.tvecs[rows])
+    np.testing.assert_array_equal([marker._tvec for marker in batch], log.tvecs[rows])
+    if calibration_file is not None:
+        np.testing.assert_array_equal(
+            [marker._tvec for marker in camera.process_frame(detection=detection)],
+            log.tvecs[rows],
+        )
+    np.testing.assert_array_equal(
+        [marker._tvec for marker in camera.process_frame_eager(detection=detection)],
+        log.tvecs[rows],
+    )
+
+
+def test_estimates_poses_which_werent_recorded(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, batch)
+    # Forget the pose of the first marker
+    tvec_path = _get_column_path(tmp_path, "tvec")
+    tvecs = np.fromfile(tvec_path, dtype="<f8").reshape(-1, 3)
+    tvecs[0] = np.nan
+    tvecs.tofile(tvec_path)
+
+    camera = ReplayCamera(
+        tmp_path, marker_type=MarkerType.ARUCO_6X6, calibration_file=CALIBRATION_FILE
+    )
+    replayed_batch = camera.process_frame_batch()
+    np.testing.assert_array_equal(replayed_batch.tvecs[1:], batch.tvecs[1:])
+    assert not np.isnan(replayed_batch.tvecs[0]).any()
+    assert not np.allclose(replayed_batch.tvecs[0], batch.tvecs[0])
+
+    uncalibrated_camera = ReplayCamera(tmp_path, marker_type=MarkerType.ARUCO_6X6)
+    with pytest.raises(MissingCalibrationsError):
+        uncalibrated_camera.process_frame_batch().tvecs
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from itertools import combinations, islice
+
+import numpy as np
+import pytest
+
+from tests.conftest import FIXTURES_DIR
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.coords import rvecs_to_rotation_matrices
+from zoloto.detection import MultiDictionaryDetector
+from zoloto.marker_type import MarkerType
+
+
+def test_frames_are_reproducible() -> None:
+    first = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, seed=3)
+    second = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, seed=3)
+    other = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, seed=4)
+    first_frames = list(islice(first, 3))
+    np.testing.assert_array_equal(first_frames, list(islice(second, 3)))
+    assert not np.array_equal(first_frames[0], other.capture_frame())
+
+
+def test_random_access() -> None:
+    camera = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6)
+    frames = list(islice(camera, 3))
+    frame, ground_truth = camera.render_scene(1)
+    np.testing.assert_array_equal(frame, frames[1])
+
+    frame, ground_truth = camera.render_scene(2)
+    assert camera.ground_truth is not None
+    np.testing.assert_array_equal(ground_truth.corners, camera.ground_truth.corners)
+
+
+@pytest.mark.parametrize("resolution", [(640, 480), (1280, 720), (1920, 1080)])
+def test_detects_ground_truth(resolution: tuple[int, int]) -> None:
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6, marker_count=12, resolution=resolution
+    )
+    frame = camera.capture_frame()
+    assert frame.shape == (resolution[1], resolution[0], 3)
+    assert camera.get_resolution() == resolution
+
+    ground_truth = camera.ground_truth
+    assert ground_truth is not None
+    batch = camera.process_frame_batch(frame=frame)
+    assert sorted(batch.ids.tolist()) == sorted(ground_truth.ids.tolist())
+    for marker_id, corners, tvec in zip(batch.ids, batch.corners, batch.tvecs):
+        index = ground_truth.ids.tolist().index(marker_id)
+        np.testing.assert_allclose(corners, ground_truth.corners[index], atol=2)
+        true_tvec = ground_truth.tvecs[index]
+        assert np.linalg.norm(tvec - true_tvec) < np.linalg.norm(true_tvec) * 0.1
+
+
+def test_ground_truth_poses_match_corners() -> None:
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6, marker_count=5, noise=0, max_blur=0
+    )
+    camera.capture_frame()
+    ground_truth = camera.ground_truth
+    assert ground_truth is not None
+
+    # Estimating poses from the true corners recovers the true poses
+    markers = list(
+        camera._get_markers(ground_truth.ids.tolist(), list(ground_truth.corners))
+    )
+    np.testing.assert_allclose(
+        [marker._tvec for marker in markers], ground_truth.tvecs, rtol=1e-3
+    )
+    np.testing.assert_allclose(
+        rvecs_to_rotation_matrices(np.array([marker._rvec for marker in markers])),
+        rvecs_to_rotation_matrices(ground_truth.rvecs),
+        atol=1e-3,
+    )
+
+
+def test_multiple_marker_types() -> None:
+    marker_types = [MarkerType.ARUCO_4X4, MarkerType.APRILTAG_36H11]
+    camera = SyntheticSceneCamera(
+        marker_type=marker_types[0], marker_types=marker_types, marker_count=16
+    )
+    frame = camera.capture_frame()
+    ground_truth = camera.ground_truth
+    assert ground_truth is not None
+    assert set(ground_truth.marker_types) == set(marker_types)
+
+    detections = MultiDictionaryDetector(marker_types).detect(frame)
+    for marker_type in marker_types:
+        expected_ids = [
+            marker_id
+            for marker_id, t in zip(ground_truth.ids, ground_truth.marker_types)
+            if t == marker_type
+        ]
+        ids, _ = detections[marker_type]
+        assert ids is not None
+        assert sorted(ids.flatten().tolist()) == sorted(expected_ids)
+
+
+def test_markers_do_not_overlap() -> None:
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_4X4, marker_count=200, resolution=(640, 480)
+    )
+    camera.capture_frame()
+    ground_truth = camera.ground_truth
+    assert ground_truth is not None
+    assert len(ground_truth.ids) == 200
+
+    boxes = [
+        (*corners.min(axis=0), *corners.max(axis=0)) for corners in ground_truth.corners
+    ]
+    for a, b in combinations(boxes, 2):
+        assert a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1]
+    assert (ground_truth.corners >= 0).all()
+    assert (ground_truth.corners[..., 0] < 640).all()
+    assert (ground_truth.corners[..., 1] < 480).all()
+
+
+def test_cache() -> None:
+    camera = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, cache_size=2)
+    frames = list(islice(camera, 4))
+    assert frames[0] is frames[2]
+    assert frames[1] is frames[3]
+    assert not frames[0].flags.writeable
+
+
+def test_no_markers() -> None:
+    camera = SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, marker_count=0)
+    assert camera.get_visible_markers() == []
+    assert camera.ground_truth is not None
+    assert camera.ground_truth.corners.shape == (0, 4, 2)
+
+
+def test_calibration_file() -> None:
+    calibration_file = FIXTURES_DIR / "example-calibreation-params.xml"
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6, calibration_file=calibration_file
+    )
+    assert camera.calibration_params is not None
+    assert camera.get_resolution() == camera.calibration_params.resolution
+    with pytest.raises(ValueError):
+        SyntheticSceneCamera(
+            marker_type=MarkerType.ARUCO_6X6,
+            calibration_file=calibration_file,
+            resolution=(1, 1),
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"marker_count": -1},
+        {"marker_pixel_sizes": (0, 10)},
+        {"marker_pixel_sizes": (20, 10)},
+        {"cache_size": 0},
+    ],
+)
+def test_invalid_arguments(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        SyntheticSceneCamera(marker_type=MarkerType.ARUCO_6X6, **kwargs)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.mixins import TrackingCameraMixin
+from zoloto.marker_type import MarkerType
+
+
+class TrackingMultiMarkerCamera(
+    TrackingCameraMixin, MultiMarkerCamera  # type: ignore[misc]
+):
+    rescan_interval = 3
+    roi_padding = 0.2
+
+
+@pytest.fixture
+def tracking_camera() -> TrackingMultiMarkerCamera:
+    return TrackingMultiMarkerCamera(0, 100, marker_type=MarkerType.ARUCO_6X6)
+
+
+def get_detected_image_sizes(detect_markers: MagicMock) -> list[tuple]:
+    return [call.args[0].shape for call in detect_markers.call_args_list]
+
+
+def test_detects_in_regions(
+    tracking_camera: TrackingMultiMarkerCamera, mocker: MockerFixture
+) -> None:
+    frame = tracking_camera.capture_frame()
+    full_scan = tracking_camera._get_ids_and_corners(frame)
+
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    tracked_scan = tracking_camera._get_ids_and_corners(frame)
+
+    assert tracked_scan[0] == full_scan[0]
+    np.testing.assert_allclose(tracked_scan[1], full_scan[1])
+    assert detect_markers.call_count == len(MULTI_MARKER_IDS)
+    assert all(
+        shape[0] * shape[1] < frame.size / 2
+        for shape in get_detected_image_sizes(detect_markers)
+    )
+
+
+def test_rescans_periodically(
+    tracking_camera: TrackingMultiMarkerCamera, mocker: MockerFixture
+) -> None:
+    frame = tracking_camera.capture_frame()
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    for _ in range(tracking_camera.rescan_interval + 2):
+        assert sorted(tracking_camera.get_visible_markers(frame=frame)) == sorted(
+            MULTI_MARKER_IDS
+        )
+    full_scans = [
+        shape
+        for shape in get_detected_image_sizes(detect_markers)
+        if shape == frame.shape
+    ]
+    assert len(full_scans) == 2
+
+
+def test_rescans_when_marker_lost(
+    tracking_camera: TrackingMultiMarkerCamera, mocker: MockerFixture
+) -> None:
+    frame = tracking_camera.capture_frame()
+    tracking_camera.get_visible_markers(frame=frame)
+
+    # Blank out the first marker
+    frame_without_marker: NDArray = frame.copy()
+    frame_without_marker[:, : frame.shape[1] // len(MULTI_MARKER_IDS)] = 255
+
+    detect_markers = mocker.spy(cv2.aruco, "detectMarkers")
+    assert sorted(tracking_camera.get_visible_markers(frame=frame_without_marker)) == (
+        sorted(MULTI_MARKER_IDS[1:])
+    )
+    assert get_detected_image_sizes(detect_markers)[-1] == frame.shape
+
+
+def test_merges_overlapping_regions(
+    tracking_camera: TrackingMultiMarkerCamera,
+) -> None:
+    tracking_camera._tracked_corners = np.array(
+        [
+            [[10, 10], [20, 10], [20, 20], [10, 20]],
+            [[22, 10], [32, 10], [32, 20], [22, 20]],
+            [[100, 100], [110, 100], [110, 110], [100, 110]],
+        ],
+        dtype=np.float32,
+    )
+    regions = tracking_camera._get_regions_of_interest((200, 200))
+    assert regions == [(8, 8, 35, 23), (98, 98, 113, 113)]
+
+
+def test_reset_tracking(tracking_camera: TrackingMultiMarkerCamera) -> None:
+    tracking_camera.get_visible_markers()
+    assert tracking_camera._tracked_ids is not None
+    tracking_camera.reset_tracking()
+    assert tracking_camera._tracked_ids is None
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT, VIDEO_FRAME_COUNT
+from zoloto.cameras.file import VideoFileCamera
+from zoloto.exceptions import CameraReadError
+from zoloto.marker_type import MarkerType
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+def test_reads_all_frames(temp_video_file: Path, threaded: bool) -> None:
+    with VideoFileCamera(
+        temp_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=200,
+        threaded=threaded,
+    ) as camera:
+        frames = list(camera)
+    assert len(frames) == VIDEO_FRAME_COUNT
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+def test_detects_markers(temp_video_file: Path, threaded: bool) -> None:
+    with VideoFileCamera(
+        temp_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=200,
+        threaded=threaded,
+    ) as camera:
+        for frame in camera:
+            assert camera.get_visible_markers(frame=frame) == [25]
+
+
+def test_threaded_capture_raises_at_end(temp_video_file: Path) -> None:
+    with VideoFileCamera(
+        temp_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=200,
+        threaded=True,
+    ) as camera:
+        for _ in range(VIDEO_FRAME_COUNT):
+            camera.capture_frame()
+        with pytest.raises(CameraReadError):
+            camera.capture_frame()
+
+
+def test_stop_capture_thread(temp_video_file: Path) -> None:
+    camera = VideoFileCamera(
+        temp_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=200,
+        threaded=True,
+    )
+    capture_thread = camera._capture_thread
+    assert capture_thread is not None
+    camera.close()
+    assert camera._capture_thread is None
+    assert not capture_thread.is_alive()
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+@pytest.mark.parametrize(
+    "start,stop,stride",
+    [(0, None, 1), (5, None, 1), (3, 17, 1), (2, 20, 3), (4, None, 5)],
+)
+def test_frame_range(
+    numbered_video_file: Path,
+    threaded: bool,
+    start: int,
+    stop: int | None,
+    stride: int,
+) -> None:
+    with VideoFileCamera(
+        numbered_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=100,
+        threaded=threaded,
+        start=start,
+        stop=stop,
+        stride=stride,
+    ) as camera:
+        assert camera.frame_count == NUMBERED_VIDEO_FRAME_COUNT
+        marker_ids = [camera.get_visible_markers(frame=frame) for frame in camera]
+    expected_ids = range(start, stop or NUMBERED_VIDEO_FRAME_COUNT, stride)
+    assert marker_ids == [[marker_id] for marker_id in expected_ids]
+
+
+def test_seek(numbered_video_file: Path) -> None:
+    with VideoFileCamera(
+        numbered_video_file, marker_type=MarkerType.ARUCO_6X6, marker_size=100
+    ) as camera:
+        camera.seek(12)
+        assert camera.position == 12
+        assert camera.get_visible_markers() == [12]
+        assert camera.position == 13
+        camera.seek(3)
+        assert camera.get_visible_markers() == [3]
+
+
+def test_seek_while_threaded(numbered_video_file: Path) -> None:
+    with VideoFileCamera(
+        numbered_video_file,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=100,
+        threaded=True,
+    ) as camera:
+        with pytest.raises(ValueError):
+            camera.seek(3)
+
+
+@pytest.mark.parametrize("start,stop,stride", [(-1, None, 1), (5, 4, 1), (0, None, 0)])
+def test_invalid_frame_range(
+    numbered_video_file: Path, start: int, stop: int | None, stride: int
+) -> None:
+    with pytest.raises(ValueError):
+        VideoFileCamera(
+            numbered_video_file,
+            marker_type=MarkerType.ARUCO_6X6,
+            marker_size=100,
+            start=start,
+            stop=stop,
+            stride=stride,
+        )
+
+
+@pytest.mark.parametrize("threaded", [True, False])
+@pytest.mark.parametrize("stride", [1, 3])
+def test_capture_timestamps(
+    numbered_video_file: Path, threaded: bool, stride: int
+) -> None:
+    with VideoFileCamera(
+        Path(numbered_video_file),
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=100,
+        threaded=threaded,
+        stride=stride,
+    ) as camera:
+        timestamps = []
+        for frame in camera:
+            (marker,) = camera.process_frame(frame=frame)
+            assert marker.timestamp is not None
+            assert marker.timestamp == camera.last_capture_timestamp
+            timestamps.append(marker.timestamp)
+
+    # Device timestamps are the frames' positions in the (30fps) video
+    expected_frames = range(0, NUMBERED_VIDEO_FRAME_COUNT, stride)
+    assert [timestamp.device for timestamp in timestamps] == pytest.approx(
+        [frame_index / 30 for frame_index in expected_frames]
+    )
+    monotonic_timestamps = [timestamp.monotonic for timestamp in timestamps]
+    assert monotonic_timestamps == sorted(monotonic_timestamps)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.marker_type import MarkerType
+
+from . import call_cli
+
+
+def test_annotate_image(tmp_path: Path) -> None:
+    in_file = tmp_path / "in.png"
+    out_file = tmp_path / "out.png"
+    frame = MarkerCamera(25, 200, marker_type=MarkerType.ARUCO_6X6).save_frame(in_file)
+
+    rtn = call_cli(["annotate-image", str(in_file), str(out_file)])
+    rtn.check_returncode()
+    assert rtn.stdout.strip() == "Saw 1 markers in this image"
+
+    annotated_frame = cv2.imread(str(out_file))
+    assert annotated_frame.shape[:2] == frame.shape[:2]
+    # Annotations are drawn in colour
+    assert (annotated_frame[..., 0] != annotated_frame[..., 1]).any()
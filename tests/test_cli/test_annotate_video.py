@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT
+from zoloto.cameras.file import VideoFileCamera
+from zoloto.cli.annotate_video import _write_frames, detect_frames, main
+from zoloto.marker_type import MarkerType
+
+from . import call_cli
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("detect_every", [1, 4])
+def test_detect_frames(
+    numbered_video_file: Path, workers: int, detect_every: int
+) -> None:
+    with VideoFileCamera(
+        numbered_video_file, marker_type=MarkerType.ARUCO_6X6, marker_size=100
+    ) as camera:
+        frames = list(camera)
+        detections = list(
+            detect_frames(camera, frames, workers=workers, detect_every=detect_every)
+        )
+
+    assert len(detections) == NUMBERED_VIDEO_FRAME_COUNT
+    for frame_index, (frame, detection) in enumerate(zip(frames, detections)):
+        assert detection.frame is frame
+        assert detection.marker_ids is not None
+        # Frames in between detections reuse the last detected marker
+        expected_id = frame_index - frame_index % detect_every
+        assert detection.marker_ids.flatten().tolist() == [expected_id]
+
+
+def test_detect_frames_requires_detection(numbered_video_file: Path) -> None:
+    with VideoFileCamera(
+        numbered_video_file, marker_type=MarkerType.ARUCO_6X6, marker_size=100
+    ) as camera:
+        with pytest.raises(ValueError):
+            next(detect_frames(camera, camera, detect_every=0))
+
+
+def test_detect_frames_requires_workers(numbered_video_file: Path) -> None:
+    with VideoFileCamera(
+        numbered_video_file, marker_type=MarkerType.ARUCO_6X6, marker_size=100
+    ) as camera:
+        with pytest.raises(ValueError):
+            next(detect_frames(camera, camera, workers=0))
+
+
+def test_write_frames_error_doesnt_block() -> None:
+    output_writer = MagicMock()
+    output_writer.write.side_effect = [None, RuntimeError("Disk full")]
+    frames: Queue[NDArray | None] = Queue(maxsize=1)
+    result: Future[None] = Future()
+    write_thread = Thread(target=_write_frames, args=(output_writer, frames, result))
+    write_thread.start()
+    for _ in range(10):
+        frames.put(np.zeros((4, 4, 3), dtype=np.uint8))
+    frames.put(None)
+    write_thread.join()
+    assert output_writer.write.call_count == 2
+    with pytest.raises(RuntimeError):
+        result.result()
+
+
+def test_annotate_video_write_error(
+    numbered_video_file: Path, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    video_writer = mocker.patch("cv2.VideoWriter").return_value
+    video_writer.write.side_effect = RuntimeError("Disk full")
+    args = argparse.Namespace(
+        in_file=str(numbered_video_file),
+        out_file=str(tmp_path / "annotated.mp4"),
+        type=MarkerType.ARUCO_6X6.name,
+        workers=1,
+        detect_every=1,
+    )
+    with pytest.raises(RuntimeError):
+        main(args)
+    video_writer.release.assert_called_once()
+
+
+@pytest.mark.parametrize("argument", ["--workers", "--detect-every"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_annotate_video_invalid_arguments(
+    numbered_video_file: Path, tmp_path: Path, argument: str, value: str
+) -> None:
+    rtn = call_cli(
+        [
+            "annotate-video",
+            str(numbered_video_file),
+            str(tmp_path / "annotated.mp4"),
+            argument,
+            value,
+        ]
+    )
+    assert rtn.returncode == 2
+    assert "not a positive integer" in rtn.stderr
+
+
+def test_annotate_video(numbered_video_file: Path, tmp_path: Path) -> None:
+    out_file = tmp_path / "annotated.mp4"
+    rtn = call_cli(
+        [
+            "annotate-video",
+            str(numbered_video_file),
+            str(out_file),
+            "--workers",
+            "2",
+            "--detect-every",
+            "2",
+        ]
+    )
+    rtn.check_returncode()
+
+    annotated_capture = cv2.VideoCapture(str(out_file))
+    frame_count = 0
+    while annotated_capture.read()[0]:
+        frame_count += 1
+    annotated_capture.release()
+    assert frame_count == NUMBERED_VIDEO_FRAME_COUNT
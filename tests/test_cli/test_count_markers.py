@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.marker_type import MarkerType
+
+from . import call_cli
+
+
+def test_count_markers(temp_image_file: Path) -> None:
+    MarkerCamera(25, 200, marker_type=MarkerType.APRILTAG_36H11).save_frame(
+        temp_image_file
+    )
+    rtn = call_cli(["count-markers", str(temp_image_file)])
+    rtn.check_returncode()
+    assert "Found 1 APRILTAG_36H11 tokens" in rtn.stdout.splitlines()
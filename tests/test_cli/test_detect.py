@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cli.detect import detect_files, expand_paths
+from zoloto.marker_type import MarkerType
+
+from . import call_cli
+
+MARKER_IDS = [4, 1, 3, 0, 2]
+
+
+@pytest.fixture
+def image_dir(tmp_path: Path) -> Path:
+    (tmp_path / "nested").mkdir()
+    for index, marker_id in enumerate(MARKER_IDS):
+        directory = tmp_path / "nested" if index % 2 else tmp_path
+        MarkerCamera(marker_id, 100, marker_type=MarkerType.ARUCO_6X6).save_frame(
+            directory / f"{index}.png"
+        )
+    (tmp_path / "notes.txt").write_text("Not an image")
+    return tmp_path
+
+
+def test_expand_paths(image_dir: Path) -> None:
+    assert len(expand_paths([str(image_dir)])) == len(MARKER_IDS)
+    assert expand_paths([str(image_dir / "*.png")]) == [
+        image_dir / "0.png",
+        image_dir / "2.png",
+        image_dir / "4.png",
+    ]
+    assert expand_paths([str(image_dir / "notes.txt"), str(image_dir / "0.png")]) == [
+        image_dir / "notes.txt",
+        image_dir / "0.png",
+    ]
+    assert expand_paths([str(image_dir / "missing.png")]) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_detect_files_in_order(image_dir: Path, workers: int) -> None:
+    paths = [image_dir / "4.png", image_dir / "nested" / "1.png", image_dir / "0.png"]
+    results = list(
+        detect_files(
+            paths, marker_type=MarkerType.ARUCO_6X6, marker_size=100, workers=workers
+        )
+    )
+    assert [result["file"] for result in results] == [str(p) for p in paths]
+    assert [result["markers"][0]["id"] for result in results] == [2, 1, 4]
+
+
+def test_detect_unreadable_file(image_dir: Path) -> None:
+    (result,) = detect_files(
+        [image_dir / "notes.txt"],
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=100,
+        workers=1,
+    )
+    assert "error" in result
+
+
+def test_detect_cli(image_dir: Path, tmp_path: Path, fixtures_dir: Path) -> None:
+    output_file = tmp_path / "output.jsonl"
+    rtn = call_cli(
+        [
+            "detect",
+            str(image_dir / "**" / "*.png"),
+            "--output",
+            str(output_file),
+            "--calibration-file",
+            str(fixtures_dir / "example-calibreation-params.xml"),
+            "--workers",
+            "2",
+        ]
+    )
+    rtn.check_returncode()
+    assert f"in {len(MARKER_IDS)} frames" in rtn.stderr
+
+    results = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert len(results) == len(MARKER_IDS)
+    for result in results:
+        (marker,) = result["markers"]
+        assert "tvec" in marker
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT
+
+from . import call_cli
+
+
+def test_detect_video_cli(numbered_video_file: Path) -> None:
+    rtn = call_cli(["detect-video", str(numbered_video_file), "--workers", "2"])
+    rtn.check_returncode()
+    results = [json.loads(line) for line in rtn.stdout.splitlines()]
+    assert len(results) == NUMBERED_VIDEO_FRAME_COUNT
+    for result in results:
+        assert [marker["id"] for marker in result["markers"]] == [result["frame"]]
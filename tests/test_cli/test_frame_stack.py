@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT
+
+from . import call_cli
+
+
+def test_frame_stack_cli(numbered_video_file: Path, tmp_path: Path) -> None:
+    stack_path = tmp_path / "frames.npy"
+    rtn = call_cli(["frame-stack", str(numbered_video_file), str(stack_path)])
+    rtn.check_returncode()
+    assert str(NUMBERED_VIDEO_FRAME_COUNT) in rtn.stdout
+    assert len(np.load(stack_path)) == NUMBERED_VIDEO_FRAME_COUNT
+
+
+def test_frame_stack_missing_source(tmp_path: Path) -> None:
+    rtn = call_cli(["frame-stack", str(tmp_path / "missing.mp4"), "frames.npy"])
+    assert rtn.returncode == 1
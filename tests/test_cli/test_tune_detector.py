@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cli.tune_detector import (
+    TuningResult,
+    evaluate_detector_params,
+    get_parameter_sweep,
+    get_pareto_front,
+    load_labelled_frames,
+)
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MarkerType
+
+from . import call_cli
+
+
+def make_labelled_frames(directory: Path) -> Path:
+    labels = {}
+    for marker_id in range(3):
+        filename = f"{marker_id}.png"
+        MarkerCamera(marker_id, 200, marker_type=MarkerType.APRILTAG_36H11).save_frame(
+            directory / filename
+        )
+        labels[filename] = [marker_id]
+    # A label for a marker which isn't in the frame
+    labels["0.png"].append(5)
+
+    labels_file = directory / "labels.json"
+    labels_file.write_text(json.dumps(labels))
+    return labels_file
+
+
+def test_unreadable_labelled_frame(tmp_path: Path) -> None:
+    labels_file = make_labelled_frames(tmp_path)
+    (tmp_path / "1.png").unlink()
+    with pytest.raises(ValueError, match="1.png"):
+        load_labelled_frames(labels_file)
+
+    rtn = call_cli(["tune-detector", "APRILTAG_36H11", str(tmp_path)])
+    assert rtn.returncode == 1
+    assert "Unable to read" in rtn.stderr
+    assert "1.png" in rtn.stderr
+
+
+def test_evaluate_detector_params(tmp_path: Path) -> None:
+    frames = load_labelled_frames(make_labelled_frames(tmp_path))
+    assert len(frames) == 3
+
+    result = evaluate_detector_params(
+        frames,
+        MarkerType.APRILTAG_36H11,
+        "balanced",
+        DetectorProfile.BALANCED.parameters,
+        repeat=2,
+    )
+    assert result.detection_rate == 0.75
+    assert result.false_positives == 0
+    assert result.milliseconds_per_frame > 0
+
+
+def test_parameter_sweep_includes_profiles() -> None:
+    names = [name for name, _ in get_parameter_sweep()]
+    assert names[: len(DetectorProfile)] == [p.value for p in DetectorProfile]
+    assert len(names) == len(set(names))
+
+
+def test_pareto_front() -> None:
+    results = [
+        TuningResult("slow-accurate", {}, 1.0, 0, 10),
+        TuningResult("slow-inaccurate", {}, 0.5, 0, 8),
+        TuningResult("fast", {}, 0.6, 0, 1),
+    ]
+    assert [r.name for r in get_pareto_front(results)] == ["fast", "slow-accurate"]
+
+
+def test_tune_detector_cli(tmp_path: Path) -> None:
+    make_labelled_frames(tmp_path)
+    rtn = call_cli(["tune-detector", "APRILTAG_36H11", str(tmp_path), "--repeat", "1"])
+    rtn.check_returncode()
+    assert "balanced" in rtn.stdout
+    assert "75.0%" in rtn.stdout
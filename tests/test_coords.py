@@ -1,11 +1,24 @@
 """Tests for coordinates classes."""
 from __future__ import annotations
 
+import numpy as np
+import pytest
+from cv2 import Rodrigues
 from hypothesis import given
 from hypothesis.strategies import floats, tuples
 from pyquaternion import Quaternion
 
-from zoloto.coords import Orientation
+from zoloto.coords import (
+    Orientation,
+    SphericalCoordinates,
+    quaternions_to_yaw_pitch_roll,
+    rotation_matrices_to_quaternions,
+    rvecs_to_rotation_matrices,
+    rvecs_to_yaw_pitch_roll,
+    tvecs_to_spherical,
+)
+
+vector_strategy = tuples(*[floats(-10, 10)] * 3)
 
 
 @given(tuples(floats(), floats(), floats()))
@@ -62,3 +75,46 @@ def test_repr(euler_angles: tuple[float, float, float]) -> None:
 
     for name, val in zip(names, ypr):
         assert f"{name}={val}" in repr_str
+
+
+@given(vector_strategy)
+def test_rotation_matrices_match_rodrigues(rvec: tuple[float, float, float]) -> None:
+    (rotation_matrix,) = rvecs_to_rotation_matrices(np.array([rvec]))
+    expected_matrix, _ = Rodrigues(rvec)
+    np.testing.assert_allclose(rotation_matrix, expected_matrix, atol=1e-9)
+
+
+@given(vector_strategy)
+def test_quaternions_match_pyquaternion(rvec: tuple[float, float, float]) -> None:
+    rotation_matrix, _ = Rodrigues(rvec)
+    expected = Quaternion(matrix=rotation_matrix)
+
+    (quaternion,) = rotation_matrices_to_quaternions(rotation_matrix)
+    np.testing.assert_allclose(quaternion, expected.q, atol=1e-9)
+
+    (yaw_pitch_roll,) = quaternions_to_yaw_pitch_roll(quaternion)
+    np.testing.assert_allclose(yaw_pitch_roll, expected.yaw_pitch_roll, atol=1e-6)
+
+
+@given(vector_strategy)
+def test_orientation_matches_vectorised(rvec: tuple[float, float, float]) -> None:
+    orientation = Orientation(*rvec)
+    (yaw_pitch_roll,) = rvecs_to_yaw_pitch_roll(np.array(rvec))
+    assert orientation.yaw_pitch_roll == tuple(yaw_pitch_roll)
+
+
+def test_vectorised_conversions_shapes() -> None:
+    rvecs = np.random.default_rng(0).uniform(-3, 3, (10, 3))
+    assert rvecs_to_rotation_matrices(rvecs).shape == (10, 3, 3)
+    assert rvecs_to_yaw_pitch_roll(rvecs).shape == (10, 3)
+    assert tvecs_to_spherical(rvecs).shape == (10, 3)
+    assert rvecs_to_rotation_matrices(np.empty((0, 3))).shape == (0, 3, 3)
+
+
+@given(vector_strategy)
+def test_spherical_coordinates(tvec: tuple[float, float, float]) -> None:
+    x, y, z = tvec
+    spherical = SphericalCoordinates.from_tvec(np.array(tvec))
+    assert spherical.rot_x == pytest.approx(np.arctan2(y, z))
+    assert spherical.rot_y == pytest.approx(np.arctan2(x, z))
+    assert spherical.dist == int(np.linalg.norm(tvec))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.detection import MultiDictionaryDetector
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MarkerType
+
+
+@pytest.fixture(scope="module")
+def mixed_marker_frame() -> NDArray:
+    # One marker of each type, side by side
+    return np.hstack(
+        [
+            MarkerCamera(
+                marker_type.max_id // 2, 120, marker_type=marker_type
+            ).capture_frame()
+            for marker_type in MarkerType
+        ]
+    )
+
+
+@pytest.mark.parametrize("detector_profile", list(DetectorProfile))
+@pytest.mark.parametrize("marker_types", [list(MarkerType), list(reversed(MarkerType))])
+def test_matches_individual_detection(
+    mixed_marker_frame: NDArray,
+    detector_profile: DetectorProfile,
+    marker_types: list[MarkerType],
+) -> None:
+    detector = MultiDictionaryDetector(marker_types, detector_profile=detector_profile)
+    results = detector.detect(mixed_marker_frame)
+    assert list(results) == marker_types
+
+    for marker_type, (ids, corners) in results.items():
+        expected_corners, expected_ids, _ = cv2.aruco.detectMarkers(
+            mixed_marker_frame,
+            marker_type.dictionary,
+            parameters=detector.detector_params,
+        )
+        assert marker_type.max_id // 2 in expected_ids
+        assert ids is not None
+        assert sorted(ids.flatten()) == sorted(expected_ids.flatten())
+
+        expected = dict(zip(expected_ids.flatten(), expected_corners))
+        for marker_id, marker_corners in zip(ids.flatten(), corners):
+            np.testing.assert_allclose(marker_corners, expected[marker_id], atol=0.1)
+
+
+def test_accepts_colour_frames(mixed_marker_frame: NDArray) -> None:
+    detector = MultiDictionaryDetector([MarkerType.ARUCO_4X4, MarkerType.ARUCO_6X6])
+    gray_results = detector.detect(mixed_marker_frame)
+    colour_results = detector.detect(
+        cv2.cvtColor(mixed_marker_frame, cv2.COLOR_GRAY2BGR)
+    )
+    for marker_type in detector.marker_types:
+        gray_ids, _ = gray_results[marker_type]
+        colour_ids, _ = colour_results[marker_type]
+        assert gray_ids is not None and colour_ids is not None
+        np.testing.assert_array_equal(gray_ids, colour_ids)
+
+
+def test_no_markers() -> None:
+    results = MultiDictionaryDetector().detect(np.full((200, 200), 255, np.uint8))
+    assert set(results) == set(MarkerType)
+    for ids, _ in results.values():
+        assert ids is None
+
+
+def test_requires_marker_types() -> None:
+    with pytest.raises(ValueError):
+        MultiDictionaryDetector([])
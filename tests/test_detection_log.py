@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.detection_log import (
+    METADATA_FILENAME,
+    DetectionLog,
+    DetectionLogWriter,
+    _get_column_path,
+    _get_row_sizes,
+)
+
+
+def test_write_batch(multi_marker_camera: MultiMarkerCamera, tmp_path: Path) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, batch, timestamp=1.5)
+        writer.write_batch(1, batch, timestamp=2.5)
+
+    log = DetectionLog(tmp_path)
+    assert len(log) == 2 * len(MULTI_MARKER_IDS)
+    assert log.frame_indexes.tolist() == [0] * len(batch) + [1] * len(batch)
+    assert log.timestamps.tolist() == [1.5] * len(batch) + [2.5] * len(batch)
+    assert log.ids.tolist() == batch.ids.tolist() * 2
+    assert log.sizes.tolist() == batch.sizes.tolist() * 2
+    np.testing.assert_allclose(log.corners[: len(batch)], batch.corners)
+    np.testing.assert_allclose(log.rvecs[: len(batch)], batch.rvecs)
+    np.testing.assert_allclose(log.tvecs.reshape(2, -1, 3)[1], batch.tvecs)
+
+
+def test_write_markers_matches_batch(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    with DetectionLogWriter(tmp_path / "batch") as writer:
+        writer.write_batch(0, multi_marker_camera.process_frame_batch(), timestamp=0)
+    with DetectionLogWriter(tmp_path / "markers") as writer:
+        writer.write_markers(0, multi_marker_camera.process_frame_eager(), timestamp=0)
+
+    batch_log = DetectionLog(tmp_path / "batch")
+    markers_log = DetectionLog(tmp_path / "markers")
+    for column in ["frame_indexes", "ids", "sizes", "corners", "rvecs", "tvecs"]:
+        np.testing.assert_allclose(
+            getattr(markers_log, column), getattr(batch_log, column)
+        )
+
+
+def test_uncalibrated_markers_have_nan_pose(
+    marker_camera: MarkerCamera, tmp_path: Path
+) -> None:
+    marker_camera.calibration_params = None
+    with DetectionLogWriter(tmp_path / "markers") as writer:
+        writer.write_markers(3, marker_camera.process_frame())
+    with DetectionLogWriter(tmp_path / "batch") as writer:
+        writer.write_batch(3, marker_camera.process_frame_batch())
+
+    assert DetectionLog(tmp_path / "batch").ids.tolist() == [25]
+    assert np.isnan(DetectionLog(tmp_path / "batch").tvecs).all()
+
+    log = DetectionLog(tmp_path / "markers")
+    assert log.ids.tolist() == [25]
+    assert log.frame_indexes.tolist() == [3]
+    assert np.isnan(log.rvecs).all()
+    assert np.isnan(log.tvecs).all()
+    assert log.timestamps[0] > 0
+
+
+def test_empty_log(tmp_path: Path) -> None:
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_markers(0, [])
+
+    log = DetectionLog(tmp_path)
+    assert len(log) == 0
+    assert log.corners.shape == (0, 4, 2)
+    assert log.get_frame_rows(0) == slice(0, 0)
+
+
+def test_append(multi_marker_camera: MultiMarkerCamera, tmp_path: Path) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    for frame_index in range(3):
+        with DetectionLogWriter(tmp_path) as writer:
+            writer.write_batch(frame_index, batch)
+
+    log = DetectionLog(tmp_path)
+    assert len(log) == 3 * len(batch)
+    assert log.get_frame_rows(1) == slice(len(batch), 2 * len(batch))
+    assert log.ids[log.get_frame_rows(2)].tolist() == batch.ids.tolist()
+    assert log.get_frame_rows(5) == slice(len(log), len(log))
+
+
+def test_chunked_writes(multi_marker_camera: MultiMarkerCamera, tmp_path: Path) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    writer = DetectionLogWriter(tmp_path, chunk_size=len(batch) * 2)
+    writer.write_batch(0, batch)
+    assert len(DetectionLog(tmp_path)) == 0
+    writer.write_batch(1, batch)
+    assert len(DetectionLog(tmp_path)) == 2 * len(batch)
+    writer.write_batch(2, batch)
+    writer.close()
+    assert len(DetectionLog(tmp_path)) == 3 * len(batch)
+
+
+def test_truncated_column(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, batch)
+        writer.flush()
+        writer.write_batch(1, batch)
+
+    # Simulate a write interrupted part way through a row
+    tvec_path = _get_column_path(tmp_path, "tvec")
+    tvec_path.write_bytes(tvec_path.read_bytes()[:-4])
+
+    log = DetectionLog(tmp_path)
+    assert len(log) == 2 * len(batch) - 1
+    assert log.ids.shape == (len(log),)
+
+
+def test_append_after_interrupted_write(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    batch = multi_marker_camera.process_frame_batch()
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, batch)
+        writer.write_batch(1, batch)
+
+    # Simulate a flush interrupted after writing some columns
+    id_path = _get_column_path(tmp_path, "id")
+    id_path.write_bytes(id_path.read_bytes() + np.array([99], dtype="<i4").tobytes())
+    tvec_path = _get_column_path(tmp_path, "tvec")
+    tvec_path.write_bytes(tvec_path.read_bytes()[:-4])
+
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(2, batch)
+
+    log = DetectionLog(tmp_path)
+    assert len(log) == 3 * len(batch) - 1
+    for name, row_size in _get_row_sizes().items():
+        assert _get_column_path(tmp_path, name).stat().st_size == len(log) * row_size
+    frame_rows = log.get_frame_rows(2)
+    assert log.ids[frame_rows].tolist() == batch.ids.tolist()
+    np.testing.assert_array_equal(log.corners[frame_rows], batch.corners)
+    np.testing.assert_array_equal(log.tvecs[frame_rows], batch.tvecs)
+
+
+def test_incompatible_log(tmp_path: Path) -> None:
+    DetectionLogWriter(tmp_path).close()
+    (tmp_path / METADATA_FILENAME).write_text('{"version": 0}')
+    with pytest.raises(ValueError):
+        DetectionLog(tmp_path)
+    with pytest.raises(ValueError):
+        DetectionLogWriter(tmp_path)
+
+
+def test_reader_is_memory_mapped(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, multi_marker_camera.process_frame_batch())
+
+    log = DetectionLog(tmp_path)
+    assert isinstance(log.corners, np.memmap)
+    assert not log.corners.flags.writeable
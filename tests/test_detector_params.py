@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+from hypothesis import given
+
+from tests.strategies import marker_types
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.detector_params import DetectorProfile, get_detector_params_dict
+from zoloto.marker_type import MarkerType
+
+
+def test_default_profile_is_balanced() -> None:
+    camera = MarkerCamera(0, 200, marker_type=MarkerType.APRILTAG_36H11)
+    assert camera.detector_profile == DetectorProfile.BALANCED
+    assert camera.detector_params.minMarkerDistanceRate == pytest.approx(0.035)
+
+
+@pytest.mark.parametrize("profile", list(DetectorProfile))
+def test_profile_parameters_are_applied(profile: DetectorProfile) -> None:
+    camera = MarkerCamera(
+        0, 200, marker_type=MarkerType.APRILTAG_36H11, detector_profile=profile
+    )
+    params_dict = get_detector_params_dict(camera.detector_params)
+    for name, value in profile.parameters.items():
+        assert params_dict[name] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("profile", list(DetectorProfile))
+@given(marker_types())
+def test_profile_detects_marker(
+    profile: DetectorProfile, marker_type: MarkerType
+) -> None:
+    camera = MarkerCamera(
+        marker_type.max_id,
+        marker_type.min_marker_image_size * 4,
+        marker_type=marker_type,
+        detector_profile=profile,
+    )
+    assert camera.get_visible_markers() == [marker_type.max_id]
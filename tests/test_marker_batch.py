@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.exceptions import MissingCalibrationsError
+from zoloto.marker import Marker, MarkerBatch, UncalibratedMarker
+
+
+@pytest.fixture
+def marker_batch(multi_marker_camera: MultiMarkerCamera) -> MarkerBatch:
+    return multi_marker_camera.process_frame_batch()
+
+
+def test_array_shapes(marker_batch: MarkerBatch) -> None:
+    marker_count = len(MULTI_MARKER_IDS)
+    assert len(marker_batch) == marker_count
+    assert marker_batch.ids.shape == (marker_count,)
+    assert marker_batch.corners.shape == (marker_count, 4, 2)
+    assert marker_batch.sizes.shape == (marker_count,)
+    assert marker_batch.rvecs.shape == (marker_count, 3)
+    assert marker_batch.tvecs.shape == (marker_count, 3)
+    assert marker_batch.pixel_centres.shape == (marker_count, 2)
+    assert marker_batch.distances.shape == (marker_count,)
+    assert marker_batch.spherical.shape == (marker_count, 2)
+    assert marker_batch.rotation_matrices.shape == (marker_count, 3, 3)
+    assert marker_batch.quaternions.shape == (marker_count, 4)
+    assert marker_batch.yaw_pitch_roll.shape == (marker_count, 3)
+    assert sorted(marker_batch.ids.tolist()) == MULTI_MARKER_IDS
+
+
+def test_matches_markers(
+    multi_marker_camera: MultiMarkerCamera, marker_batch: MarkerBatch
+) -> None:
+    markers = list(multi_marker_camera.process_frame())
+    assert marker_batch.ids.tolist() == [marker.id for marker in markers]
+    assert marker_batch.sizes.tolist() == [marker.size for marker in markers]
+    assert marker_batch.distances.tolist() == [marker.distance for marker in markers]
+    np.testing.assert_allclose(
+        marker_batch.pixel_centres, [marker.pixel_centre for marker in markers]
+    )
+    np.testing.assert_allclose(
+        marker_batch.spherical,
+        [marker.spherical[:2] for marker in markers],
+    )
+    np.testing.assert_allclose(
+        marker_batch.tvecs, [marker.cartesian for marker in markers]
+    )
+    np.testing.assert_allclose(
+        marker_batch.yaw_pitch_roll,
+        [marker.orientation.yaw_pitch_roll for marker in markers],
+    )
+    np.testing.assert_allclose(
+        marker_batch.rotation_matrices,
+        [marker.orientation.rotation_matrix for marker in markers],
+    )
+    np.testing.assert_allclose(
+        marker_batch.quaternions,
+        [marker.orientation.quaternion.q for marker in markers],
+    )
+
+
+def test_marker_views(marker_batch: MarkerBatch) -> None:
+    markers = list(marker_batch)
+    assert len(markers) == len(marker_batch)
+    for index, marker in enumerate(markers):
+        assert isinstance(marker, Marker)
+        assert marker.id == marker_batch.ids[index]
+        assert marker.size == marker_batch.sizes[index]
+        assert marker.distance == marker_batch.distances[index]
+    assert marker_batch[-1].id == markers[-1].id
+    assert marker_batch[-1].as_dict() == markers[-1].as_dict()
+
+
+def test_empty_batch(marker_camera: MarkerCamera) -> None:
+    frame = np.zeros((100, 100), dtype=np.uint8)
+    marker_batch = marker_camera.process_frame_batch(frame=frame)
+    assert len(marker_batch) == 0
+    assert marker_batch.corners.shape == (0, 4, 2)
+    assert marker_batch.tvecs.shape == (0, 3)
+    assert marker_batch.distances.shape == (0,)
+    assert list(marker_batch) == []
+
+
+def test_uncalibrated_batch(marker_camera: MarkerCamera) -> None:
+    marker_camera.calibration_params = None
+    marker_batch = marker_camera.process_frame_batch()
+    assert marker_batch.ids.tolist() == [25]
+    assert isinstance(marker_batch[0], UncalibratedMarker)
+    with pytest.raises(MissingCalibrationsError):
+        marker_batch.tvecs
+    with pytest.raises(MissingCalibrationsError):
+        marker_batch.distances
@@ -4,7 +4,7 @@ import cv2
 import pytest
 
 from zoloto.cameras.marker import MarkerCamera
-from zoloto.marker_type import MAX_ALL_ALLOWED_ID, MarkerType
+from zoloto.marker_type import MAX_ALL_ALLOWED_ID, MarkerType, get_marker_type_info
 
 
 @pytest.mark.parametrize("marker_type", MarkerType)
@@ -31,3 +31,22 @@ def test_marker_ids(marker_type: MarkerType) -> None:
     assert marker_type.max_id in marker_type.marker_ids
     assert 0 in marker_type.marker_ids
     assert len(marker_type.marker_ids) == marker_type.marker_count
+
+
+@pytest.mark.parametrize("marker_type", MarkerType)
+def test_marker_type_info(marker_type: MarkerType) -> None:
+    dictionary = cv2.aruco.getPredefinedDictionary(marker_type.value)
+    info = get_marker_type_info(marker_type)
+    assert info.marker_count == len(dictionary.bytesList)
+    assert info.marker_size == dictionary.markerSize
+    assert (info.bytes_list == dictionary.bytesList).all()
+    assert not marker_type.bytes_list.flags.writeable
+
+
+def test_marker_type_info_is_cached() -> None:
+    assert MarkerType.ARUCO_4X4.dictionary is MarkerType.ARUCO_4X4.dictionary
+    assert get_marker_type_info(MarkerType.ARUCO_4X4) is get_marker_type_info(
+        MarkerType.ARUCO_4X4
+    )
+    camera = MarkerCamera(0, marker_size=100, marker_type=MarkerType.ARUCO_4X4)
+    assert camera.marker_dictionary is MarkerType.ARUCO_4X4.dictionary
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import VIDEO_FRAME_COUNT, MultiMarkerCamera
+from zoloto.cameras.file import VideoFileCamera
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.mixins import MotionGatedDetectionMixin, TrackingCameraMixin
+from zoloto.cameras.replay import ReplayCamera
+from zoloto.detection_log import DetectionLogWriter
+from zoloto.marker import Marker
+from zoloto.marker_type import MarkerType
+from zoloto.pipeline import (
+    DetectionPipeline,
+    create_detector_params,
+    get_detector_params_dict,
+    uses_default_detection,
+)
+
+
+def test_detector_params_round_trip(marker_camera: MarkerCamera) -> None:
+    params_dict = get_detector_params_dict(marker_camera.detector_params)
+    assert params_dict["minMarkerDistanceRate"] == pytest.approx(0.035)
+    assert get_detector_params_dict(create_detector_params(params_dict)) == params_dict
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_matches_serial_detection(
+    marker_camera: MarkerCamera, shared_memory: bool
+) -> None:
+    frame = marker_camera.capture_frame()
+    with DetectionPipeline(
+        marker_camera, workers=2, shared_memory=shared_memory
+    ) as pipeline:
+        (markers,) = pipeline.process_frames([frame])
+    (expected_marker,) = marker_camera.process_frame(frame=frame)
+    (marker,) = markers
+    assert isinstance(marker, Marker)
+    assert marker.id == expected_marker.id
+    assert marker.pixel_corners == expected_marker.pixel_corners
+    assert marker.as_dict() == expected_marker.as_dict()
+
+
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_preserves_frame_order(shared_memory: bool) -> None:
+    marker_ids = list(range(12))
+    frames = [
+        MarkerCamera(
+            marker_id, marker_size=100, marker_type=MarkerType.ARUCO_6X6
+        ).capture_frame()
+        for marker_id in marker_ids
+    ]
+    camera = MarkerCamera(0, marker_size=100, marker_type=MarkerType.ARUCO_6X6)
+    with DetectionPipeline(
+        camera, workers=3, max_pending=2, shared_memory=shared_memory
+    ) as pipeline:
+        results = list(pipeline.process_frames(frames))
+    assert [[marker.id for marker in markers] for markers in results] == [
+        [marker_id] for marker_id in marker_ids
+    ]
+
+
+def test_iterates_camera(temp_video_file: Path) -> None:
+    with VideoFileCamera(
+        temp_video_file, marker_type=MarkerType.ARUCO_6X6, marker_size=200
+    ) as camera:
+        with DetectionPipeline(camera, workers=2) as pipeline:
+            results = list(pipeline)
+    assert len(results) == VIDEO_FRAME_COUNT
+    assert all([marker.id for marker in markers] == [25] for markers in results)
+
+
+def test_invalid_max_pending(marker_camera: MarkerCamera) -> None:
+    with pytest.raises(ValueError):
+        DetectionPipeline(marker_camera, workers=1, max_pending=-1)
+
+
+class MotionGatedMarkerCamera(MotionGatedDetectionMixin, MarkerCamera):
+    pass
+
+
+class TrackingMarkerCamera(TrackingCameraMixin, MarkerCamera):
+    pass
+
+
+@pytest.mark.parametrize(
+    "camera_class", [MotionGatedMarkerCamera, TrackingMarkerCamera]
+)
+def test_rejects_cameras_with_custom_detection(
+    camera_class: type[MarkerCamera],
+) -> None:
+    camera = camera_class(25, marker_size=200, marker_type=MarkerType.ARUCO_6X6)
+    assert not uses_default_detection(camera)
+    with pytest.raises(ValueError):
+        DetectionPipeline(camera, workers=1)
+
+
+def test_rejects_replay_camera(
+    multi_marker_camera: MultiMarkerCamera, tmp_path: Path
+) -> None:
+    with DetectionLogWriter(tmp_path) as writer:
+        writer.write_batch(0, multi_marker_camera.process_frame_batch())
+    with pytest.raises(ValueError):
+        DetectionPipeline(
+            ReplayCamera(tmp_path, marker_type=MarkerType.ARUCO_6X6), workers=1
+        )
+
+
+def test_shared_memory_falls_back_for_large_frames(
+    marker_camera: MarkerCamera,
+) -> None:
+    small_frame = MarkerCamera(
+        1, marker_size=100, marker_type=MarkerType.ARUCO_6X6
+    ).capture_frame()
+    large_frame = marker_camera.capture_frame()
+    with DetectionPipeline(marker_camera, workers=1, shared_memory=True) as pipeline:
+        results = list(pipeline.process_frames([small_frame, large_frame]))
+    assert [[marker.id for marker in markers] for markers in results] == [[1], [25]]
+
+
+def test_markers_keep_capture_timestamps(temp_video_file: Path) -> None:
+    with VideoFileCamera(
+        Path(temp_video_file), marker_type=MarkerType.ARUCO_6X6, marker_size=200
+    ) as camera:
+        stats = camera.enable_stats()
+        with DetectionPipeline(camera, workers=2, max_pending=2) as pipeline:
+            results = list(pipeline)
+
+    timestamps = []
+    for markers in results:
+        timestamp = markers[0].timestamp
+        assert timestamp is not None
+        timestamps.append(timestamp)
+    assert [timestamp.device for timestamp in timestamps] == pytest.approx(
+        [frame_index / 30 for frame_index in range(VIDEO_FRAME_COUNT)]
+    )
+    assert stats.latency.count == VIDEO_FRAME_COUNT
+
+
+def test_frames_arent_timestamped(marker_camera: MarkerCamera) -> None:
+    with DetectionPipeline(marker_camera, workers=1) as pipeline:
+        (markers,) = pipeline.process_frames([marker_camera.capture_frame()])
+    assert markers[0].timestamp is None
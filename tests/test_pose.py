@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from cv2 import aruco
+from pytest_mock.plugin import MockerFixture
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.calibration import CalibrationParameters
+from zoloto.coords import Orientation
+from zoloto.marker import Marker
+from zoloto.pose import PoseBatch, PoseCache, estimate_poses
+
+
+def test_estimate_poses_matches_single_estimation(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    sizes = [100, 200, 100, 200]
+    rvecs, tvecs = estimate_poses(corners, sizes, fake_calibration_params)
+    assert rvecs.shape == tvecs.shape == (len(corners), 3)
+
+    for marker_corners, size, rvec, tvec in zip(corners, sizes, rvecs, tvecs):
+        expected_rvecs, expected_tvecs, _ = aruco.estimatePoseSingleMarkers(
+            [marker_corners],
+            size,
+            fake_calibration_params.camera_matrix,
+            fake_calibration_params.distance_coefficients,
+        )
+        np.testing.assert_allclose(rvec, expected_rvecs[0][0])
+        np.testing.assert_allclose(tvec, expected_tvecs[0][0])
+
+
+def test_estimate_no_poses(fake_calibration_params: CalibrationParameters) -> None:
+    rvecs, tvecs = estimate_poses([], [], fake_calibration_params)
+    assert rvecs.shape == tvecs.shape == (0, 3)
+
+
+def test_pose_batch_estimates_once_per_size(
+    multi_marker_camera: MultiMarkerCamera, mocker: MockerFixture
+) -> None:
+    estimate_pose = mocker.spy(aruco, "estimatePoseSingleMarkers")
+    markers = list(multi_marker_camera.process_frame())
+    assert sorted(marker.id for marker in markers) == MULTI_MARKER_IDS
+    estimate_pose.assert_not_called()
+
+    for marker in markers:
+        assert isinstance(marker, Marker)
+        assert marker.distance > 0
+
+    assert estimate_pose.call_count == 2
+
+
+def test_lazy_matches_eager(multi_marker_camera: MultiMarkerCamera) -> None:
+    frame = multi_marker_camera.capture_frame()
+    markers = sorted(multi_marker_camera.process_frame(frame=frame), key=lambda m: m.id)
+    eager_markers = sorted(
+        multi_marker_camera.process_frame_eager(frame=frame), key=lambda m: m.id
+    )
+    assert [marker.as_dict() for marker in markers] == [
+        marker.as_dict() for marker in eager_markers
+    ]
+
+
+def test_pose_batch_is_lazy(
+    fake_calibration_params: CalibrationParameters, mocker: MockerFixture
+) -> None:
+    estimate_poses = mocker.patch("zoloto.pose.estimate_poses")
+    pose_batch = PoseBatch([], [], fake_calibration_params)
+    assert len(pose_batch) == 0
+    estimate_poses.assert_not_called()
+    pose_batch.get_pose_vectors()
+    pose_batch.get_pose_vectors()
+    estimate_poses.assert_called_once()
+
+
+def test_orientations_match_individual_conversion(
+    multi_marker_camera: MultiMarkerCamera,
+) -> None:
+    for marker in multi_marker_camera.process_frame():
+        expected = Orientation(*marker._rvec)
+        np.testing.assert_allclose(
+            marker.orientation.yaw_pitch_roll, expected.yaw_pitch_roll
+        )
+        np.testing.assert_allclose(
+            marker.orientation.rotation_matrix, expected.rotation_matrix
+        )
+        assert marker.orientation.quaternion == expected.quaternion
+
+
+def test_pose_cache_reuses_stationary_markers(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    sizes = [200] * len(ids)
+    pose_cache = PoseCache()
+    expected = estimate_poses(corners, sizes, fake_calibration_params)
+
+    rvecs, tvecs = pose_cache.estimate_poses(
+        ids, corners, sizes, fake_calibration_params
+    )
+    assert pose_cache.estimated == len(ids)
+    assert len(pose_cache) == len(ids)
+
+    jittered_corners = [marker_corners + 0.1 for marker_corners in corners]
+    rvecs, tvecs = pose_cache.estimate_poses(
+        ids, jittered_corners, sizes, fake_calibration_params
+    )
+    assert pose_cache.reused == len(ids)
+    assert pose_cache.estimated == len(ids)
+    np.testing.assert_allclose(rvecs, expected[0])
+    np.testing.assert_allclose(tvecs, expected[1])
+
+
+def test_pose_cache_refines_moved_markers(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    sizes = [200] * len(ids)
+    pose_cache = PoseCache()
+    pose_cache.estimate_poses(ids, corners, sizes, fake_calibration_params)
+
+    moved_corners = [marker_corners + [5, -3] for marker_corners in corners]
+    rvecs, tvecs = pose_cache.estimate_poses(
+        ids, moved_corners, sizes, fake_calibration_params
+    )
+    assert pose_cache.refined == len(ids)
+    assert pose_cache.reused == 0
+
+    expected_rvecs, expected_tvecs = estimate_poses(
+        moved_corners, sizes, fake_calibration_params
+    )
+    np.testing.assert_allclose(rvecs, expected_rvecs, atol=1e-3)
+    np.testing.assert_allclose(tvecs, expected_tvecs, rtol=1e-3)
+
+
+def test_pose_cache_estimates_new_and_resized_markers(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    pose_cache = PoseCache()
+    pose_cache.estimate_poses(ids[:2], corners[:2], [200, 200], fake_calibration_params)
+
+    sizes = [200, 100, 200, 200]
+    rvecs, tvecs = pose_cache.estimate_poses(
+        ids, corners, sizes, fake_calibration_params
+    )
+    assert pose_cache.reused == 1
+    assert pose_cache.estimated == 2 + 3
+
+    expected_rvecs, expected_tvecs = estimate_poses(
+        corners, sizes, fake_calibration_params
+    )
+    np.testing.assert_allclose(rvecs, expected_rvecs)
+    np.testing.assert_allclose(tvecs, expected_tvecs)
+
+
+def test_pose_cache_only_keeps_latest_frame(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    ids, corners = multi_marker_camera._get_ids_and_corners()
+    pose_cache = PoseCache()
+    pose_cache.estimate_poses(ids, corners, [200] * len(ids), fake_calibration_params)
+    pose_cache.estimate_poses(ids[:1], corners[:1], [200], fake_calibration_params)
+    assert list(pose_cache.poses) == ids[:1]
+
+    pose_cache.clear()
+    assert len(pose_cache) == 0
+
+
+def test_pose_cache_ignores_duplicate_ids(
+    multi_marker_camera: MultiMarkerCamera,
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    _, corners = multi_marker_camera._get_ids_and_corners()
+    ids = [1, 1, 2, 3]
+    sizes = [200] * len(ids)
+    pose_cache = PoseCache()
+    pose_cache.estimate_poses(ids, corners, sizes, fake_calibration_params)
+    assert sorted(pose_cache.poses) == [2, 3]
+
+    pose_cache.estimate_poses(ids, corners, sizes, fake_calibration_params)
+    assert pose_cache.reused == 2
+    assert pose_cache.estimated == 4 + 2
+
+
+def test_pose_cache_invalid_epsilon() -> None:
+    with pytest.raises(ValueError):
+        PoseCache(epsilon=-1)
+
+
+def test_pose_batch_needs_ids_for_cache(
+    fake_calibration_params: CalibrationParameters,
+) -> None:
+    with pytest.raises(ValueError):
+        PoseBatch([], [], fake_calibration_params, pose_cache=PoseCache())
+
+
+def test_camera_pose_cache(multi_marker_camera: MultiMarkerCamera) -> None:
+    frame = multi_marker_camera.capture_frame()
+    expected = [
+        marker.as_dict() for marker in multi_marker_camera.process_frame(frame=frame)
+    ]
+
+    pose_cache = multi_marker_camera.enable_pose_cache()
+    assert multi_marker_camera.pose_cache is pose_cache
+    for _ in range(2):
+        assert [
+            marker.as_dict()
+            for marker in multi_marker_camera.process_frame(frame=frame)
+        ] == expected
+    assert pose_cache.estimated == pose_cache.reused == len(expected)
+
+    eager_markers = multi_marker_camera.process_frame_eager(frame=frame)
+    assert [marker.as_dict() for marker in eager_markers] == expected
+    batch = multi_marker_camera.process_frame_batch(frame=frame)
+    assert [marker.as_dict() for marker in batch] == expected
+    assert pose_cache.reused == 3 * len(expected)
+
+    multi_marker_camera.disable_pose_cache()
+    assert multi_marker_camera.pose_cache is None
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Generator
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from pytest_mock.plugin import MockerFixture
+
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.mixins import IterableCameraMixin
+from zoloto.detection import Detection
+from zoloto.marker import Marker, UncalibratedMarker
+from zoloto.marker_type import MarkerType
+from zoloto.scheduler import FrameScheduler
+from zoloto.stats import CaptureTimestamp
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LiveMarkerCamera(IterableCameraMixin, MarkerCamera):
+    """
+    A camera which captures a frame every `frame_interval` seconds (of a fake
+    clock), and takes `processing_time` seconds to process each frame.
+
+    Like a threaded camera, frames queue up whilst the previous one is
+    processed.
+    """
+
+    def __init__(
+        self,
+        clock: FakeClock,
+        *,
+        frame_count: int,
+        frame_interval: float,
+        processing_time: float,
+    ) -> None:
+        super().__init__(25, 50, marker_type=MarkerType.ARUCO_6X6)
+        self.clock = clock
+        self.frame_count = frame_count
+        self.frame_interval = frame_interval
+        self.processing_time = processing_time
+        self.frame_index = -1
+        self.latencies: list[float] = []
+
+    def capture_frame(self) -> NDArray:
+        self.frame_index += 1
+        if self.frame_index >= self.frame_count:
+            return np.empty(0)
+        # Wait for the frame to be captured
+        self.clock.now = max(self.clock.now, self.frame_index * self.frame_interval)
+        return MarkerCamera.capture_frame(self)
+
+    def _get_capture_timestamp(self) -> CaptureTimestamp:
+        capture_time = self.frame_index * self.frame_interval
+        return CaptureTimestamp(capture_time, capture_time)
+
+    def process_frame(
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
+    ) -> Generator[UncalibratedMarker | Marker, None, None]:
+        self.clock.now += self.processing_time
+        self.latencies.append(self.clock.now - self.frame_index * self.frame_interval)
+        return super().process_frame(frame=frame, detection=detection)
+
+
+class DroppingLiveMarkerCamera(LiveMarkerCamera):
+    """
+    Like `LiveMarkerCamera`, but frames which aren't read before the next one
+    is captured are dropped, so the newest frame is always read.
+    """
+
+    def capture_frame(self) -> NDArray:
+        latest_frame_index = int(self.clock.now / self.frame_interval + 1e-9)
+        self.frame_index = max(self.frame_index, latest_frame_index - 1)
+        return super().capture_frame()
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> FakeClock:
+    clock = FakeClock()
+    mocker.patch("zoloto.scheduler.monotonic", clock)
+    mocker.patch("zoloto.scheduler.perf_counter", clock)
+    return clock
+
+
+def test_processes_every_frame_when_fast(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=20, frame_interval=0.1, processing_time=0.05
+    )
+    scheduler = FrameScheduler(camera, latency_budget=0.2)
+    results = list(scheduler)
+    assert len(results) == 20
+    assert all([marker.id for marker in markers] == [25] for markers in results)
+    assert scheduler.stride == 1
+    assert scheduler.frames_processed == scheduler.frames_received == 20
+    assert scheduler.frames_dropped == scheduler.frames_skipped == 0
+    assert scheduler.frame_interval == pytest.approx(0.1)
+    assert scheduler.processing_time == pytest.approx(0.05)
+
+
+def test_stride_matches_processing_time(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=60, frame_interval=0.1, processing_time=0.25
+    )
+    scheduler = FrameScheduler(camera, latency_budget=0.5)
+    list(scheduler)
+    assert scheduler.stride == 3
+    assert scheduler.frames_received == 60
+    assert (
+        scheduler.frames_processed + scheduler.frames_dropped + scheduler.frames_skipped
+        == 60
+    )
+    # As many frames are processed as there's time for
+    assert scheduler.frames_processed == pytest.approx(60 * 0.1 / 0.25, abs=2)
+    # Once the stride has settled, frames are processed within the budget
+    assert max(camera.latencies[3:]) <= 0.5
+
+
+def test_without_scheduler_latency_grows(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=60, frame_interval=0.1, processing_time=0.25
+    )
+    for frame in camera:
+        list(camera.process_frame(frame=frame))
+    assert camera.latencies[-1] > 5
+
+
+def test_dropping_source(clock: FakeClock) -> None:
+    camera = DroppingLiveMarkerCamera(
+        clock, frame_count=300, frame_interval=0.1, processing_time=0.25
+    )
+    for frame in camera:
+        list(camera.process_frame(frame=frame))
+    expected_latencies = camera.latencies
+
+    clock.now = 0
+    camera = DroppingLiveMarkerCamera(
+        clock, frame_count=300, frame_interval=0.1, processing_time=0.25
+    )
+    scheduler = FrameScheduler(camera, latency_budget=0.5)
+    list(scheduler)
+    # The newest frame is always processed, rather than waiting for another
+    assert scheduler.frames_skipped == scheduler.frames_dropped == 0
+    assert scheduler.frames_processed == len(expected_latencies)
+    assert camera.latencies == pytest.approx(expected_latencies)
+    # Gaps between frames which are read span the frames which were dropped
+    assert scheduler.frame_interval == pytest.approx(0.2)
+
+
+def test_drops_stale_frames(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=30, frame_interval=0.1, processing_time=0.35
+    )
+    scheduler = FrameScheduler(camera, latency_budget=0.5, max_stride=1)
+    list(scheduler)
+    assert scheduler.stride == 1
+    assert scheduler.frames_skipped == 0
+    assert scheduler.frames_dropped > 0
+    assert scheduler.frames_processed + scheduler.frames_dropped == 30
+    assert max(camera.latencies) < 0.5 + 0.35 + 1e-9
+
+
+def test_max_stride(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=30, frame_interval=0.1, processing_time=1
+    )
+    scheduler = FrameScheduler(camera, latency_budget=5, max_stride=4)
+    list(scheduler)
+    assert scheduler.stride == 4
+
+
+def test_consumer_time_counts_as_processing(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=30, frame_interval=0.1, processing_time=0
+    )
+    scheduler = FrameScheduler(camera, latency_budget=1)
+    for _ in scheduler:
+        clock.now += 0.2
+    assert scheduler.stride == 2
+    assert scheduler.processing_time == pytest.approx(0.2)
+
+
+def test_captures_from_non_iterable_camera(marker_camera: MarkerCamera) -> None:
+    scheduler = FrameScheduler(marker_camera, latency_budget=10)
+    for _, markers in zip(range(3), scheduler):
+        assert [marker.id for marker in markers] == [25]
+    assert scheduler.frames_processed == 3
+
+
+def test_as_dict(clock: FakeClock) -> None:
+    camera = LiveMarkerCamera(
+        clock, frame_count=5, frame_interval=0.1, processing_time=0.05
+    )
+    scheduler = FrameScheduler(camera, latency_budget=1)
+    list(scheduler)
+    assert scheduler.as_dict() == {
+        "stride": 1,
+        "frames_received": 5,
+        "frames_processed": 5,
+        "frames_dropped": 0,
+        "frames_skipped": 0,
+        "processing_time": pytest.approx(0.05),
+        "frame_interval": pytest.approx(0.1),
+    }
+
+
+@pytest.mark.parametrize(
+    "latency_budget,max_stride,smoothing",
+    [(0, 1, 0.5), (1, 0, 0.5), (1, 1, 0), (1, 1, 1.5)],
+)
+def test_invalid_arguments(
+    marker_camera: MarkerCamera,
+    latency_budget: float,
+    max_stride: int,
+    smoothing: float,
+) -> None:
+    with pytest.raises(ValueError):
+        FrameScheduler(
+            marker_camera,
+            latency_budget=latency_budget,
+            max_stride=max_stride,
+            smoothing=smoothing,
+        )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from zoloto.shared_frames import SharedFramePool
+
+
+@pytest.fixture
+def frame_pool() -> Iterator[SharedFramePool]:
+    frame_pool = SharedFramePool(2, 64)
+    yield frame_pool
+    frame_pool.close()
+
+
+def test_round_trip(frame_pool: SharedFramePool) -> None:
+    frame = np.arange(48, dtype=np.uint8).reshape((4, 4, 3))
+    shared_frame = frame_pool.put(frame)
+    view = shared_frame.get_array()
+    assert view.shape == frame.shape
+    assert view.dtype == frame.dtype
+    np.testing.assert_array_equal(view, frame)
+    assert not np.shares_memory(view, frame)
+
+
+def test_slots_are_separate(frame_pool: SharedFramePool) -> None:
+    first = frame_pool.put(np.zeros((8, 8), dtype=np.uint8))
+    second = frame_pool.put(np.ones((8, 8), dtype=np.uint8))
+    assert first.slot != second.slot
+    assert first.get_array().sum() == 0
+    assert second.get_array().sum() == 64
+
+
+def test_release_slots(frame_pool: SharedFramePool) -> None:
+    frame = np.zeros((8, 8), dtype=np.uint8)
+    shared_frame = frame_pool.put(frame)
+    frame_pool.put(frame)
+    assert frame_pool.free_slots == 0
+    with pytest.raises(ValueError):
+        frame_pool.put(frame)
+
+    frame_pool.release(shared_frame)
+    assert frame_pool.free_slots == 1
+    assert frame_pool.put(frame).slot == shared_frame.slot
+
+
+def test_frame_too_large(frame_pool: SharedFramePool) -> None:
+    frame = np.zeros((8, 9), dtype=np.uint8)
+    assert not frame_pool.can_store(frame)
+    with pytest.raises(ValueError):
+        frame_pool.put(frame)
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import time
+from itertools import islice
+from math import inf
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import MULTI_MARKER_IDS, MultiMarkerCamera
+from zoloto.cameras.marker import MarkerCamera
+from zoloto.cameras.synthetic import SyntheticSceneCamera
+from zoloto.marker_type import MarkerType
+from zoloto.stats import (
+    STAGES,
+    CameraStats,
+    CaptureTimestamp,
+    LatencyHistogram,
+    StageRecord,
+)
+
+
+def test_record() -> None:
+    stats = CameraStats()
+    stats.record("detect", 0.5, 2)
+    stats.record("detect", 1.5, 3)
+    assert stats["detect"].count == 2
+    assert stats["detect"].total_duration == 2
+    assert stats["detect"].total_size == 5
+    assert stats["detect"].mean_duration == 1
+    assert stats["capture"].count == 0
+    assert stats["capture"].mean_duration == 0
+
+
+def test_percentiles_use_window() -> None:
+    stats = CameraStats(window=10)
+    for duration in range(100):
+        stats.record("pose", float(duration))
+    assert stats["pose"].count == 100
+    assert len(stats["pose"].durations) == 10
+    assert stats["pose"].percentile(0) == 90
+    assert stats["pose"].percentile(100) == 99
+    assert stats["pose"].mean_duration == 49.5
+
+
+def test_empty_percentile() -> None:
+    assert CameraStats()["capture"].percentile(50) == 0
+
+
+def test_invalid_window() -> None:
+    with pytest.raises(ValueError):
+        CameraStats(window=0)
+
+
+def test_unknown_stage() -> None:
+    with pytest.raises(KeyError):
+        CameraStats().record("unknown", 1)
+
+
+def test_time() -> None:
+    stats = CameraStats()
+    with stats.time("markers", size=1) as timer:
+        timer.size += 1
+    assert stats["markers"].count == 1
+    assert stats["markers"].total_size == 2
+    assert stats["markers"].total_duration > 0
+
+
+def test_time_records_on_error() -> None:
+    stats = CameraStats()
+    with pytest.raises(RuntimeError):
+        with stats.time("capture"):
+            raise RuntimeError()
+    assert stats["capture"].count == 1
+
+
+def test_callback() -> None:
+    records: list[StageRecord] = []
+    stats = CameraStats(callback=records.append)
+    stats.record("detect", 0.5, 2)
+    assert records == [StageRecord("detect", 0.5, 2)]
+
+
+def test_reset() -> None:
+    stats = CameraStats()
+    stats.record("detect", 0.5, 2)
+    stats.reset()
+    assert stats["detect"].count == 0
+
+
+def test_as_dict() -> None:
+    stats = CameraStats()
+    stats.record("detect", 0.5, 2)
+    stats_dict = stats.as_dict()
+    assert set(stats_dict) == set(STAGES) | {"latency"}
+    assert stats_dict["detect"]["count"] == 1
+    assert stats_dict["detect"]["p50_duration"] == 0.5
+
+
+def test_disabled_by_default(marker_camera: MarkerCamera) -> None:
+    assert marker_camera.stats is None
+    list(marker_camera.process_frame())
+    assert marker_camera.stats is None
+
+
+def test_enable_stats(marker_camera: MarkerCamera) -> None:
+    stats = marker_camera.enable_stats(window=5)
+    assert marker_camera.stats is stats
+    assert stats.window == 5
+    marker_camera.disable_stats()
+    assert marker_camera.stats is None
+
+
+def test_process_frame_stats(multi_marker_camera: MultiMarkerCamera) -> None:
+    stats = multi_marker_camera.enable_stats()
+    markers = list(multi_marker_camera.process_frame())
+    for marker in markers:
+        marker.cartesian
+
+    height, width = multi_marker_camera.capture_frame().shape[:2]
+    assert stats["capture"].count == 1
+    assert stats["capture"].total_size == width * height
+    assert stats["detect"].count == 1
+    assert stats["detect"].total_size == len(MULTI_MARKER_IDS)
+    # Poses are estimated once for the whole frame
+    assert stats["pose"].count == 1
+    assert stats["pose"].total_size == len(MULTI_MARKER_IDS)
+    assert stats["markers"].count == 1
+    assert stats["markers"].total_size == len(MULTI_MARKER_IDS)
+
+
+def test_process_frame_stats_without_pose(
+    multi_marker_camera: MultiMarkerCamera,
+) -> None:
+    stats = multi_marker_camera.enable_stats()
+    list(multi_marker_camera.process_frame())
+    assert stats["pose"].count == 0
+    assert stats["markers"].count == 1
+
+
+def test_process_frame_batch_stats(multi_marker_camera: MultiMarkerCamera) -> None:
+    stats = multi_marker_camera.enable_stats()
+    batch = multi_marker_camera.process_frame_batch()
+    assert stats["pose"].count == 0
+    batch.tvecs
+    batch.tvecs
+    assert stats["pose"].count == 1
+    assert stats["pose"].total_size == len(MULTI_MARKER_IDS)
+
+
+def test_process_frame_eager_stats(multi_marker_camera: MultiMarkerCamera) -> None:
+    stats = multi_marker_camera.enable_stats()
+    list(multi_marker_camera.process_frame_eager())
+    assert stats["capture"].count == 1
+    assert stats["detect"].count == 1
+    assert stats["pose"].count == 1
+    assert stats["markers"].count == 1
+    assert stats["markers"].total_size == len(MULTI_MARKER_IDS)
+
+
+def test_shared_detection_is_only_timed_once(marker_camera: MarkerCamera) -> None:
+    stats = marker_camera.enable_stats()
+    detection = marker_camera.detect()
+    list(marker_camera.process_frame(detection=detection))
+    marker_camera.get_visible_markers(detection=detection)
+    assert stats["capture"].count == 1
+    assert stats["detect"].count == 1
+
+
+def test_save_frame_stats(marker_camera: MarkerCamera, temp_image_file: Path) -> None:
+    stats = marker_camera.enable_stats()
+    marker_camera.save_frame(temp_image_file)
+    assert stats["capture"].count == 1
+    assert stats["detect"].count == 0
+
+
+def test_iteration_stats() -> None:
+    camera = SyntheticSceneCamera(
+        marker_type=MarkerType.ARUCO_6X6, resolution=(320, 240)
+    )
+    stats = camera.enable_stats()
+    list(islice(camera, 2))
+    assert stats["capture"].count == 2
+    assert stats["capture"].total_size == 2 * 320 * 240
+
+
+def test_capture_timestamp_age() -> None:
+    assert CaptureTimestamp(10).get_age(12.5) == 2.5
+    assert CaptureTimestamp(time.monotonic()).get_age() >= 0
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram([0.1, 0.2, 0.5])
+    for latency in [0.05, 0.1, 0.15, 0.3, 0.4, 2]:
+        histogram.record(latency)
+    assert histogram.get_buckets() == [(0.1, 2), (0.2, 1), (0.5, 2), (inf, 1)]
+    assert histogram.count == 6
+    assert histogram.mean == pytest.approx(0.5)
+    assert histogram.max == 2
+    assert histogram.percentile(0) == 0.1
+    assert histogram.percentile(50) == 0.2
+    assert histogram.percentile(80) == 0.5
+    assert histogram.percentile(100) == 2
+
+
+def test_latency_percentile_is_at_most_max() -> None:
+    histogram = LatencyHistogram([0.1, 0.2])
+    histogram.record(0.15)
+    assert histogram.percentile(50) == 0.15
+
+
+def test_empty_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.mean == 0
+    assert histogram.percentile(99) == 0
+
+
+@pytest.mark.parametrize("bounds", [[], [0.2, 0.1], [0.1, 0.1]])
+def test_invalid_latency_buckets(bounds: list[float]) -> None:
+    with pytest.raises(ValueError):
+        LatencyHistogram(bounds)
+
+
+def test_record_latency() -> None:
+    stats = CameraStats(latency_buckets=[1, 10])
+    stats.record_latency(CaptureTimestamp(time.monotonic() - 5))
+    assert stats.latency.get_buckets() == [(1, 0), (10, 1), (inf, 0)]
+    assert stats.as_dict()["latency"]["count"] == 1
+    stats.reset()
+    assert stats.latency.count == 0
+    assert stats.latency.bounds == (1, 10)
+
+
+def test_captured_frames_are_timestamped(marker_camera: MarkerCamera) -> None:
+    assert marker_camera.last_capture_timestamp is None
+    before = time.monotonic()
+    detection = marker_camera.detect()
+    assert detection.timestamp is not None
+    assert detection.timestamp == marker_camera.last_capture_timestamp
+    assert before <= detection.timestamp.monotonic <= time.monotonic()
+    assert detection.timestamp.device is None
+
+    (marker,) = marker_camera.process_frame(detection=detection)
+    assert marker.timestamp == detection.timestamp
+
+
+def test_captured_frame_keeps_timestamp(marker_camera: MarkerCamera) -> None:
+    frame = marker_camera._capture_frame()
+    timestamp = marker_camera.last_capture_timestamp
+    assert marker_camera.detect(frame=frame).timestamp == timestamp
+    (marker,) = marker_camera.process_frame(frame=frame)
+    assert marker.timestamp == timestamp
+
+
+def test_unknown_frames_arent_timestamped(marker_camera: MarkerCamera) -> None:
+    frame = marker_camera.capture_frame()
+    assert marker_camera.detect(frame=frame).timestamp is None
+    (marker,) = marker_camera.process_frame(frame=frame)
+    assert marker.timestamp is None
+
+
+def test_marker_timestamps(multi_marker_camera: MultiMarkerCamera) -> None:
+    for process_frame in [
+        multi_marker_camera.process_frame,
+        multi_marker_camera.process_frame_eager,
+        multi_marker_camera.process_frame_batch,
+    ]:
+        markers = list(process_frame())
+        assert len(markers) == len(MULTI_MARKER_IDS)
+        for marker in markers:
+            assert marker.timestamp == multi_marker_camera.last_capture_timestamp
+
+    batch = multi_marker_camera.process_frame_batch()
+    assert batch.timestamp == multi_marker_camera.last_capture_timestamp
+
+
+def test_latency_stats(multi_marker_camera: MultiMarkerCamera) -> None:
+    stats = multi_marker_camera.enable_stats()
+    list(multi_marker_camera.process_frame())
+    list(multi_marker_camera.process_frame_eager())
+    multi_marker_camera.process_frame_batch()
+    assert stats.latency.count == 3
+    assert stats.latency.max > 0
+
+    # The latency of frames which weren't captured isn't known
+    list(multi_marker_camera.process_frame(frame=multi_marker_camera.capture_frame()))
+    assert stats.latency.count == 3
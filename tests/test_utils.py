@@ -3,8 +3,9 @@ from __future__ import annotations
 from unittest import TestCase
 
 import pytest
+from pytest_mock.plugin import MockerFixture
 
-from zoloto.utils import cached_method, parse_ranges
+from zoloto.utils import cached_method, init_worker_process, parse_ranges
 
 
 class CachedMethodTestCase(TestCase):
@@ -38,3 +39,9 @@ def test_parse_ranges(case: tuple) -> None:
     range_str, expected = case
     actual = parse_ranges(range_str)
     assert actual == expected
+
+
+def test_init_worker_process(mocker: MockerFixture) -> None:
+    set_num_threads = mocker.patch("cv2.setNumThreads")
+    init_worker_process()
+    set_num_threads.assert_called_once_with(1)
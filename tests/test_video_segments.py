@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import pytest
+
+from tests.conftest import NUMBERED_VIDEO_FRAME_COUNT
+from zoloto.marker_type import MarkerType
+from zoloto.video_segments import process_video_segments, split_segments
+
+
+@pytest.mark.parametrize("frame_count", [0, 1, 10, 23, 100])
+@pytest.mark.parametrize("segment_length", [1, 3, 4, 50])
+@pytest.mark.parametrize("stride", [1, 3])
+def test_split_segments(frame_count: int, segment_length: int, stride: int) -> None:
+    segments = split_segments(frame_count, segment_length, stride=stride)
+    assert all(1 <= len(segment) <= segment_length for segment in segments)
+    assert [i for segment in segments for i in segment] == list(
+        range(0, frame_count, stride)
+    )
+    for segment in segments:
+        assert segment.step == stride
+        assert segment.start % stride == 0
+
+
+def test_split_segments_requires_a_segment() -> None:
+    with pytest.raises(ValueError):
+        split_segments(10, 0)
+
+
+@pytest.mark.parametrize("stride", [1, 2])
+@pytest.mark.parametrize("max_pending", [1, 3])
+def test_process_video_segments(
+    numbered_video_file: Path, stride: int, max_pending: int
+) -> None:
+    results = list(
+        process_video_segments(
+            numbered_video_file,
+            stride=stride,
+            workers=2,
+            segment_length=4,
+            max_pending=max_pending,
+            marker_type=MarkerType.ARUCO_6X6,
+            marker_size=100,
+        )
+    )
+    expected_frames = list(range(0, NUMBERED_VIDEO_FRAME_COUNT, stride))
+    assert [frame_index for frame_index, _ in results] == expected_frames
+    assert [[m["id"] for m in markers] for _, markers in results] == [
+        [frame_index] for frame_index in expected_frames
+    ]
+
+
+def test_process_video_segments_default_segments(numbered_video_file: Path) -> None:
+    results = process_video_segments(
+        numbered_video_file,
+        workers=2,
+        marker_type=MarkerType.ARUCO_6X6,
+        marker_size=100,
+    )
+    assert [frame_index for frame_index, _ in results] == list(
+        range(NUMBERED_VIDEO_FRAME_COUNT)
+    )
+
+
+def test_process_video_segments_invalid_max_pending(
+    numbered_video_file: Path,
+) -> None:
+    with pytest.raises(ValueError):
+        list(
+            process_video_segments(
+                numbered_video_file,
+                max_pending=0,
+                marker_type=MarkerType.ARUCO_6X6,
+                marker_size=100,
+            )
+        )
+
+
+def test_process_video_segments_annotated(
+    numbered_video_file: Path, tmp_path: Path
+) -> None:
+    annotated_path = tmp_path / "annotated.avi"
+    results = list(
+        process_video_segments(
+            numbered_video_file,
+            workers=2,
+            segment_length=5,
+            annotated_path=annotated_path,
+            fourcc="MJPG",
+            marker_type=MarkerType.ARUCO_6X6,
+            marker_size=100,
+        )
+    )
+    assert len(results) == NUMBERED_VIDEO_FRAME_COUNT
+
+    annotated_capture = cv2.VideoCapture(str(annotated_path))
+    frame_count = 0
+    while annotated_capture.read()[0]:
+        frame_count += 1
+    annotated_capture.release()
+    assert frame_count == NUMBERED_VIDEO_FRAME_COUNT
@@ -40,7 +40,7 @@ def get_fake_calibration_parameters() -> CalibrationParameters:
     HACK: Generate fake calibration parameters
     """
 
-    dictionary = aruco.getPredefinedDictionary(MarkerType.ARUCO_6X6)
+    dictionary = MarkerType.ARUCO_6X6.dictionary
     seen_corners = []
     seen_ids = []
     image_size = (200, 200)
@@ -1,31 +1,44 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from itertools import groupby
 from pathlib import Path
-from typing import Any, Generator, TypeVar, cast
+from time import monotonic, perf_counter
+from typing import Any, Callable, Generator, Iterator, Sequence, TypeVar, cast
 
 import cv2
+import numpy as np
 from numpy.typing import NDArray
 
 from zoloto.calibration import parse_calibration_file
+from zoloto.detection import Detection, RawCorners, RawIdsAndCorners
+from zoloto.detector_params import DetectorProfile
 from zoloto.exceptions import MissingCalibrationsError
-from zoloto.marker import EagerMarker, Marker, UncalibratedMarker
+from zoloto.marker import EagerMarker, Marker, MarkerBatch, UncalibratedMarker
 from zoloto.marker_type import MarkerType
+from zoloto.pose import Corners, PoseBatch, PoseCache, estimate_poses
+from zoloto.stats import LATENCY_BUCKETS, CameraStats, CaptureTimestamp, StageRecord
 
 T = TypeVar("T", bound="BaseCamera")
+M = TypeVar("M")
 
 
 class BaseCamera(ABC):
+    stats: CameraStats | None = None
+    pose_cache: PoseCache | None = None
+    last_capture_timestamp: CaptureTimestamp | None = None
+    _last_frame: NDArray | None = None
+
     def __init__(
         self,
         *,
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
     ) -> None:
         self.marker_type = marker_type
-        self.marker_dictionary = cv2.aruco.getPredefinedDictionary(self.marker_type)
+        self.detector_profile = detector_profile
+        self.marker_dictionary = self.marker_type.dictionary
         self._marker_size = marker_size
         self.detector_params = self.get_detector_params()
 
@@ -35,13 +48,11 @@ class BaseCamera(ABC):
 
     def get_detector_params(self) -> cv2.aruco_DetectorParameters:
         """
-        Note: We modify the default parameters slightly to improve detection
-        on markers with hard borders (like the ones generated from
-        `zoloto marker-pdfs`)
+        Note: The parameters come from the camera's `detector_profile`, which
+        modify the defaults slightly to improve detection on markers with hard
+        borders (like the ones generated from `zoloto marker-pdfs`)
         """
-        parameters = cv2.aruco.DetectorParameters_create()
-        parameters.minMarkerDistanceRate = 0.035
-        return parameters
+        return self.detector_profile.get_detector_params()
 
     def get_marker_size(self, marker_id: int) -> int:
         if self._marker_size is None:
@@ -54,33 +65,152 @@ class BaseCamera(ABC):
     def capture_frame(self) -> NDArray:  # pragma: nocover
         raise NotImplementedError()
 
+    def enable_stats(
+        self,
+        *,
+        window: int = 1000,
+        callback: Callable[[StageRecord], None] | None = None,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> CameraStats:
+        """
+        Start timing each stage of capturing and processing frames.
+        """
+        self.stats = CameraStats(
+            window=window, callback=callback, latency_buckets=latency_buckets
+        )
+        return self.stats
+
+    def disable_stats(self) -> None:
+        self.stats = None
+
+    def enable_pose_cache(self, *, epsilon: float = 0.5) -> PoseCache:
+        """
+        Reuse the poses of markers which haven't moved since the previous
+        frame, and refine the poses of those which have.
+        """
+        self.pose_cache = PoseCache(epsilon=epsilon)
+        return self.pose_cache
+
+    def disable_pose_cache(self) -> None:
+        self.pose_cache = None
+
+    def _get_capture_timestamp(self) -> CaptureTimestamp:
+        """
+        Get the timestamp of the frame which was just captured.
+        """
+        return CaptureTimestamp(monotonic())
+
+    def _capture_frame(self) -> NDArray:
+        if self.stats is None:
+            frame = self.capture_frame()
+        else:
+            with self.stats.time("capture") as timer:
+                frame = self.capture_frame()
+                timer.size = frame.shape[0] * frame.shape[1] if frame.ndim >= 2 else 0
+        self.last_capture_timestamp = self._get_capture_timestamp()
+        self._last_frame = frame
+        return frame
+
+    def _get_frame_timestamp(self, frame: NDArray) -> CaptureTimestamp | None:
+        # Only the most recently captured frame is known, which covers frames
+        # passed back in whilst iterating over the camera
+        if frame is self._last_frame:
+            return self.last_capture_timestamp
+        return None
+
+    def _record_latency(self, timestamp: CaptureTimestamp | None) -> None:
+        if self.stats is not None and timestamp is not None:
+            self.stats.record_latency(timestamp)
+
+    def _record_markers(
+        self, markers: Iterator[M], timestamp: CaptureTimestamp | None = None
+    ) -> Iterator[M]:
+        if self.stats is None:
+            return markers
+        return self._time_markers(markers, self.stats, timestamp)
+
+    @staticmethod
+    def _time_markers(
+        markers: Iterator[M], stats: CameraStats, timestamp: CaptureTimestamp | None
+    ) -> Generator[M, None, None]:
+        # Markers are created lazily, so only time creating them, not using them
+        duration = 0.0
+        count = 0
+        try:
+            while True:
+                start = perf_counter()
+                marker = next(markers, None)
+                duration += perf_counter() - start
+                if marker is None:
+                    break
+                count += 1
+                yield marker
+        finally:
+            stats.record("markers", duration, count)
+            if timestamp is not None:
+                stats.record_latency(timestamp)
+
     def save_frame(
-        self, filename: Path, *, annotate: bool = False, frame: NDArray | None = None
+        self,
+        filename: Path,
+        *,
+        annotate: bool = False,
+        frame: NDArray | None = None,
+        detection: Detection | None = None,
     ) -> NDArray:
-        if frame is None:
-            frame = self.capture_frame()
+        if detection is not None:
+            frame = detection.frame
+        elif frame is None:
+            frame = self._capture_frame()
         if annotate:
-            self._annotate_frame(frame)
+            self._annotate_frame(frame, detection=detection)
         cv2.imwrite(str(filename), frame)
         return frame
 
-    def _annotate_frame(self, frame: NDArray) -> None:
-        ids, corners = self._get_raw_ids_and_corners(frame)
-        if corners:
+    def _annotate_frame(
+        self, frame: NDArray, *, detection: Detection | None = None
+    ) -> None:
+        if detection is None:
+            ids, corners = self._get_raw_ids_and_corners(frame)
+        else:
+            ids, corners = detection.marker_ids, detection.corners
+        if len(corners):
             cv2.aruco.drawDetectedMarkers(frame, corners, ids)
 
-    def _get_raw_ids_and_corners(self, frame: NDArray) -> tuple[NDArray, NDArray]:
+    def detect(self, *, frame: NDArray | None = None) -> Detection:
+        """
+        Detect the markers in a frame.
+
+        The result can be passed to other methods (eg `process_frame` and
+        `save_frame`) to share the detection between them.
+        """
+        if frame is None:
+            frame = self._capture_frame()
+        timestamp = self._get_frame_timestamp(frame)
+        if self.stats is None:
+            return Detection(frame, *self._get_raw_ids_and_corners(frame), timestamp)
+        with self.stats.time("detect") as timer:
+            ids, corners = self._get_raw_ids_and_corners(frame)
+            timer.size = 0 if ids is None else len(ids)
+        return Detection(frame, ids, corners, timestamp)
+
+    def _get_raw_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
         corners, ids, _ = cv2.aruco.detectMarkers(
             frame, self.marker_dictionary, parameters=self.detector_params
         )
         return ids, corners
 
     def _get_ids_and_corners(
-        self, frame: NDArray | None = None
+        self, frame: NDArray | None = None, *, detection: Detection | None = None
+    ) -> tuple[list[int], list[NDArray]]:
+        if detection is None:
+            detection = self.detect(frame=frame)
+        return self._parse_raw_ids_and_corners(detection.marker_ids, detection.corners)
+
+    @staticmethod
+    def _parse_raw_ids_and_corners(
+        marker_ids: NDArray | None, corners: RawCorners
     ) -> tuple[list[int], list[NDArray]]:
-        if frame is None:
-            frame = self.capture_frame()
-        marker_ids, corners = self._get_raw_ids_and_corners(frame)
         if marker_ids is None:
             return [], []
         return [marker_id[0] for marker_id in marker_ids], [c[0] for c in corners]
@@ -89,10 +219,18 @@ class BaseCamera(ABC):
         self,
         marker_id: int,
         corners: list[NDArray],
+        *,
+        pose_batch: PoseBatch | None = None,
+        batch_index: int = 0,
+        timestamp: CaptureTimestamp | None = None,
     ) -> UncalibratedMarker | Marker:
         if self.calibration_params is None:
             return UncalibratedMarker(
-                marker_id, corners, self.get_marker_size(marker_id), self.marker_type
+                marker_id,
+                corners,
+                self.get_marker_size(marker_id),
+                self.marker_type,
+                timestamp=timestamp,
             )
         return Marker(
             marker_id,
@@ -100,6 +238,9 @@ class BaseCamera(ABC):
             self.get_marker_size(marker_id),
             self.marker_type,
             self.calibration_params,
+            pose_batch=pose_batch,
+            batch_index=batch_index,
+            timestamp=timestamp,
         )
 
     def _get_eager_marker(
@@ -109,44 +250,136 @@ class BaseCamera(ABC):
         size: int,
         tvec: NDArray,
         rvec: NDArray,
+        *,
+        timestamp: CaptureTimestamp | None = None,
     ) -> EagerMarker:
-        return EagerMarker(marker_id, corners, size, self.marker_type, (rvec, tvec))
+        return EagerMarker(
+            marker_id,
+            corners,
+            size,
+            self.marker_type,
+            (rvec, tvec),
+            timestamp=timestamp,
+        )
 
     def process_frame(
-        self, *, frame: NDArray | None = None
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
     ) -> Generator[UncalibratedMarker | Marker, None, None]:
-        ids, corners = self._get_ids_and_corners(frame)
-        for marker_corners, marker_id in zip(corners, ids):
-            yield self._get_marker(int(marker_id), cast(list, marker_corners))
+        if detection is None:
+            detection = self.detect(frame=frame)
+        ids, corners = self._get_ids_and_corners(detection=detection)
+        yield from self._record_markers(
+            self._get_markers(ids, corners, timestamp=detection.timestamp),
+            detection.timestamp,
+        )
+
+    def _get_pose_batch(
+        self, ids: list[int], corners: Corners, sizes: list[int]
+    ) -> PoseBatch | None:
+        """
+        Get the poses of the markers in a frame, if they can be known.
+        """
+        if self.calibration_params is None:
+            return None
+        # Share pose estimation between all markers in the frame
+        return PoseBatch(
+            corners,
+            sizes,
+            self.calibration_params,
+            stats=self.stats,
+            ids=ids,
+            pose_cache=self.pose_cache,
+        )
+
+    def _get_markers(
+        self,
+        ids: list[int],
+        corners: list[NDArray],
+        *,
+        timestamp: CaptureTimestamp | None = None,
+    ) -> Generator[UncalibratedMarker | Marker, None, None]:
+        pose_batch = self._get_pose_batch(
+            ids, corners, [self.get_marker_size(int(marker_id)) for marker_id in ids]
+        )
+        for batch_index, (marker_corners, marker_id) in enumerate(zip(corners, ids)):
+            yield self._get_marker(
+                int(marker_id),
+                cast(list, marker_corners),
+                pose_batch=pose_batch,
+                batch_index=batch_index,
+                timestamp=timestamp,
+            )
+
+    def process_frame_batch(
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
+    ) -> MarkerBatch:
+        """
+        Detect the markers in a frame, returning them as arrays rather than
+        individual marker objects.
+        """
+        if detection is None:
+            detection = self.detect(frame=frame)
+        ids, corners = self._get_ids_and_corners(detection=detection)
+        corners_array = np.array(corners, dtype=np.float32).reshape(-1, 4, 2)
+        sizes = [self.get_marker_size(int(marker_id)) for marker_id in ids]
+        batch = MarkerBatch(
+            np.array(ids, dtype=int),
+            corners_array,
+            np.array(sizes, dtype=int),
+            self.marker_type,
+            self.calibration_params,
+            timestamp=detection.timestamp,
+            pose_batch=self._get_pose_batch(ids, corners_array, sizes),
+        )
+        self._record_latency(detection.timestamp)
+        return batch
+
+    def _estimate_poses(
+        self, ids: list[int], corners: list[NDArray], sizes: list[int]
+    ) -> tuple[NDArray, NDArray]:
+        if self.calibration_params is None:
+            raise MissingCalibrationsError()
+        if self.pose_cache is None:
+            return estimate_poses(corners, sizes, self.calibration_params)
+        return self.pose_cache.estimate_poses(
+            ids, corners, sizes, self.calibration_params
+        )
 
     def process_frame_eager(
-        self, *, frame: NDArray | None = None
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
     ) -> Generator[EagerMarker, None, None]:
         if self.calibration_params is None:
             raise MissingCalibrationsError()
-        ids, corners = self._get_ids_and_corners(frame)
-
-        def get_marker_size(id_and_corners: tuple[int, NDArray]) -> int:
-            return self.get_marker_size(id_and_corners[0])
-
-        sorted_corners = sorted(zip(ids, corners), key=get_marker_size)
-        for size, ids_and_corners in groupby(sorted_corners, get_marker_size):
-            size_ids, size_corners = zip(*ids_and_corners)
-            rvecs, tvecs, _ = cv2.aruco.estimatePoseSingleMarkers(
-                size_corners,
-                size,
-                self.calibration_params.camera_matrix,
-                self.calibration_params.distance_coefficients,
-            )
-            for marker_id, marker_corners, tvec, rvec in zip(
-                size_ids, size_corners, tvecs, rvecs
-            ):
-                yield self._get_eager_marker(
-                    int(marker_id), marker_corners, size, tvec[0], rvec[0]
+        if detection is None:
+            detection = self.detect(frame=frame)
+        ids, corners = self._get_ids_and_corners(detection=detection)
+        sizes = [self.get_marker_size(int(marker_id)) for marker_id in ids]
+        if self.stats is None:
+            rvecs, tvecs = self._estimate_poses(ids, corners, sizes)
+        else:
+            with self.stats.time("pose", size=len(ids)):
+                rvecs, tvecs = self._estimate_poses(ids, corners, sizes)
+        yield from self._record_markers(
+            (
+                self._get_eager_marker(
+                    int(marker_id),
+                    cast(list, marker_corners),
+                    size,
+                    tvec,
+                    rvec,
+                    timestamp=detection.timestamp,
                 )
+                for marker_id, marker_corners, size, tvec, rvec in zip(
+                    ids, corners, sizes, tvecs, rvecs
+                )
+            ),
+            detection.timestamp,
+        )
 
-    def get_visible_markers(self, *, frame: NDArray | None = None) -> list[int]:
-        ids, _ = self._get_ids_and_corners(frame)
+    def get_visible_markers(
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
+    ) -> list[int]:
+        ids, _ = self._get_ids_and_corners(frame, detection=detection)
         return [int(i) for i in ids]
 
     def close(self) -> None:
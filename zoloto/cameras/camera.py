@@ -6,6 +6,7 @@ from typing import Any, Generator
 from cv2 import CAP_PROP_BUFFERSIZE, VideoCapture
 from numpy.typing import NDArray
 
+from zoloto.detector_params import DetectorProfile
 from zoloto.marker_type import MarkerType
 
 from .base import BaseCamera
@@ -39,12 +40,15 @@ class Camera(VideoCaptureMixin, IterableCameraMixin, BaseCamera, ViewableCameraM
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
         resolution: tuple[int, int] | None = None,
+        threaded: bool = False,
     ) -> None:
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
             calibration_file=calibration_file,
+            detector_profile=detector_profile,
         )
         self.camera_id = camera_id
         self.video_capture = self.get_video_capture(self.camera_id)
@@ -59,6 +63,9 @@ class Camera(VideoCaptureMixin, IterableCameraMixin, BaseCamera, ViewableCameraM
                 override=resolution is not None,
             )
 
+        if threaded:
+            self.start_capture_thread(drop_frames=True)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.camera_id}>"
 
@@ -74,12 +81,14 @@ class Camera(VideoCaptureMixin, IterableCameraMixin, BaseCamera, ViewableCameraM
         return get_video_capture_resolution(self.video_capture)
 
     def capture_frame(self) -> NDArray:
-        # Hack: Double capture frames to fill buffer.
-        self.video_capture.read()
+        if self._capture_thread is None:
+            # Hack: Double capture frames to fill buffer.
+            self.video_capture.read()
         return super().capture_frame()
 
     def close(self) -> None:
         super().close()
+        self.stop_capture_thread()
         self.video_capture.release()
 
     @classmethod
@@ -102,12 +111,14 @@ class SnapshotCamera(VideoCaptureMixin, BaseCamera):
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
         resolution: tuple[int, int] | None = None,
     ) -> None:
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
             calibration_file=calibration_file,
+            detector_profile=detector_profile,
         )
         self.camera_id = camera_id
         self._resolution = resolution
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterable
 
-from cv2 import VideoCapture, imread
+import numpy as np
+from cv2 import (
+    CAP_PROP_FRAME_COUNT,
+    CAP_PROP_POS_FRAMES,
+    CAP_PROP_POS_MSEC,
+    VideoCapture,
+    imread,
+)
 from numpy.typing import NDArray
 
+from zoloto.detector_params import DetectorProfile
 from zoloto.exceptions import CameraReadError
 from zoloto.marker_type import MarkerType
 
@@ -16,6 +25,8 @@ from .utils import (
     validate_calibrated_video_capture_resolution,
 )
 
+IMAGE_SUFFIXES = frozenset({".bmp", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"})
+
 
 class ImageFileCamera(BaseCamera):
     def __init__(
@@ -25,12 +36,14 @@ class ImageFileCamera(BaseCamera):
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
     ) -> None:
         self.image_path = image_path
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
             calibration_file=calibration_file,
+            detector_profile=detector_profile,
         )
 
     def __repr__(self) -> str:
@@ -50,30 +63,282 @@ class VideoFileCamera(
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+        threaded: bool = False,
+        start: int = 0,
+        stop: int | None = None,
+        stride: int = 1,
     ) -> None:
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
             calibration_file=calibration_file,
+            detector_profile=detector_profile,
         )
         self.video_path = video_path
         self.video_capture = VideoCapture(str(self.video_path))
 
+        if start < 0 or (stop is not None and stop < start):
+            raise ValueError("Frame range must not be negative")
+        if stride < 1:
+            raise ValueError("Stride must be at least 1")
+        self.stop = stop
+        self.stride = stride
+        self._position = 0
+        self._frame_timestamp: float | None = None
+
         if self.calibration_params is not None:
             validate_calibrated_video_capture_resolution(
                 self.video_capture, self.calibration_params, override=False
             )
 
+        if start:
+            self.seek(start)
+
+        if threaded:
+            # Files should be read in full, so never drop frames
+            self.start_capture_thread(drop_frames=False)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.video_path}>"
 
     def close(self) -> None:
         super().close()
+        self.stop_capture_thread()
         self.video_capture.release()
 
     def get_resolution(self) -> tuple[int, int]:
         return get_video_capture_resolution(self.video_capture)
 
+    @property
+    def frame_count(self) -> int:
+        """
+        The number of frames in the whole video file
+        """
+        return int(self.video_capture.get(CAP_PROP_FRAME_COUNT))
+
+    @property
+    def position(self) -> int:
+        """
+        The index of the next frame to be read (or buffered, when threaded)
+        """
+        return self._position
+
+    def seek(self, frame_index: int) -> None:
+        """
+        Move to a frame in the video, so it's the next one read.
+        """
+        if self._capture_thread is not None:
+            raise ValueError("Cannot seek while a capture thread is running")
+        if frame_index < 0:
+            raise ValueError("Frame index must not be negative")
+        self.video_capture.set(CAP_PROP_POS_FRAMES, frame_index)
+        self._position = frame_index
+
+    def _read_frame(self) -> tuple[bool, NDArray | None]:
+        if self.stop is not None and self._position >= self.stop:
+            return False, None
+        result = self.video_capture.read()
+        self._position += 1
+        # Note the frame's position in the video before skipping past others
+        self._frame_timestamp = self.video_capture.get(CAP_PROP_POS_MSEC) / 1000
+
+        # Skip frames between strides, without retrieving them
+        for _ in range(self.stride - 1):
+            if self.stop is not None and self._position >= self.stop:
+                break
+            self.video_capture.grab()
+            self._position += 1
+        return result
+
+    def _get_device_timestamp(self) -> float | None:
+        return self._frame_timestamp
+
+    def __iter__(self) -> Generator[NDArray, None, None]:
+        try:
+            yield from super().__iter__()
+        except CameraReadError as e:
+            if e.frame is not None:
+                raise
+
+
+def load_frame_stack(stack_path: Path) -> NDArray:
+    """
+    Memory-map a frame stack (a `.npy` file of N x H x W x C frames).
+
+    The file is mapped copy-on-write, so frames can be modified (eg annotated)
+    without changing the file.
+    """
+    frames = np.load(stack_path, mmap_mode="c")
+    if frames.ndim not in {3, 4}:
+        raise ValueError(f"{stack_path} is not a stack of frames")
+    return frames
+
+
+def _open_frame_stack(path: Path, first_frame: NDArray, frame_count: int) -> np.memmap:
+    return np.lib.format.open_memmap(  # type: ignore[no-untyped-call]
+        path,
+        mode="w+",
+        dtype=first_frame.dtype,
+        shape=(frame_count,) + first_frame.shape,
+    )
+
+
+def write_frame_stack(
+    frames: Iterable[NDArray], stack_path: Path, *, frame_count: int
+) -> int:
+    """
+    Write frames to a frame stack, returning the number of frames written.
+
+    `frame_count` is the number of frames expected, which may be an estimate
+    (eg from a video's metadata). If there are fewer frames, the stack is
+    truncated, and if there are more, it's grown to fit them.
+    """
+    frame_iter = iter(frames)
+    first_frame = next(frame_iter, None)
+    if first_frame is None:
+        raise ValueError("There are no frames to write")
+
+    partial_path = stack_path.with_name(stack_path.name + ".partial")
+    grown_path = stack_path.with_name(stack_path.name + ".grown")
+    frame_count = max(frame_count, 1)
+    stack = _open_frame_stack(partial_path, first_frame, frame_count)
+    written = 0
+    try:
+        for frame in chain([first_frame], frame_iter):
+            if frame.shape != first_frame.shape:
+                raise ValueError(
+                    f"Frame {written} has shape {frame.shape}, but the first frame has shape {first_frame.shape}"
+                )
+            if written == frame_count:
+                # There are more frames than expected, so copy them into a
+                # bigger stack, leaving space for more
+                frame_count += max(frame_count // 2, 1)
+                grown_stack = _open_frame_stack(grown_path, first_frame, frame_count)
+                grown_stack[:written] = stack
+                del stack
+                grown_path.replace(partial_path)
+                stack = grown_stack
+            stack[written] = frame
+            written += 1
+
+        if written == frame_count:
+            stack.flush()
+            del stack
+            partial_path.replace(stack_path)
+        else:
+            with stack_path.open("wb") as stack_file:
+                np.save(stack_file, stack[:written])
+    finally:
+        for path in [partial_path, grown_path]:
+            if path.exists():
+                path.unlink()
+    return written
+
+
+def _read_video_frames(video_capture: VideoCapture) -> Generator[NDArray, None, None]:
+    while True:
+        ret, frame = video_capture.read()
+        if not ret or frame is None:
+            break
+        yield frame
+
+
+def convert_to_frame_stack(source_path: Path, stack_path: Path) -> int:
+    """
+    Convert a video file, or a directory of images, into a frame stack.
+
+    Images are read in order of their filenames, and must all be the same size.
+    Returns the number of frames written.
+    """
+    if source_path.is_dir():
+        image_paths = sorted(
+            path
+            for path in source_path.iterdir()
+            if path.suffix.lower() in IMAGE_SUFFIXES and path.is_file()
+        )
+        return write_frame_stack(
+            (imread(str(path)) for path in image_paths),
+            stack_path,
+            frame_count=len(image_paths),
+        )
+
+    video_capture = VideoCapture(str(source_path))
+    try:
+        return write_frame_stack(
+            _read_video_frames(video_capture),
+            stack_path,
+            frame_count=int(video_capture.get(CAP_PROP_FRAME_COUNT)),
+        )
+    finally:
+        video_capture.release()
+
+
+class NpyStackCamera(IterableCameraMixin, BaseCamera, ViewableCameraMixin):
+    """
+    A camera which reads frames from a memory-mapped frame stack.
+
+    Frames are views onto the mapped file, so reading them doesn't copy or
+    decode anything. Use `convert_to_frame_stack` to create a frame stack.
+    """
+
+    def __init__(
+        self,
+        stack_path: Path,
+        *,
+        marker_size: int | None = None,
+        marker_type: MarkerType,
+        calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+    ) -> None:
+        super().__init__(
+            marker_size=marker_size,
+            marker_type=marker_type,
+            calibration_file=calibration_file,
+            detector_profile=detector_profile,
+        )
+        self.stack_path = stack_path
+        self.frames = load_frame_stack(stack_path)
+        self._position = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.stack_path}>"
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, frame_index: int) -> NDArray:
+        return self.frames[frame_index]
+
+    def get_resolution(self) -> tuple[int, int]:
+        return self.frames.shape[2], self.frames.shape[1]
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frames)
+
+    @property
+    def position(self) -> int:
+        """
+        The index of the next frame to be read
+        """
+        return self._position
+
+    def seek(self, frame_index: int) -> None:
+        """
+        Move to a frame in the stack, so it's the next one read.
+        """
+        if not 0 <= frame_index <= len(self.frames):
+            raise ValueError("Frame index is outside the stack")
+        self._position = frame_index
+
+    def capture_frame(self) -> NDArray:
+        if self._position >= len(self.frames):
+            raise CameraReadError(None)
+        frame = self.frames[self._position]
+        self._position += 1
+        return frame
+
     def __iter__(self) -> Generator[NDArray, None, None]:
         try:
             yield from super().__iter__()
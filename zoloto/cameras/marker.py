@@ -4,6 +4,7 @@ import cv2
 from numpy.typing import NDArray
 
 from zoloto.calibration import get_fake_calibration_parameters
+from zoloto.detector_params import DetectorProfile
 from zoloto.marker_type import MarkerType
 
 from .base import BaseCamera
@@ -23,6 +24,7 @@ class MarkerCamera(BaseCamera):
         *,
         marker_type: MarkerType,
         border_size: int = 40,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
     ) -> None:
 
         if marker_id > marker_type.max_id:
@@ -47,6 +49,7 @@ class MarkerCamera(BaseCamera):
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
+            detector_profile=detector_profile,
         )
         self.marker_id = marker_id
         self.border_size = border_size
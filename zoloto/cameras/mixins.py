@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterator
+from collections import deque
+from itertools import combinations
+from threading import Condition, Thread
+from time import monotonic
+from typing import Callable, Deque, Iterator, cast
 
-from cv2 import imshow, waitKey
+import numpy as np
+from cv2 import (
+    CAP_PROP_POS_MSEC,
+    COLOR_BGR2GRAY,
+    INTER_AREA,
+    TERM_CRITERIA_EPS,
+    TERM_CRITERIA_MAX_ITER,
+    cornerSubPix,
+    cvtColor,
+    imshow,
+    resize,
+    waitKey,
+)
 from numpy.typing import NDArray
 
+from zoloto.detection import Detection, RawCorners, RawIdsAndCorners
 from zoloto.exceptions import CameraReadError
+from zoloto.stats import CaptureTimestamp
 
 
 class IterableCameraMixin(ABC):
@@ -16,17 +34,159 @@ class IterableCameraMixin(ABC):
 
     def __iter__(self) -> Iterator[NDArray]:
         while True:
-            frame = self.capture_frame()
+            frame = self._capture_frame()  # type: ignore[attr-defined]
             if not frame.size:
                 break
             yield frame
 
 
+class CaptureThread(Thread):
+    """
+    Continuously reads frames (with a function like `VideoCapture.read`) into a
+    small ring buffer.
+
+    When `drop_frames` is set, the oldest frames are discarded once the buffer
+    is full, and readers are handed the newest frame. Otherwise, the thread
+    waits for space in the buffer, so every frame is read in order.
+
+    Each frame is timestamped with `get_timestamp` as soon as it's read.
+    """
+
+    def __init__(
+        self,
+        read_frame: Callable[[], tuple[bool, NDArray | None]],
+        *,
+        buffer_size: int = 2,
+        drop_frames: bool = True,
+        get_timestamp: Callable[[], CaptureTimestamp] | None = None,
+    ) -> None:
+        super().__init__(daemon=True)
+        if buffer_size < 1:
+            raise ValueError("Buffer size must be at least 1")
+        self.read_frame = read_frame
+        self.buffer_size = buffer_size
+        self.drop_frames = drop_frames
+        self.get_timestamp = get_timestamp or (lambda: CaptureTimestamp(monotonic()))
+        self._frames: Deque[tuple[NDArray, CaptureTimestamp]] = deque(
+            maxlen=buffer_size
+        )
+        self._condition = Condition()
+        self._error: CameraReadError | None = None
+        self._stopped = False
+
+    def _wait_for_space(self) -> bool:
+        with self._condition:
+            while (
+                not self.drop_frames
+                and len(self._frames) >= self.buffer_size
+                and not self._stopped
+            ):
+                self._condition.wait()
+            return not self._stopped
+
+    def run(self) -> None:
+        while self._wait_for_space():
+            ret, frame = self.read_frame()
+            timestamp = self.get_timestamp()
+            with self._condition:
+                if not ret or frame is None:
+                    self._error = CameraReadError(frame)
+                else:
+                    self._frames.append((frame, timestamp))
+                self._condition.notify_all()
+            if self._error is not None:
+                break
+
+    def read(self) -> NDArray:
+        """
+        Get the next frame, waiting for one to be captured if the buffer is empty.
+        """
+        return self.read_timestamped()[0]
+
+    def read_timestamped(self) -> tuple[NDArray, CaptureTimestamp]:
+        """
+        Get the next frame and when it was captured.
+        """
+        with self._condition:
+            while not self._frames and self._error is None and not self._stopped:
+                self._condition.wait()
+            if not self._frames:
+                raise self._error or CameraReadError(None)
+            if self.drop_frames:
+                timestamped_frame = self._frames.pop()
+                self._frames.clear()
+            else:
+                timestamped_frame = self._frames.popleft()
+            self._condition.notify_all()
+            return timestamped_frame
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join()
+
+
 class VideoCaptureMixin(ABC):
+    _capture_thread: CaptureThread | None = None
+    _capture_timestamp: CaptureTimestamp | None = None
+
+    def start_capture_thread(
+        self, *, buffer_size: int = 2, drop_frames: bool = True
+    ) -> None:
+        """
+        Read frames in a background thread, so capturing overlaps with detection.
+        """
+        if self._capture_thread is not None:
+            return
+        self._capture_thread = CaptureThread(
+            self._read_frame,
+            buffer_size=buffer_size,
+            drop_frames=drop_frames,
+            get_timestamp=self._read_timestamp,
+        )
+        self._capture_thread.start()
+
+    def stop_capture_thread(self) -> None:
+        if self._capture_thread is not None:
+            self._capture_thread.stop()
+            self._capture_thread = None
+
+    def _read_frame(self) -> tuple[bool, NDArray | None]:
+        return self.video_capture.read()  # type: ignore[attr-defined]
+
+    def _get_device_timestamp(self) -> float | None:
+        """
+        Get the device's timestamp (in seconds) of the frame which was just read.
+        """
+        timestamp = float(
+            self.video_capture.get(CAP_PROP_POS_MSEC)  # type: ignore[attr-defined]
+        )
+        # Backends without timestamps report 0 (or -1)
+        if timestamp <= 0:
+            return None
+        return timestamp / 1000
+
+    def _read_timestamp(self) -> CaptureTimestamp:
+        return CaptureTimestamp(monotonic(), self._get_device_timestamp())
+
+    def _get_capture_timestamp(self) -> CaptureTimestamp:
+        if self._capture_timestamp is None:
+            return CaptureTimestamp(monotonic())
+        return self._capture_timestamp
+
     def capture_frame(self) -> NDArray:
-        ret, frame = self.video_capture.read()  # type: ignore[attr-defined]
+        if self._capture_thread is not None:
+            (
+                captured_frame,
+                self._capture_timestamp,
+            ) = self._capture_thread.read_timestamped()
+            return captured_frame
+        ret, frame = self._read_frame()
         if not ret or frame is None:
             raise CameraReadError(frame)
+        self._capture_timestamp = self._read_timestamp()
         return frame
 
 
@@ -48,3 +208,243 @@ class ViewableCameraMixin(ABC):
             imshow("camera", frame)
             if waitKey(1) & 0xFF == quit_key:
                 break
+
+
+class TrackingCameraMixin:
+    """
+    Only detect markers close to where they were last seen.
+
+    Detection runs on padded regions around each tracked marker, and the
+    corners are mapped back onto the full frame. The whole frame is scanned
+    every `rescan_interval` frames, and whenever a tracked marker is lost.
+    """
+
+    # Number of frames between full-frame scans
+    rescan_interval = 10
+
+    # Padding around each tracked marker, as a fraction of its size
+    roi_padding = 0.5
+
+    _tracked_ids: NDArray | None = None
+    _tracked_corners: NDArray | None = None
+    _frames_since_rescan = 0
+
+    def reset_tracking(self) -> None:
+        """
+        Forget all tracked markers, so the next frame is fully scanned.
+        """
+        self._tracked_ids = None
+        self._tracked_corners = None
+        self._frames_since_rescan = 0
+
+    def _get_regions_of_interest(
+        self, frame_shape: tuple[int, ...]
+    ) -> list[tuple[int, int, int, int]]:
+        """
+        Get the padded bounding boxes of the tracked markers, merging any which
+        overlap so no marker is detected twice.
+        """
+        height, width = frame_shape[:2]
+        regions = []
+        for corners in cast(NDArray, self._tracked_corners):
+            (min_x, min_y), (max_x, max_y) = corners.min(axis=0), corners.max(axis=0)
+            padding = max(max_x - min_x, max_y - min_y) * self.roi_padding
+            regions.append(
+                (
+                    max(int(min_x - padding), 0),
+                    max(int(min_y - padding), 0),
+                    min(int(max_x + padding) + 1, width),
+                    min(int(max_y + padding) + 1, height),
+                )
+            )
+
+        merged = True
+        while merged:
+            merged = False
+            for i, j in combinations(range(len(regions)), 2):
+                a, b = regions[i], regions[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    regions[i] = (
+                        min(a[0], b[0]),
+                        min(a[1], b[1]),
+                        max(a[2], b[2]),
+                        max(a[3], b[3]),
+                    )
+                    del regions[j]
+                    merged = True
+                    break
+        return regions
+
+    def _get_tracked_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
+        all_ids = []
+        all_corners: list[NDArray] = []
+        for x0, y0, x1, y1 in self._get_regions_of_interest(frame.shape):
+            ids, corners = super()._get_raw_ids_and_corners(  # type: ignore[misc]
+                frame[y0:y1, x0:x1]
+            )
+            if ids is None:
+                continue
+            all_ids.append(ids)
+            all_corners.extend(
+                marker_corners + np.array([x0, y0], dtype=marker_corners.dtype)
+                for marker_corners in corners
+            )
+        if not all_ids:
+            return None, ()
+        return np.concatenate(all_ids), tuple(all_corners)
+
+    def _get_raw_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
+        if self._tracked_ids is not None and (
+            self._frames_since_rescan < self.rescan_interval
+        ):
+            ids, corners = self._get_tracked_ids_and_corners(frame)
+            found_ids = [] if ids is None else sorted(ids.flatten().tolist())
+            if found_ids == sorted(self._tracked_ids.tolist()):
+                self._frames_since_rescan += 1
+                self._update_tracks(ids, corners)
+                return ids, corners
+
+        ids, corners = super()._get_raw_ids_and_corners(frame)  # type: ignore[misc]
+        self._frames_since_rescan = 0
+        self._update_tracks(ids, corners)
+        return ids, corners
+
+    def _update_tracks(self, ids: NDArray | None, corners: RawCorners) -> None:
+        if ids is None:
+            self._tracked_ids = np.empty(0, dtype=int)
+            self._tracked_corners = np.empty((0, 4, 2))
+        else:
+            self._tracked_ids = ids.flatten()
+            self._tracked_corners = np.array(corners).reshape(-1, 4, 2)
+
+
+class CoarseToFineDetectionMixin:
+    """
+    Detect markers on a downscaled copy of the frame, then refine their corners
+    at full resolution.
+
+    Detection is dominated by thresholding the whole frame, which is much
+    cheaper on a smaller image. Corners are refined with sub-pixel accuracy
+    in a small window around each candidate corner.
+    """
+
+    # Factor to scale frames by before detection
+    detection_scale = 0.5
+
+    # Iteration limits for the corner refinement
+    refinement_criteria = (TERM_CRITERIA_EPS + TERM_CRITERIA_MAX_ITER, 30, 0.01)
+
+    def _get_refinement_window(self) -> int:
+        # Large enough to cover the error introduced by downscaling
+        return max(int(np.ceil(1 / self.detection_scale)) + 1, 2)
+
+    def _get_raw_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
+        if not 0 < self.detection_scale <= 1:
+            raise ValueError("detection_scale must be between 0 and 1")
+        if self.detection_scale == 1:
+            return super()._get_raw_ids_and_corners(frame)  # type: ignore[misc]
+
+        small_frame = resize(
+            frame,
+            None,
+            fx=self.detection_scale,
+            fy=self.detection_scale,
+            interpolation=INTER_AREA,
+        )
+        ids, corners = super()._get_raw_ids_and_corners(  # type: ignore[misc]
+            small_frame
+        )
+        if ids is None:
+            return None, ()
+
+        gray_frame = cvtColor(frame, COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        window = self._get_refinement_window()
+        points = (
+            np.concatenate(corners).reshape(-1, 2) + 0.5
+        ) / self.detection_scale - 0.5
+        refined_points = cornerSubPix(
+            gray_frame,
+            points.astype(np.float32),
+            (window, window),
+            (-1, -1),
+            self.refinement_criteria,
+        )
+        return ids, tuple(refined_points.reshape(-1, 1, 4, 2))
+
+
+class MotionGatedDetectionMixin:
+    """
+    Skip detecting markers in frames which haven't changed.
+
+    Each frame is compared against the last frame markers were detected in,
+    using heavily downscaled grayscale copies. When they differ by less than
+    `motion_threshold`, the previous detection is reused (and the detection
+    is tagged as `reused`). Comparing against the last detected frame, rather
+    than the previous frame, means slow changes still trigger detection.
+    """
+
+    # Size (width, height) of the downscaled copies which are compared
+    motion_resolution = (32, 24)
+
+    # Mean absolute difference (in gray levels) below which frames are unchanged
+    motion_threshold = 2.0
+
+    # Maximum number of frames in a row to reuse a detection for
+    max_reuse = 30
+
+    # Whether the most recent detection was reused
+    detection_reused = False
+
+    _motion_reference: NDArray | None = None
+    _gated_ids_and_corners: RawIdsAndCorners | None = None
+    _frames_reused = 0
+
+    def reset_motion_gate(self) -> None:
+        """
+        Forget the previous detection, so markers are detected in the next frame.
+        """
+        self._motion_reference = None
+        self._gated_ids_and_corners = None
+        self._frames_reused = 0
+
+    def _get_motion_thumbnail(self, frame: NDArray) -> NDArray:
+        width, height = self.motion_resolution
+        # Sample the frame sparsely before resizing, keeping a few samples for
+        # each pixel of the thumbnail, which is much cheaper than averaging
+        # every pixel of the frame
+        step = max(
+            min(frame.shape[0] // (height * 4), frame.shape[1] // (width * 4)), 1
+        )
+        thumbnail = resize(
+            frame[::step, ::step], (width, height), interpolation=INTER_AREA
+        )
+        if thumbnail.ndim == 3:
+            thumbnail = cvtColor(thumbnail, COLOR_BGR2GRAY)
+        return thumbnail.astype(np.int16)
+
+    def _get_raw_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
+        thumbnail = self._get_motion_thumbnail(frame)
+        if (
+            self._gated_ids_and_corners is not None
+            and self._motion_reference is not None
+            and self._motion_reference.shape == thumbnail.shape
+            and self._frames_reused < self.max_reuse
+            and np.abs(thumbnail - self._motion_reference).mean()
+            < self.motion_threshold
+        ):
+            self._frames_reused += 1
+            self.detection_reused = True
+            return self._gated_ids_and_corners
+
+        ids_and_corners = super()._get_raw_ids_and_corners(frame)  # type: ignore[misc]
+        self._motion_reference = thumbnail
+        self._gated_ids_and_corners = ids_and_corners
+        self._frames_reused = 0
+        self.detection_reused = False
+        return ids_and_corners
+
+    def detect(self, *, frame: NDArray | None = None) -> Detection:
+        detection: Detection = super().detect(frame=frame)  # type: ignore[misc]
+        if self.detection_reused:
+            return detection._replace(reused=True)
+        return detection
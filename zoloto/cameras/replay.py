@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Generator, Sequence, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from zoloto.calibration import CalibrationParameters
+from zoloto.detection import Detection, RawIdsAndCorners
+from zoloto.detection_log import DetectionLog
+from zoloto.detector_params import DetectorProfile
+from zoloto.exceptions import CameraReadError, MissingCalibrationsError
+from zoloto.marker import EagerMarker
+from zoloto.marker_type import MarkerType
+from zoloto.pose import Corners, PoseBatch, estimate_poses
+from zoloto.stats import CameraStats, CaptureTimestamp
+from zoloto.utils import cached_method
+
+from .base import BaseCamera
+from .file import load_frame_stack
+from .mixins import IterableCameraMixin
+
+
+class RecordedPoseBatch(PoseBatch):
+    """
+    Poses which were estimated when the markers were recorded.
+
+    Markers recorded without a pose (`nan`) have their pose estimated, which
+    needs `calibration_params`.
+    """
+
+    def __init__(
+        self,
+        corners: Corners,
+        sizes: Sequence[int],
+        calibration_params: CalibrationParameters | None,
+        rvecs: NDArray,
+        tvecs: NDArray,
+        *,
+        stats: CameraStats | None = None,
+    ):
+        super().__init__(corners, sizes, calibration_params, stats=stats)
+        self.rvecs = rvecs
+        self.tvecs = tvecs
+
+    @cached_method
+    def get_pose_vectors(self) -> tuple[NDArray, NDArray]:
+        missing = np.isnan(self.rvecs).any(axis=1) | np.isnan(self.tvecs).any(axis=1)
+        if not missing.any():
+            return self.rvecs, self.tvecs
+        if self.calibration_params is None:
+            raise MissingCalibrationsError()
+
+        indices = np.flatnonzero(missing)
+        rvecs, tvecs = np.array(self.rvecs), np.array(self.tvecs)
+        missing_corners = [self.corners[index] for index in indices]
+        missing_sizes = [self.sizes[index] for index in indices]
+        if self.stats is None:
+            rvecs[indices], tvecs[indices] = estimate_poses(
+                missing_corners, missing_sizes, self.calibration_params
+            )
+        else:
+            with self.stats.time("pose", size=len(indices)):
+                rvecs[indices], tvecs[indices] = estimate_poses(
+                    missing_corners, missing_sizes, self.calibration_params
+                )
+        return rvecs, tvecs
+
+
+class ReplayCamera(IterableCameraMixin, BaseCamera):
+    """
+    A camera which replays markers from a detection log, without detecting them.
+
+    Each captured frame moves on to the next frame of the log, and processing
+    it returns the markers which were recorded for that frame. Detections can
+    only be reused until the next frame is captured. Frames are
+    served from `frame_store` (see `NpyStackCamera`) if given, otherwise
+    they're blank.
+
+    By default frames are replayed as fast as possible. Set `speed` to replay
+    at the recorded rate (1) or a multiple of it.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        *,
+        marker_type: MarkerType,
+        calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+        frame_store: Path | None = None,
+        resolution: tuple[int, int] = (1280, 720),
+        speed: float | None = None,
+    ) -> None:
+        super().__init__(
+            marker_type=marker_type,
+            calibration_file=calibration_file,
+            detector_profile=detector_profile,
+        )
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be positive")
+        self.log_path = log_path
+        self.log = DetectionLog(log_path)
+        self.speed = speed
+
+        self.frames: NDArray | None = None
+        if frame_store is not None:
+            self.frames = load_frame_stack(frame_store)
+            frame_indexes = range(len(self.frames))
+        elif len(self.log):
+            frame_indexes = range(
+                int(self.log.frame_indexes[0]), int(self.log.frame_indexes[-1]) + 1
+            )
+        else:
+            frame_indexes = range(0)
+        self.frame_indexes = frame_indexes
+
+        # Rows of the log for each frame
+        self._row_starts = np.searchsorted(
+            self.log.frame_indexes, frame_indexes, side="left"
+        )
+        self._row_stops = np.searchsorted(
+            self.log.frame_indexes, frame_indexes, side="right"
+        )
+
+        width, height = resolution
+        self._blank_frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._blank_frame.flags.writeable = False
+
+        self._position = -1
+        self._rows = slice(0, 0)
+        self._recorded_markers: RawIdsAndCorners = (None, ())
+        self._replay_start: tuple[float, float] | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.log_path}>"
+
+    def get_resolution(self) -> tuple[int, int]:
+        if self.frames is not None:
+            return self.frames.shape[2], self.frames.shape[1]
+        height, width = self._blank_frame.shape[:2]
+        return width, height
+
+    @property
+    def frame_index(self) -> int | None:
+        """
+        The index of the most recently captured frame
+        """
+        if self._position < 0:
+            return None
+        return self.frame_indexes[self._position]
+
+    def get_marker_size(self, marker_id: int) -> int:
+        sizes = self.log.sizes[self._rows][self.log.ids[self._rows] == marker_id]
+        if not len(sizes):
+            return super().get_marker_size(marker_id)
+        return int(sizes[0])
+
+    def _wait_for_frame(self) -> None:
+        if self.speed is None or self._rows.start == self._rows.stop:
+            return
+        timestamp = float(self.log.timestamps[self._rows.start])
+        if self._replay_start is None:
+            self._replay_start = (time.monotonic(), timestamp)
+            return
+        replay_start, recording_start = self._replay_start
+        delay = (
+            replay_start + (timestamp - recording_start) / self.speed - time.monotonic()
+        )
+        if delay > 0:
+            time.sleep(delay)
+
+    def capture_frame(self) -> NDArray:
+        if self._position + 1 >= len(self.frame_indexes):
+            raise CameraReadError(None)
+        self._position += 1
+        self._rows = slice(
+            int(self._row_starts[self._position]),
+            int(self._row_stops[self._position]),
+        )
+        self._recorded_markers = self._read_recorded_markers()
+        self._wait_for_frame()
+        if self.frames is not None:
+            return self.frames[self.frame_indexes[self._position]]
+        return self._blank_frame
+
+    def _get_capture_timestamp(self) -> CaptureTimestamp:
+        # The recorded timestamp stands in for the device's
+        if self._rows.start == self._rows.stop:
+            return CaptureTimestamp(time.monotonic())
+        return CaptureTimestamp(
+            time.monotonic(), float(self.log.timestamps[self._rows.start])
+        )
+
+    def _get_raw_ids_and_corners(self, frame: NDArray) -> RawIdsAndCorners:
+        return self._get_recorded_markers()
+
+    def _get_recorded_markers(self) -> RawIdsAndCorners:
+        """
+        Get the markers recorded for the most recently captured frame.
+        """
+        return self._recorded_markers
+
+    def _read_recorded_markers(self) -> RawIdsAndCorners:
+        ids = self.log.ids[self._rows]
+        if not len(ids):
+            return None, ()
+        return ids.reshape(-1, 1), self.log.corners[self._rows].reshape(-1, 1, 4, 2)
+
+    def _get_ids_and_corners(
+        self, frame: NDArray | None = None, *, detection: Detection | None = None
+    ) -> tuple[list[int], list[NDArray]]:
+        # Poses and sizes come from the rows of the current frame, so can't be
+        # paired with markers from another frame. The recorded markers are
+        # only read once per frame, so detections of this frame share them.
+        if (
+            detection is not None
+            and detection.marker_ids is not None
+            and detection.marker_ids is not self._recorded_markers[0]
+        ):
+            raise ValueError(
+                "Detection isn't from the most recently captured frame of the replay"
+            )
+        return super()._get_ids_and_corners(frame, detection=detection)
+
+    def _get_recorded_poses(self) -> tuple[NDArray, NDArray]:
+        rvecs, tvecs = self.log.rvecs[self._rows], self.log.tvecs[self._rows]
+        if np.isnan(rvecs).any() or np.isnan(tvecs).any():
+            raise MissingCalibrationsError()
+        return rvecs, tvecs
+
+    def _get_pose_batch(
+        self, ids: list[int], corners: Corners, sizes: list[int]
+    ) -> PoseBatch | None:
+        # Markers are only ever from the current frame, so line up with its rows
+        rvecs, tvecs = self.log.rvecs[self._rows], self.log.tvecs[self._rows]
+        if self.calibration_params is None and (
+            np.isnan(rvecs).any() or np.isnan(tvecs).any()
+        ):
+            return None
+        return RecordedPoseBatch(
+            corners, sizes, self.calibration_params, rvecs, tvecs, stats=self.stats
+        )
+
+    def process_frame_eager(
+        self, *, frame: NDArray | None = None, detection: Detection | None = None
+    ) -> Generator[EagerMarker, None, None]:
+        """
+        Get markers using the poses which were recorded, rather than estimating
+        them. A calibration file isn't needed.
+        """
+        if detection is None:
+            detection = self.detect(frame=frame)
+        timestamp = detection.timestamp
+        ids, corners = self._get_ids_and_corners(detection=detection)
+        rvecs, tvecs = self._get_recorded_poses()
+        yield from self._record_markers(
+            (
+                self._get_eager_marker(
+                    int(marker_id),
+                    cast(list, marker_corners),
+                    self.get_marker_size(int(marker_id)),
+                    tvec,
+                    rvec,
+                    timestamp=timestamp,
+                )
+                for marker_id, marker_corners, tvec, rvec in zip(
+                    ids, corners, tvecs, rvecs
+                )
+            ),
+            timestamp,
+        )
+
+    def __iter__(self) -> Generator[NDArray, None, None]:
+        try:
+            yield from super().__iter__()
+        except CameraReadError as e:
+            if e.frame is not None:
+                raise
@@ -6,6 +6,7 @@ import picamera
 import picamera.array
 from numpy.typing import NDArray
 
+from zoloto.detector_params import DetectorProfile
 from zoloto.marker_type import MarkerType
 
 from .base import BaseCamera
@@ -19,11 +20,13 @@ class PiCamera(IterableCameraMixin, BaseCamera, ViewableCameraMixin):
         marker_size: int | None = None,
         marker_type: MarkerType,
         calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
     ) -> None:
         super().__init__(
             marker_size=marker_size,
             marker_type=marker_type,
             calibration_file=calibration_file,
+            detector_profile=detector_profile,
         )
         self.camera = picamera.PiCamera()
 
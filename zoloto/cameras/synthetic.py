@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Sequence, cast
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zoloto.calibration import CalibrationParameters
+from zoloto.coords import rvecs_to_rotation_matrices
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MarkerType
+
+from .base import BaseCamera
+from .mixins import IterableCameraMixin
+
+# Pixels per bit of the marker images which are warped into scenes
+_BIT_SIZE = 8
+
+# Offsets between frames are taken from a slightly larger noise field
+_NOISE_MARGIN = 64
+
+# Headroom for each marker's warped bounding box, for rotation and perspective
+_CELL_MARGIN = 1.6
+
+
+class SceneGroundTruth(NamedTuple):
+    """
+    The markers in a synthetic scene.
+    """
+
+    marker_types: list[MarkerType]
+    ids: NDArray
+    corners: NDArray
+    rvecs: NDArray
+    tvecs: NDArray
+
+
+@lru_cache(maxsize=None)
+def _get_marker_image(marker_type: MarkerType, marker_id: int) -> NDArray:
+    """
+    Render a marker, surrounded by a quiet zone 1 bit wide.
+    """
+    marker_image = cv2.aruco.drawMarker(
+        marker_type.dictionary, marker_id, (marker_type.marker_size + 2) * _BIT_SIZE
+    )
+    image = cv2.copyMakeBorder(
+        marker_image,
+        _BIT_SIZE,
+        _BIT_SIZE,
+        _BIT_SIZE,
+        _BIT_SIZE,
+        cv2.BORDER_CONSTANT,
+        value=[255],
+    )
+    image.flags.writeable = False
+    return image
+
+
+def get_synthetic_calibration_parameters(
+    resolution: tuple[int, int]
+) -> CalibrationParameters:
+    """
+    Calibration parameters for an ideal pinhole camera, with a horizontal
+    field of view of about 53°.
+    """
+    width, height = resolution
+    camera_matrix = np.array(
+        [[width, 0, (width - 1) / 2], [0, width, (height - 1) / 2], [0, 0, 1]],
+        dtype=float,
+    )
+    return CalibrationParameters(camera_matrix, np.zeros((1, 5)), resolution)
+
+
+def _rotations_about_axis(angles: NDArray, axis: int) -> NDArray:
+    rvecs = np.zeros((len(angles), 3))
+    rvecs[:, axis] = angles
+    return rvecs_to_rotation_matrices(rvecs)
+
+
+class SyntheticSceneCamera(IterableCameraMixin, BaseCamera):
+    """
+    A camera which renders scenes of many markers, with known poses.
+
+    Each scene is generated from `seed` and its index, so scenes are
+    reproducible and can be rendered in any order. Markers are placed on a
+    jittered grid so they never overlap, then rendered with random poses
+    (`max_tilt` is in degrees), lighting gradients, sensor noise and blur.
+    `marker_size` is the physical size of the markers, as for other cameras.
+
+    When `cache_size` is set, only that many distinct scenes are rendered, and
+    later frames repeat them. Cached frames are shared, so are read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        marker_type: MarkerType,
+        marker_types: Sequence[MarkerType] | None = None,
+        marker_count: int = 10,
+        marker_size: int = 100,
+        marker_pixel_sizes: tuple[int, int] = (40, 160),
+        resolution: tuple[int, int] | None = None,
+        max_tilt: float = 45,
+        noise: float = 3,
+        max_blur: float = 1,
+        lighting: float = 0.3,
+        seed: int = 0,
+        cache_size: int | None = None,
+        calibration_file: Path | None = None,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+    ) -> None:
+        super().__init__(
+            marker_size=marker_size,
+            marker_type=marker_type,
+            calibration_file=calibration_file,
+            detector_profile=detector_profile,
+        )
+        if marker_count < 0:
+            raise ValueError("Marker count must not be negative")
+        if not 0 < marker_pixel_sizes[0] <= marker_pixel_sizes[1]:
+            raise ValueError("Marker pixel sizes must be a positive range")
+        if cache_size is not None and cache_size < 1:
+            raise ValueError("Cache size must be at least 1")
+
+        if self.calibration_params is None:
+            self.calibration_params = get_synthetic_calibration_parameters(
+                resolution or (1280, 720)
+            )
+        elif resolution not in {None, self.calibration_params.resolution}:
+            raise ValueError(
+                f"The resolution {resolution!r} differs from the calibrated resolution {self.calibration_params.resolution!r}"
+            )
+
+        self.marker_types = list(marker_types or [marker_type])
+        self.marker_count = marker_count
+        self.marker_pixel_sizes = marker_pixel_sizes
+        self.max_tilt = max_tilt
+        self.noise = noise
+        self.max_blur = max_blur
+        self.lighting = lighting
+        self.seed = seed
+        self.cache_size = cache_size
+        self._cache: dict[int, tuple[NDArray, SceneGroundTruth]] = {}
+        self._scene_index = 0
+        self.ground_truth: SceneGroundTruth | None = None
+
+        width, height = self.get_resolution()
+        self._noise_field = (
+            np.random.default_rng(seed).standard_normal(
+                (height + _NOISE_MARGIN, width + _NOISE_MARGIN), dtype=np.float32
+            )
+            * noise
+        )
+        self._x_gradient = np.linspace(-0.5, 0.5, width, dtype=np.float32)
+        self._y_gradient = np.linspace(-0.5, 0.5, height, dtype=np.float32)[:, None]
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} markers={self.marker_count} types={[t.name for t in self.marker_types]} seed={self.seed}>"
+
+    def get_resolution(self) -> tuple[int, int]:
+        return self._get_calibration_params().resolution
+
+    def _get_calibration_params(self) -> CalibrationParameters:
+        # Always set by the constructor
+        return cast(CalibrationParameters, self.calibration_params)
+
+    def _generate_poses(
+        self, rng: np.random.Generator, marker_types: list[MarkerType]
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Place markers on a jittered grid, returning their rotation matrices and
+        translation vectors.
+        """
+        width, height = self.get_resolution()
+        camera_matrix = self._get_calibration_params().camera_matrix
+        columns = max(math.ceil(math.sqrt(self.marker_count * width / height)), 1)
+        rows = max(math.ceil(self.marker_count / columns), 1)
+        cell_width, cell_height = width / columns, height / rows
+        cells = rng.choice(rows * columns, self.marker_count, replace=False)
+
+        # Leave room for the quiet zone, and the marker turning in the cell
+        max_pixel_size = min(cell_width, cell_height) / _CELL_MARGIN
+        marker_bits = np.array(
+            [marker_type.marker_size for marker_type in marker_types], dtype=float
+        )
+        quiet_zone_scale = (marker_bits + 4) / (marker_bits + 2)
+        pixel_sizes = np.minimum(
+            rng.uniform(*self.marker_pixel_sizes, self.marker_count),
+            max_pixel_size / quiet_zone_scale,
+        )
+
+        slack = (
+            min(cell_width, cell_height) - pixel_sizes * quiet_zone_scale * _CELL_MARGIN
+        ) / 2
+        centres = (
+            np.stack(
+                [
+                    (cells % columns + 0.5) * cell_width,
+                    (cells // columns + 0.5) * cell_height,
+                ],
+                axis=1,
+            )
+            + rng.uniform(-1, 1, (self.marker_count, 2)) * np.maximum(slack, 0)[:, None]
+        )
+
+        # Markers face the camera, then are rolled and tilted
+        tilt_angles = np.radians(self.max_tilt) * np.sqrt(
+            rng.uniform(0, 1, self.marker_count)
+        )
+        tilt_directions = rng.uniform(0, 2 * np.pi, self.marker_count)
+        tilts = rvecs_to_rotation_matrices(
+            np.stack(
+                [
+                    np.cos(tilt_directions) * tilt_angles,
+                    np.sin(tilt_directions) * tilt_angles,
+                    np.zeros(self.marker_count),
+                ],
+                axis=1,
+            )
+        )
+        facing = _rotations_about_axis(np.full(self.marker_count, np.pi), 0)
+        rolls = _rotations_about_axis(rng.uniform(-np.pi, np.pi, self.marker_count), 2)
+        rotations = tilts @ facing @ rolls
+
+        focal_length = camera_matrix[0, 0]
+        depths = focal_length * self.get_marker_size(0) / pixel_sizes
+        tvecs = np.stack(
+            [
+                (centres[:, 0] - camera_matrix[0, 2]) * depths / camera_matrix[0, 0],
+                (centres[:, 1] - camera_matrix[1, 2]) * depths / camera_matrix[1, 1],
+                depths,
+            ],
+            axis=1,
+        )
+        return rotations, tvecs
+
+    def _project_corners(self, rotations: NDArray, tvecs: NDArray) -> NDArray:
+        if not len(tvecs):
+            return np.empty((0, 4, 2), dtype=np.float32)
+        half_size = self.get_marker_size(0) / 2
+        object_corners = np.array(
+            [
+                [-half_size, half_size, 0],
+                [half_size, half_size, 0],
+                [half_size, -half_size, 0],
+                [-half_size, -half_size, 0],
+            ]
+        )
+        camera_points = (
+            np.einsum("nij,kj->nki", rotations, object_corners) + tvecs[:, None]
+        )
+        calibration_params = self._get_calibration_params()
+        image_points, _ = cv2.projectPoints(
+            camera_points.reshape(-1, 3),
+            np.zeros(3),
+            np.zeros(3),
+            calibration_params.camera_matrix,
+            calibration_params.distance_coefficients,
+        )
+        return image_points.reshape(-1, 4, 2).astype(np.float32)
+
+    def _draw_marker(
+        self,
+        scene: NDArray,
+        marker_type: MarkerType,
+        marker_id: int,
+        corners: NDArray,
+        background: float,
+    ) -> None:
+        marker_image = _get_marker_image(marker_type, marker_id)
+        inner_size = (marker_type.marker_size + 2) * _BIT_SIZE
+        start, end = _BIT_SIZE - 0.5, _BIT_SIZE + inner_size - 0.5
+        homography = cv2.getPerspectiveTransform(
+            np.array(
+                [[start, start], [end, start], [end, end], [start, end]],
+                dtype=np.float32,
+            ),
+            corners,
+        )
+
+        # Only warp the region the marker covers
+        edge = marker_image.shape[0] - 0.5
+        outline = cv2.perspectiveTransform(
+            np.array(
+                [[[-0.5, -0.5], [edge, -0.5], [edge, edge], [-0.5, edge]]],
+                dtype=np.float32,
+            ),
+            homography,
+        )[0]
+        height, width = scene.shape
+        x0, y0 = np.maximum(np.floor(outline.min(axis=0)).astype(int), 0)
+        x1, y1 = np.minimum(
+            np.ceil(outline.max(axis=0)).astype(int) + 1, (width, height)
+        )
+        if x1 <= x0 or y1 <= y0:
+            return
+        offset = np.array([[1, 0, -x0], [0, 1, -y0], [0, 0, 1]], dtype=float)
+        scene[y0:y1, x0:x1] = cv2.warpPerspective(
+            marker_image,
+            offset @ homography,
+            (int(x1 - x0), int(y1 - y0)),
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_CONSTANT,
+            borderValue=background,
+        )
+
+    def _render(self, scene_index: int) -> tuple[NDArray, SceneGroundTruth]:
+        rng = np.random.default_rng([self.seed, scene_index])
+        width, height = self.get_resolution()
+
+        type_indexes = rng.integers(len(self.marker_types), size=self.marker_count)
+        marker_types = [self.marker_types[index] for index in type_indexes]
+        ids = np.empty(self.marker_count, dtype=int)
+        for type_index, marker_type in enumerate(self.marker_types):
+            indexes = np.flatnonzero(type_indexes == type_index)
+            ids[indexes] = rng.choice(
+                marker_type.marker_count,
+                len(indexes),
+                replace=len(indexes) > marker_type.marker_count,
+            )
+
+        rotations, tvecs = self._generate_poses(rng, marker_types)
+        corners = self._project_corners(rotations, tvecs)
+        rvecs = np.array(
+            [cv2.Rodrigues(rotation)[0].flatten() for rotation in rotations]
+        ).reshape(-1, 3)
+
+        background = float(rng.uniform(100, 200))
+        scene = np.full((height, width), background, dtype=np.uint8)
+        for marker_type, marker_id, marker_corners in zip(marker_types, ids, corners):
+            self._draw_marker(
+                scene, marker_type, int(marker_id), marker_corners, background
+            )
+
+        # Uneven lighting, then sensor noise
+        brightness = np.float32(1 - self.lighting * rng.uniform(0, 0.5))
+        x_slope = np.float32(self.lighting * rng.uniform(-1, 1))
+        y_slope = np.float32(self.lighting * rng.uniform(-1, 1))
+        frame = scene * (
+            brightness * (1 + y_slope * self._y_gradient + x_slope * self._x_gradient)
+        )
+        noise_x, noise_y = rng.integers(_NOISE_MARGIN, size=2)
+        frame += self._noise_field[noise_y:, noise_x:][:height, :width]
+        frame = np.clip(frame, 0, 255, out=frame).astype(np.uint8)
+
+        blur = rng.uniform(0, self.max_blur)
+        if blur > 0:
+            frame = cv2.GaussianBlur(frame, (0, 0), blur)
+
+        ground_truth = SceneGroundTruth(marker_types, ids, corners, rvecs, tvecs)
+        return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR), ground_truth
+
+    def render_scene(self, scene_index: int) -> tuple[NDArray, SceneGroundTruth]:
+        """
+        Render a scene, and get the markers in it.
+        """
+        if self.cache_size is None:
+            return self._render(scene_index)
+        scene_index %= self.cache_size
+        if scene_index not in self._cache:
+            frame, ground_truth = self._render(scene_index)
+            frame.flags.writeable = False
+            self._cache[scene_index] = frame, ground_truth
+        return self._cache[scene_index]
+
+    def capture_frame(self) -> NDArray:
+        frame, self.ground_truth = self.render_scene(self._scene_index)
+        self._scene_index += 1
+        return frame
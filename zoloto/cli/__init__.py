@@ -14,6 +14,10 @@ __all__ = [
     "marker_details",
     "marker_pdfs",
     "validate_calibration",
+    "tune_detector",
+    "detect",
+    "detect_video",
+    "frame_stack",
 ]
 
 
@@ -11,11 +11,11 @@ def main(args: argparse.Namespace) -> None:
     with ImageFileCamera(
         Path(args.in_file), marker_type=MarkerType[args.type], marker_size=100
     ) as camera:
-        camera.save_frame(Path(args.out_file), annotate=True)
+        detection = camera.detect()
+        visible_markers = camera.get_visible_markers(detection=detection)
+        camera.save_frame(Path(args.out_file), annotate=True, detection=detection)
 
-        print(  # noqa: T001
-            f"Saw {len(camera.get_visible_markers())} markers in this image"
-        )
+        print(f"Saw {len(visible_markers)} markers in this image")  # noqa: T001
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
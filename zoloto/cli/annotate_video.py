@@ -1,19 +1,112 @@
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import Deque, Iterable, Iterator, Optional, Tuple, cast
 
 import cv2
+from numpy.typing import NDArray
 
+from zoloto.cameras.base import BaseCamera
 from zoloto.cameras.file import VideoFileCamera
+from zoloto.detection import Detection
 from zoloto.marker_type import MARKER_TYPE_NAMES, MarkerType
 
+# A frame, and its detection if one was requested
+PendingDetection = Tuple[NDArray, Optional["Future[Detection]"]]
+
+
+def detect_frames(
+    camera: BaseCamera,
+    frames: Iterable[NDArray],
+    *,
+    workers: int = 1,
+    detect_every: int = 1,
+) -> Iterator[Detection]:
+    """
+    Detect markers in frames on a pool of threads, yielding detections in order.
+
+    Markers are only detected in every `detect_every` frames. The frames in
+    between reuse the most recent detection.
+    """
+    if detect_every < 1:
+        raise ValueError("Must detect at least every frame")
+    if workers < 1:
+        raise ValueError("Must have at least 1 worker")
+    max_pending = 2 * workers * detect_every
+    pending: Deque[PendingDetection] = deque()
+    last_detection: Detection | None = None
+
+    def pop_detection() -> Detection:
+        nonlocal last_detection
+        frame, future = pending.popleft()
+        if future is not None:
+            last_detection = future.result()
+            return last_detection
+        # The first frame is always detected
+        previous_detection = cast(Detection, last_detection)
+        return Detection(
+            frame, previous_detection.marker_ids, previous_detection.corners
+        )
+
+    # OpenCV releases the GIL while detecting, so threads run in parallel
+    with ThreadPoolExecutor(workers) as executor:
+        for frame_index, frame in enumerate(frames):
+            future = None
+            if frame_index % detect_every == 0:
+                future = executor.submit(camera.detect, frame=frame)
+            pending.append((frame, future))
+            if len(pending) >= max_pending:
+                yield pop_detection()
+
+        while pending:
+            yield pop_detection()
+
+
+def _write_frames(
+    output_writer: cv2.VideoWriter,
+    frames: Queue[NDArray | None],
+    result: Future[None],
+) -> None:
+    """
+    Write frames from a queue until it's sent `None`.
+
+    If writing fails, the error is set on `result` straight away, and the rest
+    of the frames are discarded so whatever's adding them isn't blocked.
+    """
+    while True:
+        frame = frames.get()
+        if frame is None:
+            break
+        if result.done():
+            continue
+        try:
+            output_writer.write(frame)
+        except Exception as e:
+            result.set_exception(e)
+    if not result.done():
+        result.set_result(None)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
 
 def main(args: argparse.Namespace) -> None:
     from tqdm import tqdm
 
     with VideoFileCamera(
-        Path(args.in_file), marker_type=MarkerType[args.type], marker_size=100
+        Path(args.in_file),
+        marker_type=MarkerType[args.type],
+        marker_size=100,
+        threaded=True,
     ) as camera:
         fps = camera.video_capture.get(cv2.CAP_PROP_FPS)
         frames = camera.video_capture.get(cv2.CAP_PROP_FRAME_COUNT)
@@ -26,11 +119,29 @@ def main(args: argparse.Namespace) -> None:
             [int(width), int(height)],
         )
 
-        for frame in tqdm(camera, total=frames):
-            camera._annotate_frame(frame)
-            output_writer.write(frame)
+        # Encode in a separate thread, so it overlaps with decoding and detection
+        encode_queue: Queue[NDArray | None] = Queue(maxsize=args.workers * 2)
+        encode_result: Future[None] = Future()
+        encode_thread = Thread(
+            target=_write_frames, args=(output_writer, encode_queue, encode_result)
+        )
+        encode_thread.start()
 
-        output_writer.release()
+        try:
+            detections = detect_frames(
+                camera, camera, workers=args.workers, detect_every=args.detect_every
+            )
+            for detection in tqdm(detections, total=frames):
+                camera._annotate_frame(detection.frame, detection=detection)
+                encode_queue.put(detection.frame)
+                if encode_result.done():
+                    # Writing failed, so there's no point carrying on
+                    break
+        finally:
+            encode_queue.put(None)
+            encode_thread.join()
+            output_writer.release()
+        encode_result.result()
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
@@ -44,4 +155,16 @@ def add_subparser(subparsers: argparse._SubParsersAction) -> None:
         choices=sorted(MARKER_TYPE_NAMES),
         help="Marker dictionary",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Number of threads detecting markers (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--detect-every",
+        type=_positive_int,
+        default=1,
+        help="Only detect markers every n frames, reusing the last markers for the frames in between (default: %(default)s)",
+    )
     parser.set_defaults(func=main)
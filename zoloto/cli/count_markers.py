@@ -1,23 +1,17 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 
-from zoloto.cameras.file import ImageFileCamera
-from zoloto.marker_type import MarkerType
+from cv2 import imread
 
+from zoloto.detection import MultiDictionaryDetector
 
-def main(args: argparse.Namespace) -> None:
-    for marker_type in MarkerType:
-        with ImageFileCamera(
-            Path(args.file), marker_type=marker_type, marker_size=100
-        ) as camera:
-            visible_markers = camera.get_visible_markers()
 
-            if visible_markers:
-                print(  # noqa: T001
-                    "Found", len(visible_markers), marker_type.name, "tokens"
-                )
+def main(args: argparse.Namespace) -> None:
+    frame = imread(str(args.file))
+    for marker_type, (marker_ids, _) in MultiDictionaryDetector().detect(frame).items():
+        if marker_ids is not None:
+            print("Found", len(marker_ids), marker_type.name, "tokens")  # noqa: T001
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from zoloto.cameras.file import IMAGE_SUFFIXES, ImageFileCamera
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MARKER_TYPE_NAMES, MarkerType
+from zoloto.utils import init_worker_process
+
+
+def expand_paths(patterns: Iterable[str]) -> list[Path]:
+    """
+    Expand files, directories (searched recursively for images) and globs into
+    a list of files, in a stable order.
+    """
+    paths: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(
+                sorted(
+                    p
+                    for p in path.rglob("*")
+                    if p.suffix.lower() in IMAGE_SUFFIXES and p.is_file()
+                )
+            )
+        elif path.exists():
+            paths.append(path)
+        else:
+            paths.extend(Path(p) for p in sorted(glob.glob(pattern, recursive=True)))
+    return paths
+
+
+def _detect_file(
+    path: Path,
+    *,
+    marker_type: MarkerType,
+    marker_size: int,
+    calibration_file: Path | None,
+    detector_profile: DetectorProfile,
+) -> dict[str, Any]:
+    result: dict[str, Any] = {"file": str(path)}
+    with ImageFileCamera(
+        path,
+        marker_type=marker_type,
+        marker_size=marker_size,
+        calibration_file=calibration_file,
+        detector_profile=detector_profile,
+    ) as camera:
+        frame = camera.capture_frame()
+        if frame is None:
+            result["error"] = "Unable to read image"
+            return result
+        result["markers"] = [
+            marker.as_dict() for marker in camera.process_frame(frame=frame)
+        ]
+    return result
+
+
+def detect_files(
+    paths: list[Path],
+    *,
+    marker_type: MarkerType,
+    marker_size: int,
+    calibration_file: Path | None = None,
+    detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+    workers: int | None = None,
+    chunksize: int = 8,
+) -> Iterator[dict[str, Any]]:
+    """
+    Detect markers in image files across a pool of processes.
+
+    Results are yielded in the same order as `paths`.
+    """
+    detect_file = partial(
+        _detect_file,
+        marker_type=marker_type,
+        marker_size=marker_size,
+        calibration_file=calibration_file,
+        detector_profile=detector_profile,
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        yield from map(detect_file, paths)
+        return
+
+    # Workers read and decode images themselves, so only paths are sent to them
+    with Pool(workers, initializer=init_worker_process) as pool:
+        yield from pool.imap(detect_file, paths, chunksize=chunksize)
+
+
+def main(args: argparse.Namespace) -> int | None:
+    from tqdm import tqdm
+
+    paths = expand_paths(args.paths)
+    if not paths:
+        print("No files found", file=sys.stderr)  # noqa: T001
+        return 1
+
+    output = sys.stdout if args.output is None else args.output.open("w")
+    marker_count = 0
+    error_count = 0
+    start = time.perf_counter()
+    try:
+        results = detect_files(
+            paths,
+            marker_type=MarkerType[args.type],
+            marker_size=args.marker_size,
+            calibration_file=args.calibration_file,
+            detector_profile=DetectorProfile(args.detector_profile),
+            workers=args.workers,
+        )
+        for result in tqdm(results, total=len(paths), unit="frame", file=sys.stderr):
+            marker_count += len(result.get("markers", []))
+            error_count += "error" in result
+            output.write(json.dumps(result) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    print(  # noqa: T001
+        f"Found {marker_count} markers in {len(paths)} frames in {elapsed:.1f}s ({len(paths) / elapsed:.1f} frames/s)",
+        file=sys.stderr,
+    )
+    if error_count:
+        print(f"Unable to read {error_count} frames", file=sys.stderr)  # noqa: T001
+        return 1
+    return None
+
+
+def add_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "detect",
+        description="Detect markers in many images, outputting a JSON line per image",
+    )
+    parser.add_argument(
+        "paths", type=str, nargs="+", help="Image files, directories or globs"
+    )
+    parser.add_argument(
+        "--type",
+        type=str,
+        default=MarkerType.ARUCO_6X6.name,
+        choices=sorted(MARKER_TYPE_NAMES),
+        help="Marker dictionary",
+    )
+    parser.add_argument(
+        "--marker-size",
+        type=int,
+        default=100,
+        help="Marker size (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--calibration-file",
+        type=Path,
+        help="Calibration file, to include marker poses in the output",
+    )
+    parser.add_argument(
+        "--detector-profile",
+        type=str,
+        default=DetectorProfile.BALANCED.value,
+        choices=[profile.value for profile in DetectorProfile],
+        help="Detector parameter profile (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Output file (default: stdout)",
+    )
+    parser.set_defaults(func=main)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MARKER_TYPE_NAMES, MarkerType
+from zoloto.video_segments import SEGMENT_LENGTH, process_video_segments
+
+
+def main(args: argparse.Namespace) -> None:
+    from tqdm import tqdm
+
+    output = sys.stdout if args.output is None else args.output.open("w")
+    try:
+        results = process_video_segments(
+            args.in_file,
+            stride=args.stride,
+            workers=args.workers,
+            segment_length=args.segment_length,
+            annotated_path=args.annotate,
+            marker_type=MarkerType[args.type],
+            marker_size=args.marker_size,
+            calibration_file=args.calibration_file,
+            detector_profile=DetectorProfile(args.detector_profile),
+        )
+        for frame_index, markers in tqdm(results, unit="frame", file=sys.stderr):
+            output.write(json.dumps({"frame": frame_index, "markers": markers}) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def add_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "detect-video",
+        description="Detect markers in a video file, processing segments of it in parallel. Outputs a JSON line per frame",
+    )
+    parser.add_argument("in_file", type=Path, help="")
+    parser.add_argument(
+        "--type",
+        type=str,
+        default=MarkerType.ARUCO_6X6.name,
+        choices=sorted(MARKER_TYPE_NAMES),
+        help="Marker dictionary",
+    )
+    parser.add_argument(
+        "--marker-size",
+        type=int,
+        default=100,
+        help="Marker size (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--calibration-file",
+        type=Path,
+        help="Calibration file, to include marker poses in the output",
+    )
+    parser.add_argument(
+        "--detector-profile",
+        type=str,
+        default=DetectorProfile.BALANCED.value,
+        choices=[profile.value for profile in DetectorProfile],
+        help="Detector parameter profile (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stride",
+        type=int,
+        default=1,
+        help="Only process every nth frame (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--segment-length",
+        type=int,
+        default=SEGMENT_LENGTH,
+        help="Number of frames each worker processes at a time (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--annotate",
+        type=Path,
+        help="Also write an annotated copy of the video to this file (.mp4)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Output file (default: stdout)",
+    )
+    parser.set_defaults(func=main)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from zoloto.cameras.file import convert_to_frame_stack
+
+
+def main(args: argparse.Namespace) -> int | None:
+    if not args.source.exists():
+        print(f"{args.source} does not exist", file=sys.stderr)  # noqa: T001
+        return 1
+    frame_count = convert_to_frame_stack(args.source, args.output)
+    print(f"Wrote {frame_count} frames to {args.output}")  # noqa: T001
+    return None
+
+
+def add_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "frame-stack",
+        description="Convert a video file, or a directory of images, into a memory-mappable frame stack (.npy)",
+    )
+    parser.add_argument("source", type=Path, help="Video file or image directory")
+    parser.add_argument("output", type=Path, help="Output file (.npy)")
+    parser.set_defaults(func=main)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
+
+import cv2
+from numpy.typing import NDArray
+
+from zoloto.detector_params import DetectorProfile, create_detector_params
+from zoloto.marker_type import MARKER_TYPE_NAMES, MarkerType
+
+# Parameters swept (on top of the balanced profile) with the biggest effect on speed
+SWEEP_PARAMETERS: dict[str, tuple[Any, ...]] = {
+    "adaptiveThreshWinSizeStep": (4, 10, 20),
+    "polygonalApproxAccuracyRate": (0.03, 0.05),
+    "cornerRefinementMethod": (
+        cv2.aruco.CORNER_REFINE_NONE,
+        cv2.aruco.CORNER_REFINE_SUBPIX,
+    ),
+}
+
+
+class LabelledFrame(NamedTuple):
+    frame: NDArray
+    marker_ids: set[int]
+
+
+class TuningResult(NamedTuple):
+    name: str
+    parameters: dict[str, Any]
+    detection_rate: float
+    false_positives: int
+    milliseconds_per_frame: float
+
+
+def load_labelled_frames(labels_file: Path) -> list[LabelledFrame]:
+    """
+    Load frames listed in a JSON file, mapping image paths (relative to the
+    file) to the marker ids visible in them.
+    """
+    labels = json.loads(labels_file.read_text())
+    labelled_frames = []
+    for filename, marker_ids in sorted(labels.items()):
+        path = labels_file.parent / filename
+        frame = cv2.imread(str(path))
+        if frame is None:
+            raise ValueError(f"Unable to read {path}")
+        labelled_frames.append(LabelledFrame(frame, set(marker_ids)))
+    return labelled_frames
+
+
+def get_parameter_sweep() -> Iterator[tuple[str, dict[str, Any]]]:
+    for profile in DetectorProfile:
+        yield profile.value, profile.parameters
+
+    names = list(SWEEP_PARAMETERS)
+    for values in itertools.product(*SWEEP_PARAMETERS.values()):
+        overrides = dict(zip(names, values))
+        yield (
+            ",".join(f"{name}={value}" for name, value in overrides.items()),
+            {**DetectorProfile.BALANCED.parameters, **overrides},
+        )
+
+
+def evaluate_detector_params(
+    frames: list[LabelledFrame],
+    marker_type: MarkerType,
+    name: str,
+    parameters: dict[str, Any],
+    *,
+    repeat: int = 1,
+) -> TuningResult:
+    dictionary = marker_type.dictionary
+    detector_params = create_detector_params(parameters)
+    expected_markers = sum(len(frame.marker_ids) for frame in frames)
+    found_markers = 0
+    false_positives = 0
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame, marker_ids in frames:
+            _, ids, _ = cv2.aruco.detectMarkers(
+                frame, dictionary, parameters=detector_params
+            )
+            detected_ids = set() if ids is None else set(ids.flatten().tolist())
+            found_markers += len(detected_ids & marker_ids)
+            false_positives += len(detected_ids - marker_ids)
+    elapsed = time.perf_counter() - start
+
+    return TuningResult(
+        name=name,
+        parameters=parameters,
+        detection_rate=found_markers / (expected_markers * repeat)
+        if expected_markers
+        else 1.0,
+        false_positives=false_positives // repeat,
+        milliseconds_per_frame=elapsed * 1000 / (len(frames) * repeat),
+    )
+
+
+def get_pareto_front(results: list[TuningResult]) -> list[TuningResult]:
+    """
+    Find the results which no other result is both faster and more accurate than.
+    """
+    front = []
+    best_detection_rate = -1.0
+    for result in sorted(results, key=lambda r: r.milliseconds_per_frame):
+        if result.detection_rate > best_detection_rate:
+            front.append(result)
+            best_detection_rate = result.detection_rate
+    return front
+
+
+def main(args: argparse.Namespace) -> int | None:
+    labels_file = args.labels or args.directory / "labels.json"
+    try:
+        frames = load_labelled_frames(labels_file)
+    except ValueError as e:
+        print(e, file=sys.stderr)  # noqa:T001
+        return 1
+    if not frames:
+        print("No labelled frames found")  # noqa:T001
+        return 1
+    marker_type = MarkerType[args.type]
+
+    results = [
+        evaluate_detector_params(
+            frames, marker_type, name, parameters, repeat=args.repeat
+        )
+        for name, parameters in get_parameter_sweep()
+    ]
+    pareto_front = get_pareto_front(results)
+
+    print(  # noqa:T001
+        f"{'':1} {'Detection rate':>14} {'False positives':>15} {'ms/frame':>8}  Parameters"
+    )
+    for result in sorted(results, key=lambda r: r.milliseconds_per_frame):
+        print(  # noqa:T001
+            f"{'*' if result in pareto_front else '':1} {result.detection_rate:>14.1%} {result.false_positives:>15} {result.milliseconds_per_frame:>8.2f}  {result.name}"
+        )
+    return None
+
+
+def add_subparser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "tune-detector",
+        description="Compare detector parameters against a directory of labelled frames. Results on the speed / detection rate trade-off are marked with a *",
+    )
+    parser.add_argument(
+        "type",
+        type=str,
+        choices=sorted(MARKER_TYPE_NAMES),
+        help="Marker dictionary",
+    )
+    parser.add_argument(
+        "directory",
+        type=Path,
+        help="Directory of frames",
+    )
+    parser.add_argument(
+        "--labels",
+        type=Path,
+        help="JSON file mapping frame filenames to visible marker ids (default: labels.json in the directory)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times to detect each frame (default: %(default)s)",
+    )
+    parser.set_defaults(func=main)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Iterator, NamedTuple, Tuple
 
+import numpy as np
 from cached_property import cached_property
-from cv2 import Rodrigues
+from numpy.typing import NDArray
 from pyquaternion import Quaternion
 
 
@@ -45,11 +46,128 @@ class SphericalCoordinates(NamedTuple):
     rot_y: float
     dist: int
 
+    @classmethod
+    def from_tvec(cls, tvec: NDArray) -> SphericalCoordinates:
+        """
+        Construct spherical coordinates from a translation vector.
+        """
+        rot_x, rot_y, dist = tvecs_to_spherical(np.asarray(tvec).reshape(1, 3))[0]
+        return cls(rot_x=float(rot_x), rot_y=float(rot_y), dist=int(dist))
+
 
 ThreeTuple = Tuple[float, float, float]
 RotationMatrix = Tuple[ThreeTuple, ThreeTuple, ThreeTuple]
 
 
+def rvecs_to_rotation_matrices(rvecs: NDArray) -> NDArray:
+    """
+    Convert rotation vectors (N x 3) into rotation matrices (N x 3 x 3).
+
+    This is equivalent to calling `cv2.Rodrigues` on each vector.
+    """
+    rvecs = np.asarray(rvecs, dtype=float).reshape(-1, 3)
+    theta_squared = np.einsum("ij,ij->i", rvecs, rvecs)
+    theta = np.sqrt(theta_squared)
+    small = theta < 1e-12
+    safe_theta = np.where(small, 1, theta)
+
+    # Coefficients of the Rodrigues formula, using their limits for tiny rotations
+    a = np.where(small, 1, np.sin(safe_theta) / safe_theta)
+    b = np.where(small, 0.5, (1 - np.cos(safe_theta)) / safe_theta**2)
+
+    # R = cos(theta) I + a [r]x + b r r^T
+    matrices = b[:, np.newaxis, np.newaxis] * (
+        rvecs[:, :, np.newaxis] * rvecs[:, np.newaxis, :]
+    )
+    diagonal = 1 - b * theta_squared
+    matrices[:, 0, 0] += diagonal
+    matrices[:, 1, 1] += diagonal
+    matrices[:, 2, 2] += diagonal
+    ax, ay, az = (a[:, np.newaxis] * rvecs).T
+    matrices[:, 0, 1] -= az
+    matrices[:, 0, 2] += ay
+    matrices[:, 1, 0] += az
+    matrices[:, 1, 2] -= ax
+    matrices[:, 2, 0] -= ay
+    matrices[:, 2, 1] += ax
+    return matrices
+
+
+def rotation_matrices_to_quaternions(rotation_matrices: NDArray) -> NDArray:
+    """
+    Convert rotation matrices (N x 3 x 3) into quaternions (N x 4), in `w, x, y, z` order.
+
+    This follows the same method (and sign convention) as `pyquaternion`.
+    """
+    r = np.asarray(rotation_matrices, dtype=float).reshape(-1, 3, 3)
+
+    # The method works on the transpose of the matrix
+    m00, m01, m02 = r[:, 0, 0], r[:, 1, 0], r[:, 2, 0]
+    m10, m11, m12 = r[:, 0, 1], r[:, 1, 1], r[:, 2, 1]
+    m20, m21, m22 = r[:, 0, 2], r[:, 1, 2], r[:, 2, 2]
+
+    branch = np.where(m22 < 0, np.where(m00 > m11, 0, 1), np.where(m00 < -m11, 2, 3))
+    t = np.array(
+        [
+            1 + m00 - m11 - m22,
+            1 - m00 + m11 - m22,
+            1 - m00 - m11 + m22,
+            1 + m00 + m11 + m22,
+        ]
+    )
+    d12, d20, d01 = m12 - m21, m20 - m02, m01 - m10
+    s01, s12, s20 = m01 + m10, m12 + m21, m20 + m02
+    candidates = np.array(
+        [
+            [d12, t[0], s01, s20],
+            [d20, s01, t[1], s12],
+            [d01, s20, s12, t[2]],
+            [t[3], d12, d20, d01],
+        ]
+    )
+    index = np.arange(len(r))
+    return (
+        candidates[branch, :, index] * (0.5 / np.sqrt(t[branch, index]))[:, np.newaxis]
+    )
+
+
+def quaternions_to_yaw_pitch_roll(quaternions: NDArray) -> NDArray:
+    """
+    Convert quaternions (N x 4) into yaw-pitch-roll angles (N x 3), in radians.
+
+    Specifically intrinsic Tait-Bryan angles following the z-y'-x'' convention.
+    """
+    quaternions = np.asarray(quaternions, dtype=float).reshape(-1, 4)
+    norms = np.sqrt(np.einsum("ij,ij->i", quaternions, quaternions))
+    w, x, y, z = (quaternions / np.where(norms > 0, norms, 1)[:, np.newaxis]).T
+    yaw = np.arctan2(2 * (w * z - x * y), 1 - 2 * (y**2 + z**2))
+    pitch = np.arcsin(np.clip(2 * (w * y + z * x), -1, 1))
+    roll = np.arctan2(2 * (w * x - y * z), 1 - 2 * (x**2 + y**2))
+    return np.stack([yaw, pitch, roll], axis=1)
+
+
+def rvecs_to_yaw_pitch_roll(rvecs: NDArray) -> NDArray:
+    """
+    Convert rotation vectors (N x 3) into yaw-pitch-roll angles (N x 3), in radians.
+    """
+    return quaternions_to_yaw_pitch_roll(
+        rotation_matrices_to_quaternions(rvecs_to_rotation_matrices(rvecs))
+    )
+
+
+def tvecs_to_spherical(tvecs: NDArray) -> NDArray:
+    """
+    Convert translation vectors (N x 3) into spherical coordinates (N x 3).
+
+    Each row is `rot_x, rot_y, dist`, with the rotations in radians.
+    """
+    tvecs = np.asarray(tvecs, dtype=float).reshape(-1, 3)
+    x, y, z = tvecs.T
+    return np.stack(
+        [np.arctan2(y, z), np.arctan2(x, z), np.linalg.norm(tvecs, axis=1)], axis=1
+    )
+
+
 class Orientation:
     """The orientation of an object in 3-D space."""
 
@@ -59,8 +177,27 @@ class Orientation:
 
         More information: https://w.wiki/Fci
         """
-        rotation_matrix, _ = Rodrigues((e_x, e_y, e_z))
-        self._quaternion = Quaternion(matrix=rotation_matrix)
+        self._rotation_matrix = rvecs_to_rotation_matrices(
+            np.array([e_x, e_y, e_z], dtype=float)
+        )[0]
+        self._quaternion_array = rotation_matrices_to_quaternions(
+            self._rotation_matrix
+        )[0]
+        self._yaw_pitch_roll_array: NDArray | None = None
+
+    @classmethod
+    def from_arrays(
+        cls, rotation_matrix: NDArray, quaternion: NDArray, yaw_pitch_roll: NDArray
+    ) -> Orientation:
+        """
+        Construct an orientation from already converted values, such as a row
+        of the results of the vectorised conversions.
+        """
+        orientation = cls.__new__(cls)
+        orientation._rotation_matrix = rotation_matrix
+        orientation._quaternion_array = quaternion
+        orientation._yaw_pitch_roll_array = yaw_pitch_roll
+        return orientation
 
     @property
     def rot_x(self) -> float:
@@ -99,7 +236,12 @@ class Orientation:
 
         Specifically intrinsic Tait-Bryan angles following the z-y'-x'' convention.
         """
-        return self._quaternion.yaw_pitch_roll
+        if self._yaw_pitch_roll_array is None:
+            self._yaw_pitch_roll_array = quaternions_to_yaw_pitch_roll(
+                self._quaternion_array
+            )[0]
+        yaw, pitch, roll = self._yaw_pitch_roll_array.tolist()
+        return yaw, pitch, roll
 
     def __iter__(self) -> Iterator[float]:
         """
@@ -118,17 +260,17 @@ class Orientation:
         Returns:
             A 3x3 rotation matrix as a tuple of tuples.
         """
-        r_m = self._quaternion.rotation_matrix
+        r_m = self._rotation_matrix.tolist()
         return (
             (r_m[0][0], r_m[0][1], r_m[0][2]),
             (r_m[1][0], r_m[1][1], r_m[1][2]),
             (r_m[2][0], r_m[2][1], r_m[2][2]),
         )
 
-    @property
+    @cached_property
     def quaternion(self) -> Quaternion:
         """Get the quaternion represented by this orientation."""
-        return self._quaternion
+        return Quaternion(array=self._quaternion_array)
 
     def __repr__(self) -> str:
         return "Orientation(rot_x={}, rot_y={}, rot_z={})".format(
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+from numpy.typing import NDArray
+
+from zoloto.detector_params import DetectorProfile
+from zoloto.marker_type import MarkerType
+from zoloto.stats import CaptureTimestamp
+
+# Marker ids (`None` if there are no markers) and their corners
+RawCorners = Union[NDArray, Sequence[NDArray]]
+RawIdsAndCorners = Tuple[Optional[NDArray], RawCorners]
+
+
+class Detection(NamedTuple):
+    """
+    The markers detected in a frame.
+
+    Pass this back to the camera's methods to reuse the detection, rather than
+    detecting markers in the frame again. `timestamp` is when the frame was
+    captured, if it's known. `reused` is set when the markers were reused from
+    a previous frame, rather than detected in this one.
+    """
+
+    frame: NDArray
+    marker_ids: Optional[NDArray]
+    corners: RawCorners
+    timestamp: Optional[CaptureTimestamp] = None
+    reused: bool = False
+
+
+def _pack_bytes(byte_arrays: NDArray) -> NDArray:
+    """
+    Pack the last axis of an array of bytes (at most 8) into 64-bit integers.
+    """
+    padded = np.zeros(byte_arrays.shape[:-1] + (8,), dtype=np.uint8)
+    padded[..., : byte_arrays.shape[-1]] = byte_arrays
+    return padded.view(np.uint64)[..., 0]
+
+
+def _popcount(values: NDArray) -> NDArray:
+    """
+    Count the set bits in an array of 64-bit integers.
+    """
+    values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    values = (values & np.uint64(0x3333333333333333)) + (
+        (values >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (values * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _extract_bits(
+    gray: NDArray,
+    corners: NDArray,
+    marker_size: int,
+    detector_params: cv2.aruco_DetectorParameters,
+) -> NDArray:
+    """
+    Read the bits (including the border) of a candidate marker.
+
+    A port of OpenCV's `_extractBits`.
+    """
+    border_bits = detector_params.markerBorderBits
+    cell_size = detector_params.perspectiveRemovePixelPerCell
+    cell_margin = int(detector_params.perspectiveRemoveIgnoredMarginPerCell * cell_size)
+    size_with_borders = marker_size + 2 * border_bits
+    image_size = size_with_borders * cell_size
+
+    destination = np.array(
+        [
+            [0, 0],
+            [image_size - 1, 0],
+            [image_size - 1, image_size - 1],
+            [0, image_size - 1],
+        ],
+        dtype=np.float32,
+    )
+    transform = cv2.getPerspectiveTransform(corners, destination)
+    marker_image = cv2.warpPerspective(
+        gray, transform, (image_size, image_size), flags=cv2.INTER_NEAREST
+    )
+
+    half_cell = cell_size // 2
+    mean, std_dev = cv2.meanStdDev(
+        marker_image[half_cell:-half_cell, half_cell:-half_cell]
+    )
+    if std_dev[0, 0] < detector_params.minOtsuStdDev:
+        # All black or all white
+        fill = 1 if mean[0, 0] > 127 else 0
+        return np.full((size_with_borders, size_with_borders), fill, dtype=np.uint8)
+
+    _, marker_image = cv2.threshold(
+        marker_image, 125, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU
+    )
+    # Ignore the margin around the edge of each cell
+    cell_region = slice(cell_margin, cell_size - cell_margin)
+    cells = marker_image.reshape(
+        size_with_borders, cell_size, size_with_borders, cell_size
+    )[:, cell_region, :, cell_region]
+    cell_area = (cell_size - 2 * cell_margin) ** 2
+    return (np.count_nonzero(cells, axis=(1, 3)) > cell_area // 2).astype(np.uint8)
+
+
+class MultiDictionaryDetector:
+    """
+    Detect markers from multiple dictionaries in a single pass over a frame.
+
+    Candidate markers are found once (by detecting the first marker type), and
+    then decoded against each of the other dictionaries.
+    """
+
+    def __init__(
+        self,
+        marker_types: Iterable[MarkerType] = MarkerType,
+        *,
+        detector_profile: DetectorProfile = DetectorProfile.BALANCED,
+    ) -> None:
+        self.marker_types = list(marker_types)
+        if not self.marker_types:
+            raise ValueError("At least 1 marker type is required")
+        self.detector_params = detector_profile.get_detector_params()
+
+        # Every rotation of every marker, as (marker id, rotation)
+        self._rotated_bytes = {
+            marker_type: self._get_rotated_bytes(marker_type)
+            for marker_type in self.marker_types[1:]
+        }
+
+    @staticmethod
+    def _get_rotated_bytes(marker_type: MarkerType) -> NDArray:
+        bytes_list = marker_type.bytes_list
+        # Match the memory layout `Dictionary::identify` compares against
+        return _pack_bytes(bytes_list.reshape(len(bytes_list), 4, -1))
+
+    def _identify(
+        self, marker_type: MarkerType, bits: list[NDArray]
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Find the ids and rotations of candidate markers from their bits, with an
+        id of -1 if a candidate isn't a marker.
+
+        A vectorised port of OpenCV's `Dictionary::identify`.
+        """
+        rotated_bytes = self._rotated_bytes[marker_type]
+        max_correction_bits = int(
+            marker_type.dictionary.maxCorrectionBits
+            * self.detector_params.errorCorrectionRate
+        )
+        byte_count = bits[0].size // 8 + (bits[0].size % 8 != 0)
+        candidate_bytes = _pack_bytes(
+            np.array(
+                [
+                    cv2.aruco.Dictionary_getByteListFromBits(b).reshape(-1)[:byte_count]
+                    for b in bits
+                ]
+            )
+        )
+
+        # Hamming distance from each candidate to each rotation of each marker
+        distances = _popcount(
+            np.bitwise_xor(rotated_bytes, candidate_bytes[:, np.newaxis, np.newaxis])
+        )
+        matches = distances.min(axis=2) <= max_correction_bits
+
+        # The lowest matching id wins
+        ids = np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+        rotations = distances[np.arange(len(bits)), ids].argmin(axis=1)
+        return ids, rotations
+
+    def _get_candidate_bits(
+        self, gray: NDArray, candidate: NDArray, marker_size: int
+    ) -> tuple[NDArray, int]:
+        """
+        Get the inner bits of a candidate, and the number of incorrect border bits
+        """
+        bits = _extract_bits(
+            gray, candidate.reshape(4, 2), marker_size, self.detector_params
+        )
+        border_bits = self.detector_params.markerBorderBits
+        inner_bits = bits[border_bits:-border_bits, border_bits:-border_bits]
+        return inner_bits, int(np.count_nonzero(bits) - np.count_nonzero(inner_bits))
+
+    def _decode_candidates(
+        self,
+        gray: NDArray,
+        marker_type: MarkerType,
+        candidates: list[NDArray],
+        bits_cache: dict[tuple[int, int], tuple[NDArray, int]],
+    ) -> RawIdsAndCorners:
+        marker_size = marker_type.marker_size
+        max_border_errors = int(
+            marker_size**2 * self.detector_params.maxErroneousBitsInBorderRate
+        )
+
+        inner_bits = []
+        bordered_candidates = []
+        for index, candidate in enumerate(candidates):
+            # Bits only depend on the marker size, so can be shared between types
+            cache_key = (index, marker_size)
+            if cache_key not in bits_cache:
+                bits_cache[cache_key] = self._get_candidate_bits(
+                    gray, candidate, marker_size
+                )
+            candidate_inner_bits, border_errors = bits_cache[cache_key]
+            if border_errors <= max_border_errors:
+                inner_bits.append(candidate_inner_bits)
+                bordered_candidates.append(candidate.reshape(4, 2))
+
+        if not inner_bits:
+            return None, ()
+
+        ids, rotations = self._identify(marker_type, inner_bits)
+        found = ids != -1
+        if not found.any():
+            return None, ()
+
+        corners = [
+            np.roll(candidate, rotation, axis=0)[np.newaxis]
+            for candidate, rotation, is_found in zip(
+                bordered_candidates, rotations, found
+            )
+            if is_found
+        ]
+        if (
+            self.detector_params.cornerRefinementMethod
+            == cv2.aruco.CORNER_REFINE_SUBPIX
+        ):
+            corners = [self._refine_corners(gray, c) for c in corners]
+        return ids[found].astype(np.int32).reshape(-1, 1), tuple(corners)
+
+    def _refine_corners(self, gray: NDArray, corners: NDArray) -> NDArray:
+        window_size = self.detector_params.cornerRefinementWinSize
+        return cv2.cornerSubPix(
+            gray,
+            corners.reshape(-1, 1, 2),
+            (window_size, window_size),
+            (-1, -1),
+            (
+                cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER,
+                self.detector_params.cornerRefinementMaxIterations,
+                self.detector_params.cornerRefinementMinAccuracy,
+            ),
+        ).reshape(1, 4, 2)
+
+    def detect(self, frame: NDArray) -> dict[MarkerType, RawIdsAndCorners]:
+        """
+        Detect markers of each type in a frame.
+        """
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        first_marker_type = self.marker_types[0]
+        corners, ids, rejected = cv2.aruco.detectMarkers(
+            gray, first_marker_type.dictionary, parameters=self.detector_params
+        )
+        results: dict[MarkerType, RawIdsAndCorners] = {
+            first_marker_type: (ids, corners)
+        }
+
+        # Markers of one type are rejected candidates (or false positives) of another
+        candidates = list(corners) + list(rejected)
+        bits_cache: dict[tuple[int, int], tuple[NDArray, int]] = {}
+        for marker_type in self.marker_types[1:]:
+            results[marker_type] = self._decode_candidates(
+                gray, marker_type, candidates, bits_cache
+            )
+        return results
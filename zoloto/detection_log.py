@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from zoloto.exceptions import MissingCalibrationsError
+from zoloto.marker import BaseMarker, MarkerBatch
+
+LOG_VERSION = 1
+
+METADATA_FILENAME = "columns.json"
+
+# The dtype and per-row shape of each column. Each column is stored in its own file
+COLUMNS: dict[str, tuple[str, tuple[int, ...]]] = {
+    "frame_index": ("<i8", ()),
+    "timestamp": ("<f8", ()),
+    "id": ("<i4", ()),
+    "size": ("<i4", ()),
+    "corners": ("<f4", (4, 2)),
+    "rvec": ("<f8", (3,)),
+    "tvec": ("<f8", (3,)),
+}
+
+
+def _get_column_path(path: Path, column: str) -> Path:
+    return path / f"{column}.bin"
+
+
+def _get_row_sizes() -> dict[str, int]:
+    return {
+        name: np.dtype(dtype).itemsize * int(np.prod(shape))
+        for name, (dtype, shape) in COLUMNS.items()
+    }
+
+
+def _get_row_count(path: Path) -> int:
+    """
+    Count the rows present in every column. Columns can have extra rows (or
+    parts of rows) if a write was interrupted.
+    """
+    return min(
+        _get_column_path(path, name).stat().st_size // row_size
+        if _get_column_path(path, name).exists()
+        else 0
+        for name, row_size in _get_row_sizes().items()
+    )
+
+
+def _get_metadata() -> dict[str, Any]:
+    return {
+        "version": LOG_VERSION,
+        "columns": {
+            name: {"dtype": dtype, "shape": list(shape)}
+            for name, (dtype, shape) in COLUMNS.items()
+        },
+    }
+
+
+def _check_metadata(path: Path) -> None:
+    metadata = json.loads((path / METADATA_FILENAME).read_text())
+    if metadata != _get_metadata():
+        raise ValueError(f"{path} is not a compatible detection log")
+
+
+class DetectionLogWriter:
+    """
+    Append detections to a columnar log.
+
+    Rows are buffered, and written to the end of each column's file in chunks
+    of `chunk_size` rows. Markers without a pose are stored with `nan` vectors.
+    """
+
+    def __init__(self, path: Path, *, chunk_size: int = 4096) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self._buffer: dict[str, list[NDArray]] = {name: [] for name in COLUMNS}
+        self._buffered_rows = 0
+
+        if (path / METADATA_FILENAME).exists():
+            _check_metadata(path)
+            # Drop any rows left over from an interrupted write, so appended
+            # rows line up in every column
+            row_count = _get_row_count(path)
+            for name, row_size in _get_row_sizes().items():
+                column_path = _get_column_path(path, name)
+                if column_path.exists():
+                    with column_path.open("r+b") as column_file:
+                        column_file.truncate(row_count * row_size)
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            (path / METADATA_FILENAME).write_text(json.dumps(_get_metadata()))
+
+        self._files: dict[str, IO[bytes]] = {
+            name: _get_column_path(path, name).open("ab") for name in COLUMNS
+        }
+
+    def write_batch(
+        self, frame_index: int, batch: MarkerBatch, *, timestamp: float | None = None
+    ) -> None:
+        """
+        Write all the markers detected in a frame.
+        """
+        try:
+            rvecs, tvecs = batch.rvecs, batch.tvecs
+        except MissingCalibrationsError:
+            rvecs = tvecs = np.full((len(batch), 3), np.nan)
+        self._write_rows(
+            frame_index, timestamp, batch.ids, batch.sizes, batch.corners, rvecs, tvecs
+        )
+
+    def write_markers(
+        self,
+        frame_index: int,
+        markers: Iterable[BaseMarker],
+        *,
+        timestamp: float | None = None,
+    ) -> None:
+        """
+        Write the markers detected in a frame (eg from `process_frame_eager`).
+        """
+        markers = list(markers)
+        rvecs = np.full((len(markers), 3), np.nan)
+        tvecs = np.full((len(markers), 3), np.nan)
+        for index, marker in enumerate(markers):
+            try:
+                rvecs[index], tvecs[index] = marker._get_pose_vectors()
+            except MissingCalibrationsError:
+                pass
+        self._write_rows(
+            frame_index,
+            timestamp,
+            np.array([marker.id for marker in markers]),
+            np.array([marker.size for marker in markers]),
+            np.array([marker._pixel_corners for marker in markers]).reshape(-1, 4, 2),
+            rvecs,
+            tvecs,
+        )
+
+    def _write_rows(
+        self,
+        frame_index: int,
+        timestamp: float | None,
+        ids: NDArray,
+        sizes: NDArray,
+        corners: NDArray,
+        rvecs: NDArray,
+        tvecs: NDArray,
+    ) -> None:
+        row_count = len(ids)
+        if not row_count:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+
+        columns = {
+            "frame_index": np.full(row_count, frame_index),
+            "timestamp": np.full(row_count, timestamp),
+            "id": ids,
+            "size": sizes,
+            "corners": corners,
+            "rvec": rvecs,
+            "tvec": tvecs,
+        }
+        for name, (dtype, shape) in COLUMNS.items():
+            self._buffer[name].append(
+                np.asarray(columns[name], dtype=dtype).reshape((row_count,) + shape)
+            )
+        self._buffered_rows += row_count
+
+        if self._buffered_rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered rows to disk.
+        """
+        if not self._buffered_rows:
+            return
+        for name, column_file in self._files.items():
+            column_file.write(np.concatenate(self._buffer[name]).tobytes())
+            column_file.flush()
+            self._buffer[name].clear()
+        self._buffered_rows = 0
+
+    def close(self) -> None:
+        self.flush()
+        for column_file in self._files.values():
+            column_file.close()
+
+    def __enter__(self) -> DetectionLogWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class DetectionLog:
+    """
+    Read a detection log, as memory-mapped arrays with a row per marker.
+
+    If a write was interrupted, only the rows present in every column are read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        _check_metadata(path)
+
+        self._row_count = _get_row_count(path)
+        self._columns = {
+            name: self._map_column(name, dtype, shape)
+            for name, (dtype, shape) in COLUMNS.items()
+        }
+
+    def _map_column(self, name: str, dtype: str, shape: tuple[int, ...]) -> NDArray:
+        if not self._row_count:
+            # Empty files can't be memory-mapped
+            return np.empty((0,) + shape, dtype=dtype)
+        return np.memmap(
+            _get_column_path(self.path, name),
+            dtype=dtype,
+            mode="r",
+            shape=(self._row_count,) + shape,
+        )
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.path} rows={len(self)}>"
+
+    @property
+    def frame_indexes(self) -> NDArray:
+        return self._columns["frame_index"]
+
+    @property
+    def timestamps(self) -> NDArray:
+        return self._columns["timestamp"]
+
+    @property
+    def ids(self) -> NDArray:
+        return self._columns["id"]
+
+    @property
+    def sizes(self) -> NDArray:
+        return self._columns["size"]
+
+    @property
+    def corners(self) -> NDArray:
+        """
+        Pixel corners of each marker (N x 4 x 2)
+        """
+        return self._columns["corners"]
+
+    @property
+    def rvecs(self) -> NDArray:
+        """
+        Rotation vectors (N x 3), `nan` if the marker had no pose
+        """
+        return self._columns["rvec"]
+
+    @property
+    def tvecs(self) -> NDArray:
+        """
+        Translation vectors (N x 3), `nan` if the marker had no pose
+        """
+        return self._columns["tvec"]
+
+    def get_frame_rows(self, frame_index: int) -> slice:
+        """
+        Find the rows for a frame.
+
+        Note: This assumes frames were logged in order.
+        """
+        return slice(
+            int(np.searchsorted(self.frame_indexes, frame_index, side="left")),
+            int(np.searchsorted(self.frame_indexes, frame_index, side="right")),
+        )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+import cv2
+
+# Changes from OpenCV's defaults shared by all profiles. We detect slightly closer
+# markers to improve detection on markers with hard borders (like the ones
+# generated from `zoloto marker-pdfs`)
+_BASE_PARAMETERS: dict[str, Any] = {"minMarkerDistanceRate": 0.035}
+
+_PROFILE_PARAMETERS: dict[str, dict[str, Any]] = {
+    "fast": {
+        # Threshold at 2 window sizes rather than 3
+        "adaptiveThreshWinSizeMin": 3,
+        "adaptiveThreshWinSizeMax": 13,
+        "adaptiveThreshWinSizeStep": 10,
+        # Reject small and irregular candidates early
+        "minMarkerPerimeterRate": 0.05,
+        "polygonalApproxAccuracyRate": 0.05,
+    },
+    "balanced": {},
+    "accurate": {
+        # Threshold at 7 window sizes, to find markers in uneven lighting
+        "adaptiveThreshWinSizeMin": 3,
+        "adaptiveThreshWinSizeMax": 33,
+        "adaptiveThreshWinSizeStep": 5,
+        "minMarkerPerimeterRate": 0.01,
+        "perspectiveRemovePixelPerCell": 8,
+        "cornerRefinementMethod": cv2.aruco.CORNER_REFINE_SUBPIX,
+    },
+}
+
+
+def get_detector_params_dict(
+    detector_params: cv2.aruco_DetectorParameters,
+) -> dict[str, Any]:
+    """
+    Convert detector parameters into a picklable `dict`, so they can be sent to
+    other processes.
+    """
+    return {
+        name: getattr(detector_params, name)
+        for name in dir(detector_params)
+        if not name.startswith("_") and not callable(getattr(detector_params, name))
+    }
+
+
+def create_detector_params(
+    detector_params: dict[str, Any]
+) -> cv2.aruco_DetectorParameters:
+    parameters = cv2.aruco.DetectorParameters_create()
+    for name, value in detector_params.items():
+        setattr(parameters, name, value)
+    return parameters
+
+
+class DetectorProfile(Enum):
+    """
+    Named trade-offs between detection speed and detection rate.
+
+    Use `zoloto tune-detector` to compare them on your own frames.
+    """
+
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        """
+        The detector parameters changed from OpenCV's defaults
+        """
+        return {**_BASE_PARAMETERS, **_PROFILE_PARAMETERS[self.value]}
+
+    def get_detector_params(self) -> cv2.aruco_DetectorParameters:
+        return create_detector_params(self.parameters)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator
 
+import numpy as np
 from cached_property import cached_property
 from cv2 import aruco
-from numpy import arctan2, linalg
+from numpy import linalg
 from numpy.typing import NDArray
 
 from zoloto.utils import cached_method
@@ -16,19 +17,31 @@ from .coords import (
     Orientation,
     PixelCoordinates,
     SphericalCoordinates,
+    tvecs_to_spherical,
 )
 from .exceptions import MissingCalibrationsError
 from .marker_type import MarkerType
+from .pose import PoseBatch, PoseCache
+
+if TYPE_CHECKING:
+    from .stats import CameraStats, CaptureTimestamp
 
 
 class BaseMarker(ABC):
     def __init__(
-        self, marker_id: int, corners: list[NDArray], size: int, marker_type: MarkerType
+        self,
+        marker_id: int,
+        corners: list[NDArray],
+        size: int,
+        marker_type: MarkerType,
+        *,
+        timestamp: CaptureTimestamp | None = None,
     ):
         self.__id = marker_id
         self._pixel_corners = corners
         self.__size = size
         self.__marker_type = marker_type
+        self.__timestamp = timestamp
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id} size={self.size} type={self.marker_type.name}>"
@@ -49,6 +62,13 @@ class BaseMarker(ABC):
     def marker_type(self) -> MarkerType:
         return self.__marker_type
 
+    @property
+    def timestamp(self) -> CaptureTimestamp | None:
+        """
+        When the frame the marker was detected in was captured, if it's known.
+        """
+        return self.__timestamp
+
     @property
     def pixel_corners(self) -> list[PixelCoordinates]:
         return [
@@ -69,19 +89,19 @@ class BaseMarker(ABC):
 
     @cached_property
     def orientation(self) -> Orientation:
-        return Orientation(*self._rvec)
+        return self._get_orientation()
 
     @cached_property
     def spherical(self) -> SphericalCoordinates:
-        x, y, z = self._tvec
-        return SphericalCoordinates(
-            rot_x=float(arctan2(y, z)), rot_y=float(arctan2(x, z)), dist=self.distance
-        )
+        return SphericalCoordinates.from_tvec(self._tvec)
 
     @property
     def cartesian(self) -> CartesianCoordinates:
         return CartesianCoordinates(*self._tvec.tolist())
 
+    def _get_orientation(self) -> Orientation:
+        return Orientation(*self._rvec)
+
     @property
     def _rvec(self) -> NDArray:
         return self._get_pose_vectors()[0]
@@ -113,8 +133,10 @@ class EagerMarker(BaseMarker):
         size: int,
         marker_type: MarkerType,
         precalculated_vectors: tuple[NDArray, NDArray],
+        *,
+        timestamp: CaptureTimestamp | None = None,
     ):
-        super().__init__(marker_id, corners, size, marker_type)
+        super().__init__(marker_id, corners, size, marker_type, timestamp=timestamp)
         self.__precalculated_vectors = precalculated_vectors
 
     def __repr__(self) -> str:
@@ -131,13 +153,25 @@ class Marker(BaseMarker):
         corners: list[NDArray],
         size: int,
         marker_type: MarkerType,
-        calibration_params: CalibrationParameters,
+        calibration_params: CalibrationParameters | None,
+        *,
+        pose_batch: PoseBatch | None = None,
+        batch_index: int = 0,
+        timestamp: CaptureTimestamp | None = None,
     ):
-        super().__init__(marker_id, corners, size, marker_type)
+        super().__init__(marker_id, corners, size, marker_type, timestamp=timestamp)
         self.__calibration_params = calibration_params
+        self.__pose_batch = pose_batch
+        self.__batch_index = batch_index
 
     @cached_method
     def _get_pose_vectors(self) -> tuple[NDArray, NDArray]:
+        if self.__pose_batch is not None:
+            rvecs, tvecs = self.__pose_batch.get_pose_vectors()
+            return rvecs[self.__batch_index], tvecs[self.__batch_index]
+
+        if self.__calibration_params is None:
+            raise MissingCalibrationsError()
         rvec, tvec, _ = aruco.estimatePoseSingleMarkers(
             [self._pixel_corners],
             self.size,
@@ -146,7 +180,151 @@ class Marker(BaseMarker):
         )
         return rvec[0][0], tvec[0][0]
 
+    def _get_orientation(self) -> Orientation:
+        if self.__pose_batch is not None:
+            return self.__pose_batch.get_orientation(self.__batch_index)
+        return super()._get_orientation()
+
 
 class UncalibratedMarker(BaseMarker):
     def _get_pose_vectors(self) -> tuple[NDArray, NDArray]:
         raise MissingCalibrationsError()
+
+
+class MarkerBatch:
+    """
+    All the markers detected in a frame, stored as contiguous arrays.
+
+    Poses are estimated for the whole batch at once, the first time they're
+    needed, unless a `pose_batch` with the poses is given. Individual markers
+    are only created when indexing or iterating.
+    """
+
+    def __init__(
+        self,
+        ids: NDArray,
+        corners: NDArray,
+        sizes: NDArray,
+        marker_type: MarkerType,
+        calibration_params: CalibrationParameters | None,
+        *,
+        stats: CameraStats | None = None,
+        timestamp: CaptureTimestamp | None = None,
+        pose_cache: PoseCache | None = None,
+        pose_batch: PoseBatch | None = None,
+    ):
+        self.ids = ids
+        self.corners = corners
+        self.sizes = sizes
+        self.marker_type = marker_type
+        self.timestamp = timestamp
+        self.__calibration_params = calibration_params
+        self.__pose_batch = pose_batch
+        if pose_batch is None and calibration_params is not None:
+            self.__pose_batch = PoseBatch(
+                corners,
+                sizes.tolist(),
+                calibration_params,
+                stats=stats,
+                ids=ids.tolist(),
+                pose_cache=pose_cache,
+            )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ids={self.ids.tolist()} type={self.marker_type.name}>"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> UncalibratedMarker | Marker:
+        marker_id = int(self.ids[index])
+        corners = self.corners[index]
+        size = int(self.sizes[index])
+        if self.__pose_batch is None:
+            return UncalibratedMarker(
+                marker_id, corners, size, self.marker_type, timestamp=self.timestamp
+            )
+        return Marker(
+            marker_id,
+            corners,
+            size,
+            self.marker_type,
+            self.__calibration_params,
+            pose_batch=self.__pose_batch,
+            batch_index=index % len(self),
+            timestamp=self.timestamp,
+        )
+
+    def __iter__(self) -> Iterator[UncalibratedMarker | Marker]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _get_pose_vectors(self) -> tuple[NDArray, NDArray]:
+        if self.__pose_batch is None:
+            raise MissingCalibrationsError()
+        return self.__pose_batch.get_pose_vectors()
+
+    def _get_orientation_arrays(self) -> tuple[NDArray, NDArray, NDArray]:
+        if self.__pose_batch is None:
+            raise MissingCalibrationsError()
+        return self.__pose_batch.get_orientation_arrays()
+
+    @property
+    def rvecs(self) -> NDArray:
+        """
+        Rotation vectors (N x 3)
+        """
+        return self._get_pose_vectors()[0]
+
+    @property
+    def tvecs(self) -> NDArray:
+        """
+        Translation vectors (N x 3)
+        """
+        return self._get_pose_vectors()[1]
+
+    @cached_property
+    def pixel_centres(self) -> NDArray:
+        """
+        The centre of each marker, in pixels (N x 2)
+        """
+        centres = np.empty((len(self), 2))
+        half_sizes = self.sizes / 2
+        centres[:, 0] = self.corners[:, 0, 0] + half_sizes - 1
+        centres[:, 1] = self.corners[:, 2, 1] - half_sizes
+        return centres
+
+    @cached_property
+    def distances(self) -> NDArray:
+        """
+        Distance to each marker (N)
+        """
+        return linalg.norm(self.tvecs, axis=1).astype(int)
+
+    @cached_property
+    def spherical(self) -> NDArray:
+        """
+        The spherical rotations `rot_x` and `rot_y` of each marker, in radians (N x 2)
+        """
+        return tvecs_to_spherical(self.tvecs)[:, :2]
+
+    @property
+    def rotation_matrices(self) -> NDArray:
+        """
+        The rotation matrix of each marker (N x 3 x 3)
+        """
+        return self._get_orientation_arrays()[0]
+
+    @property
+    def quaternions(self) -> NDArray:
+        """
+        The orientation of each marker as a quaternion, in `w, x, y, z` order (N x 4)
+        """
+        return self._get_orientation_arrays()[1]
+
+    @property
+    def yaw_pitch_roll(self) -> NDArray:
+        """
+        The yaw, pitch and roll of each marker, in radians (N x 3)
+        """
+        return self._get_orientation_arrays()[2]
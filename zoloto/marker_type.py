@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from enum import IntEnum
+from functools import lru_cache
+from typing import NamedTuple
 
 from cv2 import aruco, aruco_Dictionary
+from numpy.typing import NDArray
 
 
 class MarkerType(IntEnum):
@@ -20,15 +23,25 @@ class MarkerType(IntEnum):
     def dictionary(self) -> aruco_Dictionary:
         """
         The underlying OpenCV marker dictionary
+
+        Note: This is shared by everything using this marker type in the process,
+        so shouldn't be modified.
+        """
+        return get_marker_type_info(self).dictionary
+
+    @property
+    def bytes_list(self) -> NDArray:
+        """
+        The encoded bits of every marker
         """
-        return aruco.getPredefinedDictionary(self.value)
+        return get_marker_type_info(self).bytes_list
 
     @property
     def marker_count(self) -> int:
         """
         The total number of markers available
         """
-        return len(self.dictionary.bytesList)
+        return get_marker_type_info(self).marker_count
 
     @property
     def max_id(self) -> int:
@@ -49,14 +62,40 @@ class MarkerType(IntEnum):
         """
         Number of bits along 1 size of a marker
         """
-        return self.dictionary.markerSize
+        return get_marker_type_info(self).marker_size
 
     @property
     def marker_ids(self) -> list[int]:
         """
         All of the possible marker ids
         """
-        return list(range(self.max_id + 1))
+        return list(range(self.marker_count))
+
+
+class MarkerTypeInfo(NamedTuple):
+    dictionary: aruco_Dictionary
+    bytes_list: NDArray
+    marker_count: int
+    marker_size: int
+
+
+@lru_cache(maxsize=None)
+def get_marker_type_info(marker_type: MarkerType) -> MarkerTypeInfo:
+    """
+    Get the dictionary and metadata for a marker type.
+
+    These are only loaded from OpenCV once per process.
+    """
+    dictionary = aruco.getPredefinedDictionary(marker_type.value)
+    # Accessing `bytesList` copies it, so only do it once
+    bytes_list = dictionary.bytesList
+    bytes_list.flags.writeable = False
+    return MarkerTypeInfo(
+        dictionary=dictionary,
+        bytes_list=bytes_list,
+        marker_count=len(bytes_list),
+        marker_size=dictionary.markerSize,
+    )
 
 
 MARKER_TYPE_NAMES = frozenset(m.name for m in MarkerType)
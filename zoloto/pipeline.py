@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Iterable, Iterator, Optional, Tuple, Union, cast
+
+import cv2
+from numpy.typing import NDArray
+
+from zoloto.cameras.base import BaseCamera
+from zoloto.cameras.mixins import IterableCameraMixin
+from zoloto.detection import RawIdsAndCorners
+from zoloto.detector_params import create_detector_params, get_detector_params_dict
+from zoloto.marker import Marker, UncalibratedMarker
+from zoloto.marker_type import MarkerType
+from zoloto.shared_frames import SharedFrame, SharedFramePool
+from zoloto.stats import CaptureTimestamp
+from zoloto.utils import init_worker_process
+
+# Detection state for the current worker process, set up by `_init_worker`
+_worker_dictionary: cv2.aruco_Dictionary | None = None
+_worker_detector_params: cv2.aruco_DetectorParameters | None = None
+
+
+# A frame (or a reference to one) which has been sent to a worker, and when
+# it was captured
+PendingFrame = Tuple[
+    Union[NDArray, SharedFrame],
+    Optional[CaptureTimestamp],
+    "Future[RawIdsAndCorners]",
+]
+
+
+def _init_worker(marker_type: MarkerType, detector_params: dict[str, Any]) -> None:
+    global _worker_dictionary, _worker_detector_params
+    init_worker_process()
+    _worker_dictionary = marker_type.dictionary
+    _worker_detector_params = create_detector_params(detector_params)
+
+
+def _detect_raw_ids_and_corners(
+    frame: NDArray | SharedFrame,
+) -> RawIdsAndCorners:
+    if isinstance(frame, SharedFrame):
+        frame = frame.get_array()
+    corners, ids, _ = cv2.aruco.detectMarkers(
+        frame,
+        cast(cv2.aruco_Dictionary, _worker_dictionary),
+        parameters=cast(cv2.aruco_DetectorParameters, _worker_detector_params),
+    )
+    return ids, corners
+
+
+def uses_default_detection(camera: BaseCamera) -> bool:
+    """
+    Whether a camera detects markers in the same way as workers do.
+    """
+    camera_class = type(camera)
+    return (
+        camera_class.detect is BaseCamera.detect
+        and camera_class._get_raw_ids_and_corners is BaseCamera._get_raw_ids_and_corners
+    )
+
+
+def iter_camera_frames(camera: BaseCamera) -> Iterator[NDArray]:
+    """
+    Iterate over frames from a camera.
+
+    Cameras which aren't iterable are captured from forever.
+    """
+    if isinstance(camera, IterableCameraMixin):
+        return iter(camera)
+    return (camera._capture_frame() for _ in iter(int, 1))
+
+
+class DetectionPipeline:
+    """
+    Detect markers in a stream of frames using a pool of worker processes.
+
+    Each worker holds its own marker dictionary and detector parameters, copied
+    from the camera. Results are yielded in the same order as the frames, with
+    at most `max_pending` frames being processed at once.
+
+    With `shared_memory`, frames are copied into a `SharedFramePool` rather
+    than being pickled, which avoids copying large frames between processes.
+
+    Workers only run OpenCV's marker detection, so cameras which change how
+    markers are detected (eg `ReplayCamera`, or the tracking and motion gating
+    mixins) aren't supported.
+    """
+
+    def __init__(
+        self,
+        camera: BaseCamera,
+        *,
+        workers: int | None = None,
+        max_pending: int | None = None,
+        shared_memory: bool = False,
+    ) -> None:
+        if not uses_default_detection(camera):
+            raise ValueError(
+                f"{type(camera).__name__} changes how markers are detected, so can't be used in a pipeline"
+            )
+        self.camera = camera
+        self.shared_memory = shared_memory
+        self._frame_pool: SharedFramePool | None = None
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._executor = ProcessPoolExecutor(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(
+                camera.marker_type,
+                get_detector_params_dict(camera.detector_params),
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.camera!r} workers={self.workers}>"
+
+    def _submit(self, frame: NDArray) -> PendingFrame:
+        timestamp = self.camera._get_frame_timestamp(frame)
+        if self.shared_memory and self._frame_pool is None:
+            # Slots are sized for the first frame, and there's never more than
+            # `max_pending` frames in flight
+            self._frame_pool = SharedFramePool(self.max_pending, frame.nbytes)
+
+        if self._frame_pool is not None and self._frame_pool.can_store(frame):
+            shared_frame = self._frame_pool.put(frame)
+            return (
+                shared_frame,
+                timestamp,
+                self._executor.submit(_detect_raw_ids_and_corners, shared_frame),
+            )
+
+        return (
+            frame,
+            timestamp,
+            self._executor.submit(_detect_raw_ids_and_corners, frame),
+        )
+
+    def _get_markers(self, pending: PendingFrame) -> list[UncalibratedMarker | Marker]:
+        frame, timestamp, future = pending
+        try:
+            raw_ids, raw_corners = future.result()
+        finally:
+            if isinstance(frame, SharedFrame) and self._frame_pool is not None:
+                self._frame_pool.release(frame)
+        ids, corners = self.camera._parse_raw_ids_and_corners(raw_ids, raw_corners)
+        markers = list(self.camera._get_markers(ids, corners, timestamp=timestamp))
+        self.camera._record_latency(timestamp)
+        return markers
+
+    def process_frames(
+        self, frames: Iterable[NDArray] | None = None
+    ) -> Iterator[list[UncalibratedMarker | Marker]]:
+        """
+        Detect the markers in each frame, defaulting to frames from the camera.
+        """
+        if frames is None:
+            frames = iter_camera_frames(self.camera)
+
+        pending: Deque[PendingFrame] = deque()
+        try:
+            for frame in frames:
+                if len(pending) >= self.max_pending:
+                    yield self._get_markers(pending.popleft())
+                pending.append(self._submit(frame))
+
+            while pending:
+                yield self._get_markers(pending.popleft())
+        finally:
+            # Wait for abandoned frames, so their slots can safely be reused
+            for pending_frame, _, future in pending:
+                future.cancel()
+                if not future.cancelled():
+                    future.exception()
+                if (
+                    isinstance(pending_frame, SharedFrame)
+                    and self._frame_pool is not None
+                ):
+                    self._frame_pool.release(pending_frame)
+
+    def __iter__(self) -> Iterator[list[UncalibratedMarker | Marker]]:
+        return self.process_frames()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        if self._frame_pool is not None:
+            self._frame_pool.close()
+            self._frame_pool = None
+
+    def __enter__(self) -> DetectionPipeline:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
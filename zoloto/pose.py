@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, NamedTuple, Sequence, Union
+
+import numpy as np
+from cv2 import SOLVEPNP_ITERATIVE, aruco, solvePnP
+from numpy.typing import NDArray
+
+from zoloto.utils import cached_method
+
+from .calibration import CalibrationParameters
+from .coords import (
+    Orientation,
+    quaternions_to_yaw_pitch_roll,
+    rotation_matrices_to_quaternions,
+    rvecs_to_rotation_matrices,
+)
+from .exceptions import MissingCalibrationsError
+
+if TYPE_CHECKING:
+    from .stats import CameraStats
+
+# Either a list of 4 x 2 arrays, or an N x 4 x 2 array
+Corners = Union[Sequence[NDArray], NDArray]
+
+
+def estimate_poses(
+    corners: Corners,
+    sizes: Sequence[int],
+    calibration_params: CalibrationParameters,
+) -> tuple[NDArray, NDArray]:
+    """
+    Estimate the pose of many markers, with a single OpenCV call per marker size.
+
+    Returns N x 3 arrays of rotation and translation vectors, in the same order
+    as the corners.
+    """
+    rvecs = np.empty((len(corners), 3))
+    tvecs = np.empty((len(corners), 3))
+    marker_sizes = np.asarray(sizes)
+    for size in np.unique(marker_sizes):
+        indices = np.flatnonzero(marker_sizes == size)
+        size_rvecs, size_tvecs, _ = aruco.estimatePoseSingleMarkers(
+            [corners[i] for i in indices],
+            int(size),
+            calibration_params.camera_matrix,
+            calibration_params.distance_coefficients,
+        )
+        rvecs[indices] = size_rvecs[:, 0]
+        tvecs[indices] = size_tvecs[:, 0]
+    return rvecs, tvecs
+
+
+def get_marker_object_points(size: int) -> NDArray:
+    """
+    Get the corners of a marker in its own coordinate system, in the same
+    order and orientation as `estimatePoseSingleMarkers` uses.
+    """
+    half_size = size / 2
+    return np.array(
+        [
+            [-half_size, half_size, 0],
+            [half_size, half_size, 0],
+            [half_size, -half_size, 0],
+            [-half_size, -half_size, 0],
+        ],
+        dtype=np.float32,
+    )
+
+
+class CachedPose(NamedTuple):
+    corners: NDArray
+    size: int
+    rvec: NDArray
+    tvec: NDArray
+
+
+class PoseCache:
+    """
+    The poses of the markers in the previous frame, by marker id.
+
+    When all of a marker's corners are within `epsilon` pixels of where they
+    were, its previous pose is reused. Otherwise, the previous pose is used
+    as the starting point for refining its new pose, which is much quicker
+    than estimating it from scratch. Markers which weren't in the previous
+    frame are estimated as usual.
+    """
+
+    def __init__(self, *, epsilon: float = 0.5) -> None:
+        if epsilon < 0:
+            raise ValueError("Epsilon must not be negative")
+        self.epsilon = epsilon
+        self.poses: dict[int, CachedPose] = {}
+
+        # Number of poses which have been found each way
+        self.reused = 0
+        self.refined = 0
+        self.estimated = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} reused={self.reused} refined={self.refined} estimated={self.estimated}>"
+
+    def __len__(self) -> int:
+        return len(self.poses)
+
+    def clear(self) -> None:
+        self.poses = {}
+
+    def _refine_pose(
+        self,
+        corners: NDArray,
+        previous_pose: CachedPose,
+        calibration_params: CalibrationParameters,
+    ) -> tuple[NDArray, NDArray]:
+        _, rvec, tvec = solvePnP(
+            get_marker_object_points(previous_pose.size),
+            corners,
+            calibration_params.camera_matrix,
+            calibration_params.distance_coefficients,
+            previous_pose.rvec.reshape(3, 1).copy(),
+            previous_pose.tvec.reshape(3, 1).copy(),
+            useExtrinsicGuess=True,
+            flags=SOLVEPNP_ITERATIVE,
+        )
+        return rvec.ravel(), tvec.ravel()
+
+    def estimate_poses(
+        self,
+        ids: Sequence[int],
+        corners: Corners,
+        sizes: Sequence[int],
+        calibration_params: CalibrationParameters,
+    ) -> tuple[NDArray, NDArray]:
+        """
+        Estimate the poses of the markers in a frame, in the same way as
+        `estimate_poses`, and remember them for the next frame.
+        """
+        corners_array = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)
+        rvecs = np.empty((len(ids), 3))
+        tvecs = np.empty((len(ids), 3))
+        # Markers which appear more than once can't be told apart
+        id_counts = Counter(int(marker_id) for marker_id in ids)
+        poses = {}
+        new_indices = []
+        for index, (marker_id, marker_corners, size) in enumerate(
+            zip(ids, corners_array, sizes)
+        ):
+            marker_id = int(marker_id)
+            previous_pose = self.poses.get(marker_id)
+            if (
+                previous_pose is None
+                or previous_pose.size != size
+                or id_counts[marker_id] > 1
+            ):
+                new_indices.append(index)
+                continue
+
+            if np.abs(marker_corners - previous_pose.corners).max() <= self.epsilon:
+                # Keep the original corners, so slow drift is still noticed
+                pose = previous_pose
+                self.reused += 1
+            else:
+                rvec, tvec = self._refine_pose(
+                    marker_corners, previous_pose, calibration_params
+                )
+                pose = CachedPose(marker_corners, size, rvec, tvec)
+                self.refined += 1
+            rvecs[index], tvecs[index] = pose.rvec, pose.tvec
+            poses[marker_id] = pose
+
+        if new_indices:
+            new_sizes = [sizes[index] for index in new_indices]
+            rvecs[new_indices], tvecs[new_indices] = estimate_poses(
+                corners_array[new_indices], new_sizes, calibration_params
+            )
+            self.estimated += len(new_indices)
+            for index, size in zip(new_indices, new_sizes):
+                marker_id = int(ids[index])
+                if id_counts[marker_id] == 1:
+                    poses[marker_id] = CachedPose(
+                        corners_array[index], size, rvecs[index], tvecs[index]
+                    )
+
+        self.poses = poses
+        return rvecs, tvecs
+
+
+class PoseBatch:
+    """
+    The poses of all the markers in a frame.
+
+    Poses are estimated lazily, but the first time any marker's pose is
+    needed, the poses of all markers are estimated together. With a
+    `pose_cache`, the markers' `ids` must be given too. Without
+    `calibration_params`, poses can't be estimated.
+    """
+
+    def __init__(
+        self,
+        corners: Corners,
+        sizes: Sequence[int],
+        calibration_params: CalibrationParameters | None,
+        *,
+        stats: CameraStats | None = None,
+        ids: Sequence[int] | None = None,
+        pose_cache: PoseCache | None = None,
+    ):
+        if pose_cache is not None and ids is None:
+            raise ValueError("Marker ids are needed to use a pose cache")
+        self.corners = corners
+        self.sizes = sizes
+        self.calibration_params = calibration_params
+        self.stats = stats
+        self.ids = ids
+        self.pose_cache = pose_cache
+
+    def __len__(self) -> int:
+        return len(self.corners)
+
+    def _estimate_poses(self) -> tuple[NDArray, NDArray]:
+        if self.calibration_params is None:
+            raise MissingCalibrationsError()
+        if self.pose_cache is not None and self.ids is not None:
+            return self.pose_cache.estimate_poses(
+                self.ids, self.corners, self.sizes, self.calibration_params
+            )
+        return estimate_poses(self.corners, self.sizes, self.calibration_params)
+
+    @cached_method
+    def get_pose_vectors(self) -> tuple[NDArray, NDArray]:
+        if self.stats is None:
+            return self._estimate_poses()
+        with self.stats.time("pose", size=len(self.corners)):
+            return self._estimate_poses()
+
+    @cached_method
+    def get_orientation_arrays(self) -> tuple[NDArray, NDArray, NDArray]:
+        """
+        Get the rotation matrices, quaternions and yaw-pitch-roll angles of
+        every marker.
+        """
+        rvecs, _ = self.get_pose_vectors()
+        rotation_matrices = rvecs_to_rotation_matrices(rvecs)
+        quaternions = rotation_matrices_to_quaternions(rotation_matrices)
+        return (
+            rotation_matrices,
+            quaternions,
+            quaternions_to_yaw_pitch_roll(quaternions),
+        )
+
+    def get_orientation(self, index: int) -> Orientation:
+        rotation_matrices, quaternions, yaw_pitch_roll = self.get_orientation_arrays()
+        return Orientation.from_arrays(
+            rotation_matrices[index], quaternions[index], yaw_pitch_roll[index]
+        )
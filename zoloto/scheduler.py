@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+from time import monotonic, perf_counter
+from typing import Deque, Iterator
+
+from zoloto.cameras.base import BaseCamera
+from zoloto.marker import Marker, UncalibratedMarker
+from zoloto.pipeline import iter_camera_frames
+from zoloto.stats import CaptureTimestamp
+
+
+class FrameScheduler:
+    """
+    Process frames from a camera within a latency budget, shedding frames
+    rather than falling behind when processing can't keep up.
+
+    Frames which are already older than `latency_budget` (in seconds) when
+    they're read are dropped. Of the rest, only every `stride`th frame is
+    processed. The stride is matched to how long each frame takes to process
+    compared to the time between frames, up to `max_stride`. Frames are only
+    skipped when a newer one should already be waiting, so sources which drop
+    frames themselves (eg threaded cameras) aren't made to wait for a new one.
+
+    The time between frames comes from the frames' capture timestamps. As
+    the source may have dropped frames in between those which are read, it's
+    the shortest recent gap between them. The time taken to process a frame
+    includes whatever's done with its markers before the next frame is
+    requested.
+    """
+
+    def __init__(
+        self,
+        camera: BaseCamera,
+        *,
+        latency_budget: float,
+        max_stride: int = 8,
+        smoothing: float = 0.2,
+    ) -> None:
+        if latency_budget <= 0:
+            raise ValueError("Latency budget must be positive")
+        if max_stride < 1:
+            raise ValueError("Max stride must be at least 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("Smoothing must be between 0 and 1")
+        self.camera = camera
+        self.latency_budget = latency_budget
+        self.max_stride = max_stride
+        self.smoothing = smoothing
+
+        self.stride = 1
+        self.frames_received = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+
+        # In seconds
+        self.processing_time: float | None = None
+        self.frame_interval: float | None = None
+
+        self._frame_intervals: Deque[float] = deque(maxlen=30)
+        self._previous_timestamp: CaptureTimestamp | None = None
+        self._frames_to_skip = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.camera!r} stride={self.stride} dropped={self.frames_dropped}>"
+
+    def _get_average(self, average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return average + self.smoothing * (value - average)
+
+    def _get_frame_interval(
+        self, previous: CaptureTimestamp, current: CaptureTimestamp
+    ) -> float:
+        # The device knows best when frames were taken, if it says
+        if previous.device is not None and current.device is not None:
+            return current.device - previous.device
+        return current.monotonic - previous.monotonic
+
+    def _receive_frame(self, timestamp: CaptureTimestamp) -> None:
+        self.frames_received += 1
+        if self._previous_timestamp is not None:
+            interval = self._get_frame_interval(self._previous_timestamp, timestamp)
+            if interval > 0:
+                self._frame_intervals.append(interval)
+                self.frame_interval = min(self._frame_intervals)
+        self._previous_timestamp = timestamp
+
+    def _update_stride(self) -> None:
+        if self.processing_time is None or not self.frame_interval:
+            return
+        # Allow for being a fraction over a whole number of frames, which is
+        # just noise
+        frames_per_process = ceil(self.processing_time / self.frame_interval - 0.01)
+        self.stride = max(1, min(self.max_stride, frames_per_process))
+
+    def _should_process(self, timestamp: CaptureTimestamp) -> bool:
+        age = timestamp.get_age(monotonic())
+        # Skipping the newest frame would only mean waiting for the next one
+        if (
+            self._frames_to_skip
+            and self.frame_interval is not None
+            and age > self.frame_interval
+        ):
+            self._frames_to_skip -= 1
+            self.frames_skipped += 1
+            return False
+        if age > self.latency_budget:
+            self.frames_dropped += 1
+            return False
+        return True
+
+    def process_frames(self) -> Iterator[list[UncalibratedMarker | Marker]]:
+        """
+        Detect the markers in each frame which is processed.
+        """
+        for frame in iter_camera_frames(self.camera):
+            timestamp = self.camera._get_frame_timestamp(frame)
+            if timestamp is None:
+                timestamp = CaptureTimestamp(monotonic())
+            self._receive_frame(timestamp)
+            if not self._should_process(timestamp):
+                continue
+
+            start = perf_counter()
+            markers = list(self.camera.process_frame(frame=frame))
+            self.frames_processed += 1
+            yield markers
+
+            self.processing_time = self._get_average(
+                self.processing_time, perf_counter() - start
+            )
+            self._update_stride()
+            self._frames_to_skip = self.stride - 1
+
+    def __iter__(self) -> Iterator[list[UncalibratedMarker | Marker]]:
+        return self.process_frames()
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "stride": self.stride,
+            "frames_received": self.frames_received,
+            "frames_processed": self.frames_processed,
+            "frames_dropped": self.frames_dropped,
+            "frames_skipped": self.frames_skipped,
+            "processing_time": self.processing_time or 0.0,
+            "frame_interval": self.frame_interval or 0.0,
+        }
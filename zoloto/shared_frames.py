@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import deque
+from multiprocessing.shared_memory import SharedMemory
+from typing import Deque, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Shared memory blocks attached to by this process, keyed by name
+_attached_memory: dict[str, SharedMemory] = {}
+
+
+class SharedFrame(NamedTuple):
+    """
+    A reference to a frame stored in a `SharedFramePool` slot.
+
+    This is small and cheap to pickle, so it can be sent to other processes in
+    place of the frame itself.
+    """
+
+    memory_name: str
+    offset: int
+    shape: tuple[int, ...]
+    dtype: str
+    slot: int
+
+    def get_array(self) -> NDArray:
+        """
+        Get a view onto the frame, attaching to the shared memory if needed.
+
+        The view is only valid until the slot is released.
+        """
+        memory = _attached_memory.get(self.memory_name)
+        if memory is None:
+            memory = _attached_memory[self.memory_name] = SharedMemory(self.memory_name)
+        return np.ndarray(
+            self.shape, dtype=self.dtype, buffer=memory.buf, offset=self.offset
+        )
+
+
+class SharedFramePool:
+    """
+    A fixed number of preallocated frame slots, backed by a single block of
+    shared memory.
+    """
+
+    def __init__(self, slot_count: int, slot_size: int) -> None:
+        if slot_count < 1 or slot_size < 1:
+            raise ValueError("Shared frame pools must have at least 1 slot of memory")
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self._memory = SharedMemory(create=True, size=slot_count * slot_size)
+        self._free_slots: Deque[int] = deque(range(slot_count))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: slots={self.slot_count} slot_size={self.slot_size}>"
+
+    @property
+    def free_slots(self) -> int:
+        return len(self._free_slots)
+
+    def can_store(self, frame: NDArray) -> bool:
+        return frame.nbytes <= self.slot_size
+
+    def put(self, frame: NDArray) -> SharedFrame:
+        """
+        Copy a frame into a free slot.
+        """
+        if not self.can_store(frame):
+            raise ValueError(
+                f"Frame of {frame.nbytes} bytes doesn't fit in a slot of {self.slot_size} bytes"
+            )
+        if not self._free_slots:
+            raise ValueError("No free slots available")
+        slot = self._free_slots.popleft()
+        shared_frame = SharedFrame(
+            self._memory.name,
+            slot * self.slot_size,
+            frame.shape,
+            frame.dtype.str,
+            slot,
+        )
+        np.copyto(
+            np.ndarray(
+                frame.shape,
+                dtype=frame.dtype,
+                buffer=self._memory.buf,
+                offset=shared_frame.offset,
+            ),
+            frame,
+        )
+        return shared_frame
+
+    def release(self, shared_frame: SharedFrame) -> None:
+        """
+        Mark a slot as free, so it can be reused by another frame.
+        """
+        self._free_slots.append(shared_frame.slot)
+
+    def close(self) -> None:
+        self._memory.close()
+        self._memory.unlink()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from time import monotonic, perf_counter
+from typing import Any, Callable, Deque, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# The stages of processing a frame which are timed
+STAGES = ("capture", "detect", "pose", "markers")
+
+# Upper bounds (in seconds) of the buckets in a latency histogram
+LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+class CaptureTimestamp(NamedTuple):
+    """
+    When a frame was captured.
+
+    `monotonic` comes from `time.monotonic`, so can be compared against the
+    current time. `device` is the capture device's own timestamp for the frame
+    (in seconds), if it has one.
+    """
+
+    monotonic: float
+    device: Optional[float] = None
+
+    def get_age(self, now: float | None = None) -> float:
+        """
+        The number of seconds since the frame was captured.
+        """
+        if now is None:
+            now = monotonic()
+        return now - self.monotonic
+
+
+class StageRecord(NamedTuple):
+    """
+    A single timing of a stage.
+
+    `size` is what the stage processed: pixels for `capture`, markers found
+    for `detect`, and markers for `pose` and `markers`.
+    """
+
+    stage: str
+    duration: float
+    size: int
+
+
+class StageStats:
+    """
+    Timings for a stage. Percentiles are over the most recent `window` timings.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.total_duration = 0.0
+        self.total_size = 0
+        self.durations: Deque[float] = deque(maxlen=window)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} count={self.count} mean={self.mean_duration:.6f}>"
+
+    def add(self, duration: float, size: int) -> None:
+        self.count += 1
+        self.total_duration += duration
+        self.total_size += size
+        self.durations.append(duration)
+
+    @property
+    def mean_duration(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.total_duration / self.count
+
+    def percentile(self, percentile: float) -> float:
+        if not self.durations:
+            return 0.0
+        return float(np.percentile(self.durations, percentile))
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_size": self.total_size,
+            "total_duration": self.total_duration,
+            "mean_duration": self.mean_duration,
+            "p50_duration": self.percentile(50),
+            "p90_duration": self.percentile(90),
+            "p99_duration": self.percentile(99),
+        }
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in fixed buckets, plus a final bucket for any latencies
+    above the largest bound.
+    """
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError("Bucket bounds must be increasing")
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} count={self.count} mean={self.mean:.6f}>"
+
+    def record(self, latency: float) -> None:
+        self.counts[bisect_left(self.bounds, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Estimate a percentile, as the upper bound of the bucket it's in.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(percentile / 100 * self.count, 1)
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def get_buckets(self) -> list[tuple[float, int]]:
+        """
+        The upper bound and count of each bucket.
+        """
+        return list(zip(self.bounds + (float("inf"),), self.counts))
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_latency": self.mean,
+            "max_latency": self.max,
+            "p50_latency": self.percentile(50),
+            "p90_latency": self.percentile(90),
+            "p99_latency": self.percentile(99),
+        }
+
+
+class StageTimer:
+    """
+    Times a block, recording it when the block exits.
+    """
+
+    def __init__(self, stats: CameraStats, stage: str, size: int) -> None:
+        self.stats = stats
+        self.stage = stage
+        self.size = size
+        self._start = 0.0
+
+    def __enter__(self) -> StageTimer:
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stats.record(self.stage, perf_counter() - self._start, self.size)
+
+
+class CameraStats:
+    """
+    Timings of each stage of processing frames.
+
+    `callback` is called with a `StageRecord` for every timing, eg to export
+    them to another system. `latency` is a histogram of the time between a
+    frame being captured and its markers being ready.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 1000,
+        callback: Callable[[StageRecord], None] | None = None,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        self.window = window
+        self.callback = callback
+        self.stages = {stage: StageStats(window) for stage in STAGES}
+        self.latency = LatencyHistogram(latency_buckets)
+
+    def __repr__(self) -> str:
+        counts = {stage: stats.count for stage, stats in self.stages.items()}
+        return f"<{self.__class__.__name__} counts={counts}>"
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self.stages[stage]
+
+    def record(self, stage: str, duration: float, size: int = 0) -> None:
+        self.stages[stage].add(duration, size)
+        if self.callback is not None:
+            self.callback(StageRecord(stage, duration, size))
+
+    def time(self, stage: str, *, size: int = 0) -> StageTimer:
+        """
+        Time a block. The size can be updated within the block.
+        """
+        return StageTimer(self, stage, size)
+
+    def record_latency(self, timestamp: CaptureTimestamp) -> None:
+        """
+        Record the latency of a frame whose markers are now ready.
+        """
+        self.latency.record(timestamp.get_age())
+
+    def reset(self) -> None:
+        self.stages = {stage: StageStats(self.window) for stage in STAGES}
+        self.latency = LatencyHistogram(self.latency.bounds)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        stats_dict = {stage: stats.as_dict() for stage, stats in self.stages.items()}
+        stats_dict["latency"] = self.latency.as_dict()
+        return stats_dict
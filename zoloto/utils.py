@@ -3,6 +3,8 @@ from __future__ import annotations
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
+import cv2
+
 T = TypeVar("T", bound=Callable[[Any], Any])
 
 
@@ -22,6 +24,14 @@ def cached_method(f: T) -> T:
     return wrapper  # type: ignore[return-value]
 
 
+def init_worker_process() -> None:
+    """
+    Set up a worker process in a pool. Parallelism comes from the pool, so
+    OpenCV shouldn't start threads of its own and oversubscribe the CPU.
+    """
+    cv2.setNumThreads(1)
+
+
 def parse_ranges(ranges: str) -> set[int]:
     """
     Parse a comma seprated list of numbers which may include ranges
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+import cv2
+
+from zoloto.cameras.file import VideoFileCamera
+from zoloto.utils import init_worker_process
+
+# A frame index, and the `as_dict` of each marker detected in it
+FrameResult = Tuple[int, List[Dict[str, Any]]]
+
+# Segments are annotated to a fast intermediate format, then joined
+_SEGMENT_FOURCC = "MJPG"
+
+# The default number of frames processed in each segment. Each segment's
+# results are held in memory until they're yielded, but each segment also
+# costs a seek
+SEGMENT_LENGTH = 300
+
+
+def split_segments(
+    frame_count: int, segment_length: int, *, stride: int = 1
+) -> list[range]:
+    """
+    Split a video's frames into contiguous segments of up to `segment_length`
+    processed frames.
+
+    Segments start on multiples of `stride`, so processing them all reads the
+    same frames as a single pass would.
+    """
+    if segment_length < 1:
+        raise ValueError("Segment length must be at least 1")
+    frames = range(0, frame_count, stride)
+    return [
+        frames[start:][:segment_length]
+        for start in range(0, len(frames), segment_length)
+    ]
+
+
+def _process_segment(
+    video_path: Path,
+    segment: range,
+    annotated_path: Path | None,
+    camera_kwargs: dict[str, Any],
+) -> list[FrameResult]:
+    results = []
+    with VideoFileCamera(
+        video_path,
+        start=segment.start,
+        stop=segment.stop,
+        stride=segment.step,
+        **camera_kwargs,
+    ) as camera:
+        writer = None
+        if annotated_path is not None:
+            width, height = camera.get_resolution()
+            writer = cv2.VideoWriter(
+                str(annotated_path),
+                cv2.VideoWriter_fourcc(*_SEGMENT_FOURCC),
+                camera.video_capture.get(cv2.CAP_PROP_FPS) / segment.step,
+                [int(width), int(height)],
+            )
+
+        for frame_index, frame in zip(segment, camera):
+            detection = camera.detect(frame=frame)
+            results.append(
+                (
+                    frame_index,
+                    [
+                        marker.as_dict()
+                        for marker in camera.process_frame(detection=detection)
+                    ],
+                )
+            )
+            if writer is not None:
+                camera._annotate_frame(frame, detection=detection)
+                writer.write(frame)
+
+        if writer is not None:
+            writer.release()
+    return results
+
+
+def _join_videos(segment_paths: list[Path], output_writer: cv2.VideoWriter) -> None:
+    for segment_path in segment_paths:
+        segment_capture = cv2.VideoCapture(str(segment_path))
+        while True:
+            ret, frame = segment_capture.read()
+            if not ret:
+                break
+            output_writer.write(frame)
+        segment_capture.release()
+
+
+def process_video_segments(
+    video_path: Path,
+    *,
+    stride: int = 1,
+    workers: int | None = None,
+    segment_length: int = SEGMENT_LENGTH,
+    max_pending: int | None = None,
+    annotated_path: Path | None = None,
+    fourcc: str = "MP4V",
+    **camera_kwargs: Any,
+) -> Iterator[FrameResult]:
+    """
+    Detect markers in a video file, processing segments of it in parallel.
+
+    Results for each frame are yielded in order, as each segment of up to
+    `segment_length` frames finishes. At most `max_pending` segments (by
+    default, twice the number of workers) are queued or held at once, so
+    memory use doesn't grow with the length of the video. If `annotated_path`
+    is given, an annotated copy of the video is written there once all frames
+    have been processed.
+
+    Note: Segments are split by frame index. Workers seek to the start of
+    their segment, which OpenCV does by decoding from the previous keyframe.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = workers * 2
+    if max_pending < 1:
+        raise ValueError("max_pending must be at least 1")
+
+    with VideoFileCamera(video_path, **camera_kwargs) as camera:
+        frame_count = camera.frame_count
+        fps = camera.video_capture.get(cv2.CAP_PROP_FPS)
+        width, height = camera.get_resolution()
+    segments = split_segments(frame_count, segment_length, stride=stride)
+
+    with tempfile.TemporaryDirectory() as temp_dir, ProcessPoolExecutor(
+        workers, initializer=init_worker_process
+    ) as executor:
+        segment_paths = [
+            Path(temp_dir) / f"segment-{index}.avi" for index in range(len(segments))
+        ]
+        annotated_segment_paths: list[Path | None] = [
+            path if annotated_path is not None else None for path in segment_paths
+        ]
+        process_segment = partial(
+            _process_segment, video_path, camera_kwargs=camera_kwargs
+        )
+        pending: Deque[Future[list[FrameResult]]] = deque()
+        try:
+            for segment, segment_path in zip(segments, annotated_segment_paths):
+                pending.append(executor.submit(process_segment, segment, segment_path))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Don't process segments nobody will read
+            for future in pending:
+                future.cancel()
+
+        if annotated_path is not None:
+            output_writer = cv2.VideoWriter(
+                str(annotated_path),
+                cv2.VideoWriter_fourcc(*fourcc),
+                fps / stride,
+                [int(width), int(height)],
+            )
+            _join_videos(segment_paths, output_writer)
+            output_writer.release()